@@ -1,8 +1,10 @@
 from fastapi import APIRouter
+from app.core.config import settings
 from app.api.endpoints import walkability
 from app.api.endpoints import weather
 from app.api.endpoints import cache
 from app.api.endpoints import commons
+from app.api.endpoints import metrics
 
 
 api_router = APIRouter()
@@ -10,4 +12,7 @@ api_router = APIRouter()
 api_router.include_router(walkability.router, prefix="/walkability", tags=["walkability"])
 api_router.include_router(cache.router, prefix="/cache-check", tags=["cache check"])
 api_router.include_router(commons.router, prefix="/commons", tags=["commons"])
+# 업스트림 지표는 서비스 키 사용 현황을 포함하므로 설정으로 켰을 때만 노출
+if settings.UPSTREAM_METRICS_API_ENABLED:
+    api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 # api_router.include_router(weather.router, prefix="/weather", tags=["weather"])
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException
+
+from app.models.response import error_response, success_response
+from app.common.upstream_metrics import upstream_metrics
+from app.common.circuit_breaker import circuit_breakers
+from app.utils.service_key_scheduler import service_key_scheduler
+router = APIRouter()
+
+@router.get("/upstream")
+async def get_upstream_metrics() -> Dict[str, Any]:
+    """
+    업스트림(공공데이터포털) 호출 지표 확인용
+    엔드포인트별 응답 시간/크기, 결과 코드, 키 사용 횟수 (워커 단위)
+    """
+    try:
+        data = upstream_metrics.snapshot()
+        data["circuit_breakers"] = circuit_breakers.get_stats()
+        data["service_keys"] = await service_key_scheduler.get_current_stats()
+        return success_response(data=data)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise error_response(500, f"업스트림 지표 조회 오류: {str(e)}")
@@ -0,0 +1,19 @@
+class TokenBucketBudget:
+    """
+    요청 비율 기반 예산 (토큰 버킷)
+    요청마다 ratio만큼 토큰이 쌓이고(최대 burst), 추가 요청(재시도, 헤지 요청) 한 건에 토큰 1개를 사용함
+    장애나 지연 상황에서 추가 요청이 트래픽을 증폭시키지 않도록 전체 요청 대비 비율을 제한
+    """
+    def __init__(self, ratio: float, burst: float):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+
+    def on_request(self):
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
@@ -0,0 +1,156 @@
+import json
+import struct
+import zlib
+from typing import Any, Callable, Dict, Tuple
+from app.core.config import settings
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 json 사용
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 zlib 사용
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # lz4 미설치 시 zlib 사용
+    lz4_frame = None
+
+# 헤더: 매직(2) + 버전(1) + 직렬화 방식(1) + 압축 방식(1)
+MAGIC = b"WC"
+CODEC_VERSION = 1
+HEADER = struct.Struct("!2sBBB")
+
+FORMATS = {"raw": 0, "json": 1, "msgpack": 2}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+class CacheCodecError(ValueError):
+    """캐시 값 디코딩 실패 (알 수 없는 버전/방식) - 호출자는 캐시 없음으로 처리"""
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=str, use_bin_type=True)
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=settings.CACHE_CODEC_COMPRESSION_LEVEL).compress(data)
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+SERIALIZERS: Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    FORMATS["raw"]: (bytes, bytes),
+    FORMATS["json"]: (_json_dumps, _json_loads),
+}
+if msgpack is not None:
+    SERIALIZERS[FORMATS["msgpack"]] = (_msgpack_dumps, _msgpack_loads)
+
+COMPRESSORS: Dict[int, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    COMPRESSIONS["zlib"]: (lambda data: zlib.compress(data, settings.CACHE_CODEC_COMPRESSION_LEVEL), zlib.decompress),
+}
+if zstandard is not None:
+    COMPRESSORS[COMPRESSIONS["zstd"]] = (_zstd_compress, _zstd_decompress)
+if lz4_frame is not None:
+    COMPRESSORS[COMPRESSIONS["lz4"]] = (lz4_frame.compress, lz4_frame.decompress)
+
+class CacheCodec:
+    """
+    Redis 캐시 값 인코딩/디코딩
+    값 앞에 버전 헤더를 붙여 직렬화/압축 방식을 바꿔도 기존 값을 그대로 읽을 수 있게 함
+    헤더가 없는 값은 이전 방식(JSON 문자열)으로 저장된 값으로 보고 JSON으로 읽음
+    """
+    def __init__(self, format: str, compression: str, compress_min_bytes: int):
+        self.format_id = self._resolve(format, FORMATS, SERIALIZERS, "json", "직렬화") if format != "raw" else FORMATS["json"]
+        self.compression_id = (
+            COMPRESSIONS["none"] if compression == "none"
+            else self._resolve(compression, COMPRESSIONS, COMPRESSORS, "zlib", "압축")
+        )
+        self.compress_min_bytes = compress_min_bytes
+
+    @staticmethod
+    def _resolve(name: str, names: Dict[str, int], available: Dict[int, Any], fallback: str, label: str) -> int:
+        codec_id = names.get(name)
+        if codec_id is None or codec_id not in available:
+            logger.warning(f"캐시 {label} 방식 사용 불가({name}), {fallback} 사용")
+            return names[fallback]
+        return codec_id
+
+    def _pack(self, format_id: int, payload: bytes) -> bytes:
+        compression_id = COMPRESSIONS["none"]
+        # 작은 값은 압축 효과보다 비용이 커서 그대로 저장
+        if self.compression_id != COMPRESSIONS["none"] and len(payload) >= self.compress_min_bytes:
+            compress, _ = COMPRESSORS[self.compression_id]
+            payload = compress(payload)
+            compression_id = self.compression_id
+
+        return HEADER.pack(MAGIC, CODEC_VERSION, format_id, compression_id) + payload
+
+    @staticmethod
+    def _unpack(data: bytes) -> Tuple[int, bytes]:
+        _, version, format_id, compression_id = HEADER.unpack_from(data)
+        if version != CODEC_VERSION or format_id not in SERIALIZERS:
+            raise CacheCodecError(f"지원하지 않는 캐시 형식: version={version}, format={format_id}")
+
+        payload = data[HEADER.size:]
+        if compression_id != COMPRESSIONS["none"]:
+            if compression_id not in COMPRESSORS:
+                raise CacheCodecError(f"지원하지 않는 캐시 압축 방식: {compression_id}")
+            _, decompress = COMPRESSORS[compression_id]
+            payload = decompress(payload)
+        return format_id, payload
+
+    def encode(self, value: Any) -> bytes:
+        """값 직렬화 (+ 압축)"""
+        dumps, _ = SERIALIZERS[self.format_id]
+        return self._pack(self.format_id, dumps(value))
+
+    def decode(self, data: bytes) -> Any:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data.startswith(MAGIC):
+            return _json_loads(data)
+
+        format_id, payload = self._unpack(data)
+        _, loads = SERIALIZERS[format_id]
+        return loads(payload)
+
+    def encode_bytes(self, data: bytes) -> bytes:
+        """업스트림 응답 본문 등 이미 직렬화된 바이트 저장 (압축만 적용)"""
+        return self._pack(FORMATS["raw"], data)
+
+    def decode_bytes(self, data: bytes) -> bytes:
+        # 헤더가 없으면 이전 방식(본문 그대로)으로 저장된 값
+        if not data.startswith(MAGIC):
+            return data
+        format_id, payload = self._unpack(data)
+        if format_id != FORMATS["raw"]:
+            raise CacheCodecError(f"바이트 값이 아닌 캐시 형식: format={format_id}")
+        return payload
+
+# 전역 캐시 코덱
+cache_codec = CacheCodec(
+    settings.CACHE_CODEC_FORMAT,
+    settings.CACHE_CODEC_COMPRESSION,
+    settings.CACHE_CODEC_COMPRESS_MIN_BYTES,
+)
@@ -1,8 +1,11 @@
 import asyncio
 from datetime import datetime
 from app.models.air_quality import HourlyAirQualityCache, WeeklyAirQualityCache
-from app.services.air_quality import fetch_hourly_air_quality_raw, process_weekly_air_quality_for_cache
+from app.services.air_quality import build_hourly_air_quality_table, fetch_hourly_air_quality_raw, get_hourly_air_quality_issuance, process_weekly_air_quality_for_cache
 from app.services.cache_service import AirQualityCacheService, air_quality_cache_service
+from app.services.air_quality_station_catalog import air_quality_station_catalog
+from app.services.air_quality_snapshot import air_quality_snapshot
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger()
@@ -27,6 +30,14 @@ async def initialize_cache_on_startup():
             await initialize_weekly_cache()
         else:
             logger.info("주간별 캐시 존재")
+
+        # 3. 측정소 목록 로드 (Redis에 없으면 API에서 조회)
+        if settings.AIRQUALITY_LOCAL_STATION_INDEX_ENABLED:
+            await air_quality_station_catalog.ensure_loaded()
+
+        # 4. 실시간 측정값 스냅샷 (없으면 바로 갱신)
+        if settings.AIRQUALITY_SNAPSHOT_ENABLED:
+            await air_quality_snapshot.ensure_loaded()
             
         logger.info("캐시 초기화 완료")
     except Exception as e:
@@ -45,16 +56,16 @@ async def initialize_hourly_cache():
         try:
             logger.info(f"시간별 캐시 초기화 시도 {attempt}/{max_attempts}")
 
-            now = datetime.now()
-            search_date = now.strftime("%Y-%m-%d")
+            # 05:30 이전에는 전날 23시 발표가 최신이므로 전날 날짜로 조회
+            search_date, _ = get_hourly_air_quality_issuance(datetime.now())
             
             # API에서 원본 데이터 조회
             raw_data = await fetch_hourly_air_quality_raw(search_date)
             print(f"원본 데이터 로드 완료")
             
-            # 원본 데이터를 캐시에 저장
+            # 발표/일자/지역별 등급 표로 변환해서 캐시에 저장
             cache_data = HourlyAirQualityCache(
-                forecasts=raw_data,  # 원본 API 데이터 저장
+                forecasts=build_hourly_air_quality_table(raw_data),
                 cached_at=datetime.now().isoformat()
             )
             
@@ -0,0 +1,97 @@
+import time
+from typing import Dict
+from urllib.parse import urlparse
+from app.core.config import settings
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+# 업스트림 장애로 보는 공공데이터포털 응답 코드
+# 01: 어플리케이션 에러, 02: 데이터베이스 에러, 04: HTTP 에러, 05: 서비스 연결실패, 99: 기타에러
+UPSTREAM_FAILURE_CODES = {"01", "02", "04", "05", "99"}
+
+class CircuitBreaker:
+    """
+    업스트림 URL 단위 서킷 브레이커
+    closed: 정상 호출
+    open: 연속 실패가 임계치를 넘으면 recovery_timeout 동안 즉시 실패
+    half_open: recovery_timeout 이후 한 건만 시험 호출, 성공 시 closed / 실패 시 다시 open
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_started_at = None
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부 (half_open에서는 시험 호출 한 건만 허용)"""
+        now = time.monotonic()
+
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if now - self.opened_at < self.recovery_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_started_at = now
+            logger.info(f"서킷 half-open 전환, 시험 호출 진행: {self.name}")
+            return True
+
+        # half_open: 시험 호출이 끝나지 않았으면 차단 (결과가 기록되지 않은 채 오래되면 재시도)
+        if self._probe_started_at is not None and now - self._probe_started_at < self.recovery_timeout:
+            return False
+        self._probe_started_at = now
+        return True
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"서킷 closed 전환 (업스트림 복구): {self.name}")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_started_at = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._probe_started_at = None
+
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"서킷 open 전환 (연속 실패 {self.consecutive_failures}회): {self.name}")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+class CircuitBreakerRegistry:
+    """업스트림 URL(경로)별 서킷 브레이커 관리"""
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        name = urlparse(url).path or url
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=name,
+                failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS,
+            )
+            self._breakers[name] = breaker
+        return breaker
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+
+# 전역 서킷 브레이커 레지스트리
+circuit_breakers = CircuitBreakerRegistry()
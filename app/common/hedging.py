@@ -0,0 +1,110 @@
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+from urllib.parse import urlparse
+from app.core.config import settings
+from app.common.budget import TokenBucketBudget
+from app.common.stats import nearest_rank_percentile
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+class LatencyTracker:
+    """업스트림 엔드포인트별 최근 응답 시간 기록"""
+    def __init__(self, max_samples: int):
+        self._samples: Dict[str, Deque[float]] = {}
+        self.max_samples = max_samples
+
+    def record(self, endpoint: str, seconds: float):
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = deque(maxlen=self.max_samples)
+            self._samples[endpoint] = samples
+        samples.append(seconds)
+
+    def percentile(self, endpoint: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        최근 응답 시간의 백분위수
+        :return: 백분위수 (표본 부족 시 None)
+        """
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < min_samples:
+            return None
+        return nearest_rank_percentile(samples, percentile)
+
+class RequestHedger:
+    """
+    헤지 요청 실행기
+    응답이 엔드포인트별 지연 백분위수 안에 오지 않으면 다른 서비스 키로 같은 요청을 한 번 더 보내고
+    먼저 성공한 응답을 사용함
+    """
+    def __init__(self):
+        self.latency_tracker = LatencyTracker(settings.UPSTREAM_HEDGE_SAMPLE_SIZE)
+        self.budget = TokenBucketBudget(settings.UPSTREAM_HEDGE_BUDGET_RATIO, settings.UPSTREAM_HEDGE_BUDGET_BURST)
+
+    @staticmethod
+    def endpoint_of(url: str) -> str:
+        return urlparse(url).path or url
+
+    def record_latency(self, url: str, seconds: float):
+        self.latency_tracker.record(self.endpoint_of(url), seconds)
+
+    def get_hedge_delay(self, url: str) -> Optional[float]:
+        """헤지 요청 대기 시간 (표본 부족 시 None = 헤지 안 함)"""
+        delay = self.latency_tracker.percentile(
+            self.endpoint_of(url),
+            settings.UPSTREAM_HEDGE_PERCENTILE,
+            min_samples=settings.UPSTREAM_HEDGE_MIN_SAMPLES,
+        )
+        if delay is None:
+            return None
+        return max(delay, settings.UPSTREAM_HEDGE_MIN_DELAY_SECONDS)
+
+    async def run(
+        self,
+        url: str,
+        primary: Callable[[], Awaitable[Any]],
+        hedge: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        헤지 요청 실행
+        :param url: 요청 URL (엔드포인트 구분용)
+        :param primary: 기본 요청
+        :param hedge: 헤지 요청 (다른 서비스 키 사용)
+        :return: 먼저 성공한 요청의 결과
+        """
+        self.budget.on_request()
+        delay = self.get_hedge_delay(url)
+
+        primary_task = asyncio.ensure_future(primary())
+        tasks = [primary_task]
+        try:
+            if delay is None:
+                return await primary_task
+
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done:
+                return primary_task.result()
+
+            if not self.budget.try_acquire():
+                logger.debug(f"헤지 예산 소진, 기본 요청 대기: {url}")
+                return await primary_task
+
+            logger.info(f"응답 지연 {delay:.3f}초 초과, 헤지 요청 전송: {url}")
+            tasks.append(asyncio.ensure_future(hedge()))
+            pending = set(tasks)
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            # 늦게 끝난 요청(또는 호출자 취소 시 남은 요청) 정리
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+# 전역 헤지 요청 실행기
+request_hedger = RequestHedger()
@@ -1,17 +1,64 @@
+import asyncio
 import json
+import re
+import time
+from dataclasses import dataclass
 from fastapi import HTTPException
 import httpx
 import certifi
 from app.core.config import settings
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, Tuple
 import xml.etree.ElementTree as ET
-from app.utils.service_key_rotator import service_key_rotator
+from app.utils.service_key_scheduler import service_key_scheduler
+from app.common.single_flight import build_request_key, upstream_single_flight
+from app.common.circuit_breaker import circuit_breakers
+from app.common.hedging import request_hedger
+from app.common.retry_policy import UpstreamError, upstream_retry_policy
+from app.common.upstream_metrics import upstream_metrics
+from app.common.stale_fallback import load_last_good_response, remember_last_good_response
 from app.config.logging_config import get_logger
 logger = get_logger()
 
-async def get_http_client() -> httpx.AsyncClient:
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+# 본문 앞 공백 이후 '<'로 시작하면 XML 응답
+_XML_PREFIX = re.compile(rb"\s*<")
+
+@dataclass
+class UpstreamResponse:
+    """
+    파싱/검증이 끝난 업스트림 응답 (본문은 한 번만 디코딩)
+    동일 요청 병합으로 여러 호출자가 공유하므로 읽기 전용으로 사용
+    """
+    status_code: int
+    content: bytes
+    result_code: Optional[str]
+    result_msg: Optional[str]
+    data: Optional[Dict[str, Any]] = None  # JSON 응답
+    xml: Optional[ET.Element] = None  # XML 응답
+    stale: bool = False  # 업스트림 장애로 마지막 정상 응답을 대신 사용한 경우
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+# 전역 공유 HTTP 클라이언트 (lifespan에서 생성/종료)
+_http_client: Optional[httpx.AsyncClient] = None
+
+def _is_http2_available() -> bool:
+    """HTTP/2 사용에 필요한 h2 패키지 설치 여부"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def create_http_client() -> httpx.AsyncClient:
     """
-    SSL 설정이 적용된 httpx AsyncClient를 반환합니다.
+    SSL, 타임아웃, 커넥션 풀 설정이 적용된 httpx AsyncClient를 생성합니다.
     
     Returns:
         httpx.AsyncClient: 구성된 HTTP 클라이언트
@@ -20,21 +67,65 @@ async def get_http_client() -> httpx.AsyncClient:
     ssl_verify = certifi.where() if settings.SSL_VERIFY else False
     
     # 타임아웃 설정 추가
-    timeout = httpx.Timeout(30.0, connect=10.0)
+    timeout = httpx.Timeout(settings.HTTP_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT)
+
+    # 커넥션 풀 설정 (keep-alive 재사용)
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+    # HTTP/2는 h2 패키지가 있을 때만 사용 (pip install httpx[http2])
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not _is_http2_available():
+        logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+        http2 = False
     
     return httpx.AsyncClient(
         verify=ssl_verify,
-        timeout=timeout
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
     )
 
-def handle_response_error(response_code: str, response_msg: str) -> None:
-    logger.error(f"API 오류 (Code: {response_code}): {response_msg}")
+async def init_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 생성 (서버 시작 시 호출)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+        logger.info(
+            f"공유 HTTP 클라이언트 생성 - max_connections: {settings.HTTP_MAX_CONNECTIONS}, "
+            f"keepalive: {settings.HTTP_MAX_KEEPALIVE_CONNECTIONS}, http2: {settings.HTTP2_ENABLED}"
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (서버 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("공유 HTTP 클라이언트 종료")
 
-    service_key_error_codes = ["20", "21", "22", "30", "31", "32", "33"]
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트를 반환합니다.
+    lifespan 밖(스크립트 등)에서 호출되면 지연 생성합니다.
     
-    # if response_code in service_key_error_codes:
-    #     logger.warning(f"서비스 키 관련 에러 발생 (Code: {response_code}), 강제 로테이션 수행")
-    #     service_key_rotator.force_rotate()
+    Returns:
+        httpx.AsyncClient: 공유 HTTP 클라이언트
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
+
+def build_response_error(response_code: str, response_msg: str) -> HTTPException:
+    logger.error(f"API 오류 (Code: {response_code}): {response_msg}")
+
+    # 서비스 키 관련 에러(20~22, 30~33)는 service_key_scheduler.report_error에서 키 제외 처리
+    # 재시도 여부는 retry_policy에서 분류
     error_messages = {
         "01": "어플리케이션 에러",
         "02": "데이터베이스 에러", 
@@ -57,7 +148,7 @@ def handle_response_error(response_code: str, response_msg: str) -> None:
     error_description = error_messages.get(response_code, f"알 수 없는 에러 코드({response_code})")
     detail_message = f"외부 API 에러: {error_description} - {response_msg}"
     
-    raise HTTPException(status_code=502, detail=detail_message)
+    return HTTPException(status_code=502, detail=detail_message)
 
 
 async def make_request(
@@ -67,9 +158,11 @@ async def make_request(
     data: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, Any]] = None,
     json_data: Optional[Dict[str, Any]] = None,
-) -> httpx.Response:
+    hedge: Optional[bool] = None,
+) -> UpstreamResponse:
     """
     HTTP 요청을 보내는 공통 함수
+    동일한 요청(URL + serviceKey를 제외한 파라미터)이 동시에 들어오면 하나의 호출로 합침
     
     Args:
         url: 요청 URL
@@ -78,19 +171,188 @@ async def make_request(
         data: 요청 body (form data)
         headers: HTTP 헤더
         json_data: JSON 데이터 (application/json)
+        hedge: 헤지 요청 사용 여부 (None이면 UPSTREAM_HEDGING_ENABLED 설정을 따름)
     Returns:
-        httpx.Response: HTTP 응답 객체
+        UpstreamResponse: 파싱/검증된 응답 (JSON은 data, XML은 xml)
     """
-    # 서비스키 스케쥴링
-    params['serviceKey'] = service_key_rotator.get_next_service_key()
-    print(service_key_rotator.get_current_stats())
+    # 호출자 딕셔너리를 변경하지 않도록 복사
+    params = dict(params or {})
+    hedge = settings.UPSTREAM_HEDGING_ENABLED if hedge is None else hedge
+
+    if not settings.UPSTREAM_SINGLE_FLIGHT_ENABLED:
+        return await _send_request(url, method, params, headers, hedge)
+
+    request_key = build_request_key(method, url, params)
+    return await upstream_single_flight.do(
+        request_key,
+        lambda: _send_request(url, method, params, headers, hedge),
+    )
+
+async def _send_request(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, Any]] = None,
+    hedge: bool = False,
+) -> UpstreamResponse:
+    """
+    실제 업스트림 요청 및 응답 검증
+    
+    Args:
+        url: 요청 URL
+        method: HTTP 메서드
+        params: URL 쿼리 파라미터 (serviceKey 제외)
+        headers: HTTP 헤더
+        hedge: 헤지 요청 사용 여부
+    Returns:
+        UpstreamResponse: 파싱/검증된 응답
+    """
+    # 서킷이 열려 있으면 업스트림 호출 없이 즉시 대체 응답
+    breaker = circuit_breakers.get(url)
+    if not breaker.allow_request():
+        logger.warning(f"서킷 open 상태, 업스트림 호출 생략: {url}")
+        upstream_metrics.record_event(url, "circuit_open")
+        return await _fallback_to_last_good(
+            url, method, params,
+            HTTPException(status_code=503, detail="외부 API 일시 장애로 요청을 처리할 수 없습니다."),
+        )
 
     logger.info(f"Request Url: {url}")
     logger.info(f"param: {params}")
 
-    async with await get_http_client() as client:
+    upstream_retry_policy.on_request()
+    excluded_keys: Set[int] = set()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            payload, response = await _request_once(url, method, params, headers, hedge, excluded_keys)
+        except UpstreamError as e:
+            error = e
+        else:
+            breaker.record_success()
+            remember_last_good_response(method, url, params, response)
+            return payload
+
+        # 실패 기록
+        if error.upstream_failure:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        # 키/할당량/업스트림 장애 코드만 키 에러로 기록 (03 데이터없음, 10/11 파라미터 오류는 키와 무관)
+        if error.key_index is not None and error.result_code is not None and (error.is_key_error or error.upstream_failure):
+            await service_key_scheduler.report_error(error.key_index, error.result_code)
+        if error.is_key_error and error.key_index is not None:
+            excluded_keys.add(error.key_index)
+
+        # 재시도 판단 (서킷이 열렸으면 중단)
+        available_keys = service_key_scheduler.key_count - len(excluded_keys)
+        if breaker.state == breaker.OPEN or not upstream_retry_policy.should_retry(error, attempt, available_keys):
+            break
+
+        delay = upstream_retry_policy.backoff(attempt)
+        logger.warning(f"업스트림 재시도 {attempt}/{upstream_retry_policy.max_attempts - 1} ({delay:.2f}초 후): {error.error.detail}")
+        upstream_metrics.record_event(url, "retry")
+        await asyncio.sleep(delay)
+
+    if error.upstream_failure:
+        return await _fallback_to_last_good(url, method, params, error.error)
+    raise error.error
+
+async def _request_once(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, Any]],
+    hedge: bool,
+    excluded_keys: Set[int],
+) -> Tuple[UpstreamResponse, httpx.Response]:
+    """
+    업스트림 요청 1회 (헤지 포함) 및 응답 검증
+    실패 시 UpstreamError 발생
+    
+    Returns:
+        Tuple[UpstreamResponse, httpx.Response]: (파싱된 응답, 원본 응답)
+    """
+    # 서비스키 스케쥴링
+    key_index, service_key = await service_key_scheduler.acquire(exclude=excluded_keys)
+
+    if hedge and service_key_scheduler.key_count > 1:
+        # 검증까지 마친 응답끼리 경쟁시켜서 빠른 에러 응답이 늦은 정상 응답을 이기지 않게 함
+        return await request_hedger.run(
+            url,
+            primary=lambda: _fetch_and_validate(url, method, params, headers, key_index, service_key),
+            hedge=lambda: _fetch_with_other_key(url, method, params, headers, exclude=excluded_keys | {key_index}),
+        )
+    return await _fetch_and_validate(url, method, params, headers, key_index, service_key)
+
+async def _fetch_and_validate(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, Any]],
+    key_index: int,
+    service_key: str,
+) -> Tuple[UpstreamResponse, httpx.Response]:
+    """
+    지정한 서비스 키로 요청 1회 전송 후 HTTP 상태/결과 코드 검증
+    실패 시 UpstreamError 발생
+    """
+    try:
+        response, key_index = await _fetch(url, method, params, headers, key_index, service_key)
+    except httpx.HTTPError as e:
+        logger.error(f"업스트림 연결 오류: {type(e).__name__} - {url}")
+        raise UpstreamError(
+            HTTPException(status_code=502, detail=f"외부 API 연결 오류: {type(e).__name__}"),
+            key_index=key_index,
+            upstream_failure=True,
+        )
+
+    if response.status_code >= 500:
+        logger.error(f"업스트림 HTTP 오류: {response.status_code} - {url}")
+        upstream_metrics.record_outcome(url, f"http_{response.status_code}")
+        raise UpstreamError(
+            HTTPException(status_code=502, detail=f"외부 API HTTP 에러: {response.status_code}"),
+            key_index=key_index,
+            upstream_failure=True,
+        )
+
+    try:
+        payload = parse_upstream_response(response)
+    except HTTPException as e:
+        upstream_metrics.record_outcome(url, "parse_error")
+        raise UpstreamError(e, key_index=key_index, upstream_failure=True)
+
+    upstream_metrics.record_outcome(url, str(payload.result_code))
+    if payload.result_code != "00":
+        raise UpstreamError(
+            build_response_error(payload.result_code, payload.result_msg),
+            key_index=key_index,
+            result_code=payload.result_code,
+        )
+
+    return payload, response
+
+async def _fetch(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, Any]],
+    key_index: int,
+    service_key: str,
+) -> Tuple[httpx.Response, int]:
+    """
+    지정한 서비스 키로 업스트림 요청 1회 전송
+    
+    Returns:
+        Tuple[httpx.Response, int]: (HTTP 응답 객체, 사용한 키 인덱스)
+    """
+    request_params = {**params, "serviceKey": service_key}
+    client = get_http_client()
+    started_at = time.perf_counter()
+    try:
         if method.upper() == "GET":
-            response = await client.get(url, params=params, headers=headers)
+            response = await client.get(url, params=request_params, headers=headers)
         # elif method.upper() == "POST":
         #     response = await client.post(url, params=params, data=data, json=json_data, headers=headers)
         # elif method.upper() == "PUT":
@@ -99,60 +361,111 @@ async def make_request(
         #     response = await client.delete(url, params=params, headers=headers)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        response_text = response.text.strip()
-        is_xml_response = response_text.startswith('<?xml') or response_text.startswith('<')
-
-
-        # XML 에러 응답 예시
-        # 공공데이터 포털 진짜 이상함...
-        # <OpenAPI_ServiceResponse>
-        #     <cmmMsgHeader>
-        #         <errMsg>SERVICE ERROR</errMsg>
-        #         <returnAuthMsg>SERVICE_ACCESS_DENIED_ERROR</returnAuthMsg>
-        #         <returnReasonCode>20</returnReasonCode>
-        #     </cmmMsgHeader>
-        # </OpenAPI_ServiceResponse>
-
-        if is_xml_response:
-            try:
-                root = ET.fromstring(response.text)
-                
-                err_msg = root.find('.//errMsg')
-                return_reason_code = root.find('.//returnReasonCode')
-                return_auth_msg = root.find('.//returnAuthMsg')
-                
-                if err_msg is not None and return_reason_code is not None:
-                    error_code = return_reason_code.text
-                    error_msg = return_auth_msg.text if return_auth_msg is not None else err_msg.text
-                    logger.error(f"API Error Response - Code: {error_code}, Message: {error_msg}")
-                    handle_response_error(error_code, error_msg)
-                else: 
-                    # 정상 XML 응답 처리
-                    result_code = root.find('.//resultCode')
-                    result_msg = root.find('.//resultMsg')
+    except httpx.HTTPError as e:
+        upstream_metrics.observe_request(url, time.perf_counter() - started_at, 0, key_index)
+        upstream_metrics.record_outcome(url, type(e).__name__)
+        raise
+
+    latency = time.perf_counter() - started_at
+    request_hedger.record_latency(url, latency)
+    upstream_metrics.observe_request(url, latency, len(response.content), key_index)
+    return response, key_index
+
+async def _fetch_with_other_key(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    headers: Optional[Dict[str, Any]],
+    exclude: Set[int],
+) -> Tuple[UpstreamResponse, httpx.Response]:
+    """헤지 요청용: 기존 요청과 다른 서비스 키로 전송 후 검증"""
+    key_index, service_key = await service_key_scheduler.acquire(exclude=exclude)
+    return await _fetch_and_validate(url, method, params, headers, key_index, service_key)
+
+async def _fallback_to_last_good(
+    url: str,
+    method: str,
+    params: Dict[str, Any],
+    error: HTTPException,
+) -> UpstreamResponse:
+    """
+    업스트림 장애 시 마지막 정상 응답으로 대체, 없으면 원래 에러 발생
+    """
+    response = await load_last_good_response(method, url, params)
+    if response is None:
+        raise error
+    logger.warning(f"업스트림 장애로 마지막 정상 응답 사용: {url}")
+    upstream_metrics.record_event(url, "stale_fallback")
+    payload = parse_upstream_response(response)
+    # 발표/날짜 단위 캐시가 대체 응답을 오래 보관하지 않도록 표시
+    payload.stale = True
+    return payload
+
+def decode_json(content: bytes) -> Any:
+    """JSON 디코딩 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def parse_upstream_response(response: httpx.Response) -> UpstreamResponse:
+    """
+    공공데이터포털 응답 본문을 한 번만 파싱하고 결과 코드와 메시지 추출
+    
+    Args:
+        response: HTTP 응답 객체
+    Returns:
+        UpstreamResponse: 파싱된 응답
+    """
+    content = response.content
+    is_xml_response = _XML_PREFIX.match(content) is not None
+
+
+    # XML 에러 응답 예시
+    # 공공데이터 포털 진짜 이상함...
+    # <OpenAPI_ServiceResponse>
+    #     <cmmMsgHeader>
+    #         <errMsg>SERVICE ERROR</errMsg>
+    #         <returnAuthMsg>SERVICE_ACCESS_DENIED_ERROR</returnAuthMsg>
+    #         <returnReasonCode>20</returnReasonCode>
+    #     </cmmMsgHeader>
+    # </OpenAPI_ServiceResponse>
+
+    if is_xml_response:
+        try:
+            root = ET.fromstring(content)
+            
+            err_msg = root.find('.//errMsg')
+            return_reason_code = root.find('.//returnReasonCode')
+            return_auth_msg = root.find('.//returnAuthMsg')
+            
+            if err_msg is not None and return_reason_code is not None:
+                error_code = return_reason_code.text
+                error_msg = return_auth_msg.text if return_auth_msg is not None else err_msg.text
+                logger.error(f"API Error Response - Code: {error_code}, Message: {error_msg}")
+                return UpstreamResponse(response.status_code, content, error_code, error_msg, xml=root)
+
+            # 정상 XML 응답 처리
+            result_code = root.find('.//resultCode')
+            result_msg = root.find('.//resultMsg')
+            
+            response_code = result_code.text if result_code is not None else "Unknown"
+            response_msg = result_msg.text if result_msg is not None else "Unknown error"
+            logger.info(f"Response Code: {response_code}, Message: {response_msg}")
+            return UpstreamResponse(response.status_code, content, response_code, response_msg, xml=root)
+                    
+        except ET.ParseError:
+            logger.error("XML 응답 파싱 오류")
+            raise HTTPException(status_code=500, detail="XML 응답 형식 오류")
+    else: 
+        # JSON 응답 처리
+        try:
+            data = decode_json(content)
+            header = data.get("response", {}).get("header", {})
+            response_code = header.get("resultCode")
+            response_msg = header.get("resultMsg", "Unknown error")
+            logger.info(f"Response Code: {response_code}, Message: {response_msg}")
+            return UpstreamResponse(response.status_code, content, response_code, response_msg, data=data)
                     
-                    response_code = result_code.text if result_code is not None else "Unknown"
-                    response_msg = result_msg.text if result_msg is not None else "Unknown error"
-                    logger.info(f"Response Code: {response_code}, Message: {response_msg}")
-                    if response_code != "00":
-                        handle_response_error(response_code, response_msg)
-                        
-            except ET.ParseError:
-                logger.error("XML 응답 파싱 오류")
-                raise HTTPException(status_code=500, detail="XML 응답 형식 오류")
-        else: 
-            # JSON 응답 처리
-            try:
-                data = response.json()
-                response_code = data.get("response", {}).get("header", {}).get("resultCode")
-                response_msg = data.get("response", {}).get("header", {}).get("resultMsg", "Unknown error")
-                logger.info(f"Response Code: {response_code}, Message: {response_msg}")
-                if response_code != "00":
-                    handle_response_error(response_code, response_msg)
-                        
-            except json.JSONDecodeError:
-                logger.error("JSON 응답 파싱 오류")
-                raise HTTPException(status_code=500, detail="API 응답 형식 오류")
-
-        return response
\ No newline at end of file
+        except (ValueError, AttributeError):
+            logger.error("JSON 응답 파싱 오류")
+            raise HTTPException(status_code=500, detail="API 응답 형식 오류")
@@ -0,0 +1,82 @@
+import random
+from typing import Optional
+from fastapi import HTTPException
+from app.core.config import settings
+from app.common.budget import TokenBucketBudget
+from app.common.circuit_breaker import UPSTREAM_FAILURE_CODES
+from app.utils.service_key_scheduler import KEY_ERROR_CODES, QUOTA_EXCEEDED_CODES
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+# 공공데이터포털 에러 코드 분류
+# 일시적 장애 (01, 02, 04, 05, 99): 같은 요청 재시도
+# 서비스 키 에러 (20~22, 30~33): 다른 서비스 키로 재시도
+# 그 외 (03 데이터없음, 10~12 요청 파라미터 오류 등): 재시도 안 함
+KEY_RETRY_CODES = KEY_ERROR_CODES | QUOTA_EXCEEDED_CODES
+
+class UpstreamError(Exception):
+    """
+    업스트림 요청 1회 실패 정보
+    :param error: 최종 실패 시 전달할 HTTPException
+    :param key_index: 사용한 서비스 키 인덱스
+    :param result_code: 공공데이터포털 응답 코드 (연결 오류 등은 None)
+    :param upstream_failure: 업스트림 장애 여부 (연결 오류, 5xx, 응답 형식 오류, 01/02/04/05/99)
+    """
+    def __init__(
+        self,
+        error: HTTPException,
+        key_index: Optional[int] = None,
+        result_code: Optional[str] = None,
+        upstream_failure: bool = False,
+    ):
+        super().__init__(error.detail)
+        self.error = error
+        self.key_index = key_index
+        self.result_code = result_code
+        self.upstream_failure = upstream_failure or result_code in UPSTREAM_FAILURE_CODES
+
+    @property
+    def is_key_error(self) -> bool:
+        return self.result_code in KEY_RETRY_CODES
+
+class RetryPolicy:
+    """업스트림 재시도 정책 (에러 분류 + 지수 백오프/지터 + 재시도 예산)"""
+    def __init__(self):
+        self.max_attempts = settings.UPSTREAM_RETRY_MAX_ATTEMPTS
+        self.base_delay = settings.UPSTREAM_RETRY_BASE_DELAY_SECONDS
+        self.max_delay = settings.UPSTREAM_RETRY_MAX_DELAY_SECONDS
+        self.budget = TokenBucketBudget(settings.UPSTREAM_RETRY_BUDGET_RATIO, settings.UPSTREAM_RETRY_BUDGET_BURST)
+
+    def on_request(self):
+        self.budget.on_request()
+
+    def should_retry(self, error: UpstreamError, attempt: int, available_keys: int) -> bool:
+        """
+        재시도 여부 판단
+        :param error: 실패 정보
+        :param attempt: 지금까지 시도한 횟수
+        :param available_keys: 아직 시도하지 않은 서비스 키 수
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if error.is_key_error:
+            # 다른 키가 없으면 같은 키로 재시도해도 의미 없음
+            retryable = available_keys > 0
+        else:
+            retryable = error.upstream_failure
+
+        if not retryable:
+            return False
+
+        if not self.budget.try_acquire():
+            logger.warning("재시도 예산 소진, 재시도하지 않음")
+            return False
+        return True
+
+    def backoff(self, attempt: int) -> float:
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+# 전역 재시도 정책
+upstream_retry_policy = RetryPolicy()
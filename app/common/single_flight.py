@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import urlencode
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+# 요청 키에서 제외할 파라미터 (호출마다 달라지는 값)
+EXCLUDED_KEY_PARAMS = {"serviceKey"}
+
+def build_request_key(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    exclude: Optional[Set[str]] = None,
+) -> str:
+    """
+    동일 요청 판별용 키 생성 (serviceKey 제외, 파라미터 정렬)
+    :param method: HTTP 메서드
+    :param url: 요청 URL
+    :param params: 쿼리 파라미터
+    :param exclude: 키에서 제외할 파라미터 (기본값: serviceKey)
+    :return: 요청 키
+    """
+    exclude = EXCLUDED_KEY_PARAMS if exclude is None else exclude
+    items = sorted(
+        (str(k), str(v)) for k, v in (params or {}).items()
+        if k not in exclude
+    )
+    return f"{method.upper()} {url}?{urlencode(items)}"
+
+class SingleFlight:
+    """
+    동일 키로 동시에 들어온 호출을 하나의 실행으로 합쳐주는 클래스
+    먼저 들어온 호출이 실제 작업을 수행하고, 나머지는 같은 결과를 공유함
+    """
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키 단위로 작업을 합쳐서 실행
+        :param key: 합칠 기준 키
+        :param func: 실제 작업 (코루틴 함수)
+        :return: 작업 결과
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            logger.debug(f"진행 중인 동일 요청에 합류: {key}")
+
+        # 한 호출자가 취소되어도 공유 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리는 호출자가 없을 때 예외 미조회 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 요청 수"""
+        return len(self._calls)
+
+# 전역 업스트림 요청 병합 인스턴스
+upstream_single_flight = SingleFlight()
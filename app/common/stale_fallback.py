@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Dict, Optional, Set
+import httpx
+from app.core.config import settings
+from app.config.redis_config import get_redis_binary_client
+from app.common.cache_codec import cache_codec
+from app.common.single_flight import build_request_key
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+STALE_KEY_PREFIX = "upstream:stale"
+# 워커 메모리에 기억할 최대 저장 기록 수 (넘으면 저장 간격이 지난 기록 정리)
+_LAST_SAVED_MAX = 10000
+
+# 요청별 마지막 저장 시각 (같은 요청은 UPSTREAM_STALE_SAVE_INTERVAL_SECONDS에 한 번만 저장)
+_last_saved: Dict[str, float] = {}
+_pending_saves: Set[asyncio.Task] = set()
+
+def build_stale_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    마지막 정상 응답 저장용 키 생성
+    발표 시각/조회 날짜 파라미터도 키에 포함해서 다른 발표/날짜의 응답으로 대체하지 않음
+    :param method: HTTP 메서드
+    :param url: 요청 URL
+    :param params: 쿼리 파라미터
+    :return: Redis 키
+    """
+    request_key = build_request_key(method, url, params)
+    return f"{STALE_KEY_PREFIX}:{hashlib.sha1(request_key.encode()).hexdigest()}"
+
+def remember_last_good_response(method: str, url: str, params: Dict[str, Any], response: httpx.Response):
+    """
+    정상 응답 본문을 대체용으로 저장 예약 (요청 처리 중에는 기다리지 않음)
+    같은 요청은 UPSTREAM_STALE_SAVE_INTERVAL_SECONDS 동안 다시 저장하지 않음
+    """
+    if not settings.UPSTREAM_STALE_FALLBACK_ENABLED:
+        return
+    stale_key = build_stale_key(method, url, params)
+    now = time.monotonic()
+    last_saved = _last_saved.get(stale_key)
+    if last_saved is not None and now - last_saved < settings.UPSTREAM_STALE_SAVE_INTERVAL_SECONDS:
+        return
+
+    if len(_last_saved) >= _LAST_SAVED_MAX:
+        for key in [key for key, saved in _last_saved.items() if now - saved >= settings.UPSTREAM_STALE_SAVE_INTERVAL_SECONDS]:
+            del _last_saved[key]
+    _last_saved[stale_key] = now
+
+    task = asyncio.ensure_future(save_last_good_response(stale_key, response.content))
+    _pending_saves.add(task)
+    task.add_done_callback(_pending_saves.discard)
+
+async def save_last_good_response(stale_key: str, content: bytes):
+    """정상 응답 본문을 대체용으로 저장"""
+    try:
+        redis = await get_redis_binary_client()
+        await redis.set(stale_key, cache_codec.encode_bytes(content), ex=settings.UPSTREAM_STALE_TTL_SECONDS)
+    except Exception as e:
+        # 다음 응답에서 다시 저장하도록 기록 제거
+        _last_saved.pop(stale_key, None)
+        logger.warning(f"마지막 정상 응답 저장 실패: {str(e)}")
+
+async def load_last_good_response(method: str, url: str, params: Dict[str, Any]) -> Optional[httpx.Response]:
+    """
+    저장된 마지막 정상 응답 조회
+    :return: 저장된 응답으로 만든 httpx.Response (없으면 None)
+    """
+    if not settings.UPSTREAM_STALE_FALLBACK_ENABLED:
+        return None
+    try:
+        redis = await get_redis_binary_client()
+        body = await redis.get(build_stale_key(method, url, params))
+        if body is None:
+            return None
+        return httpx.Response(200, content=cache_codec.decode_bytes(body), request=httpx.Request(method.upper(), url))
+    except Exception as e:
+        logger.warning(f"마지막 정상 응답 조회 실패: {str(e)}")
+        return None
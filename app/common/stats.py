@@ -0,0 +1,15 @@
+import math
+from typing import Iterable, Optional
+
+def nearest_rank_percentile(samples: Iterable[float], percentile: float) -> Optional[float]:
+    """
+    최근접 순위(nearest-rank) 방식 백분위수
+    :param samples: 표본 (정렬되지 않아도 됨)
+    :param percentile: 백분위 (0 ~ 100)
+    :return: 백분위수 (표본이 없으면 None)
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, math.ceil(len(ordered) * percentile / 100) - 1))
+    return ordered[index]
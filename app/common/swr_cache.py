@@ -0,0 +1,222 @@
+import asyncio
+import math
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+from app.core.config import settings
+from app.config.redis_config import get_redis_binary_client, get_redis_client
+from app.common.cache_codec import cache_codec
+from app.common.single_flight import SingleFlight
+from app.utils.cache_utils import apply_ttl_jitter
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+TTL = Union[int, Callable[[], int]]
+_MISSING = object()
+
+# 토큰이 같을 때만 삭제 (조회와 삭제 사이에 다른 워커가 잠금을 잡는 경우 방지)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+class ShortLivedValue:
+    """
+    fetch가 이 값으로 감싸서 반환하면 CACHE_STALE_RESULT_TTL_SECONDS 동안만 캐시
+    (업스트림 장애로 마지막 정상 응답을 대신 사용한 경우 등)
+    """
+    def __init__(self, value: Any):
+        self.value = value
+
+class StaleWhileRevalidateCache:
+    """
+    Stale-while-revalidate Redis 캐시
+    값과 함께 소프트 만료 시각을 저장하고, Redis TTL(하드 만료)은 소프트 만료 + 유예 시간으로 설정함
+    - 소프트 만료 전: 캐시 값 반환 (만료 직전에는 XFetch 방식으로 확률적으로 미리 갱신)
+    - 소프트 만료 후 ~ 하드 만료 전: 캐시 값을 바로 반환하고 백그라운드에서 한 번만 갱신
+    - 하드 만료 후(캐시 없음): Redis 잠금을 잡은 워커 하나만 조회 후 저장, 나머지는 저장될 때까지 대기
+    만료 시각에는 지터를 더해 같은 시각 기준 키들이 한꺼번에 만료되지 않게 함
+    """
+    LOCK_PREFIX = "cache:refresh"
+
+    def __init__(self):
+        self._single_flight = SingleFlight()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._release_script = None
+
+    @staticmethod
+    def _resolve_ttl(ttl: TTL) -> int:
+        return max(int(ttl() if callable(ttl) else ttl), 1)
+
+    @staticmethod
+    def _parse_entry(cached_data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        entry = cache_codec.decode(cached_data) if cached_data else None
+        # 이전 형식(소프트 만료 정보 없음)으로 저장된 값은 캐시 없음으로 처리
+        if isinstance(entry, dict) and "soft_expires_at" in entry:
+            return entry
+        return None
+
+    @staticmethod
+    def _should_refresh_early(entry: Dict[str, Any]) -> bool:
+        """
+        XFetch: 재계산에 걸린 시간(delta)이 길수록, 만료가 가까울수록 높은 확률로 미리 갱신
+        now - delta * beta * ln(rand) >= 만료 시각
+        """
+        delta = entry.get("delta", 0)
+        beta = settings.CACHE_XFETCH_BETA
+        if delta <= 0 or beta <= 0:
+            return False
+        return time.time() - delta * beta * math.log(1.0 - random.random()) >= entry["soft_expires_at"]
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: TTL,
+        grace_seconds: Optional[int] = None,
+    ) -> Any:
+        """
+        캐시 조회, 없거나 만료되었으면 fetch로 갱신
+        :param key: Redis 키
+        :param fetch: 원본 데이터 조회 (JSON 직렬화 가능한 값 반환)
+        :param ttl: 소프트 만료까지의 초 (갱신 시점에 다시 계산하도록 함수도 가능)
+        :param grace_seconds: 소프트 만료 후 오래된 값을 제공할 시간 (기본값: CACHE_STALE_GRACE_SECONDS)
+        :return: 캐시 또는 새로 조회한 값
+        """
+        grace_seconds = settings.CACHE_STALE_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        try:
+            redis = await get_redis_binary_client()
+            entry = self._parse_entry(await redis.get(key))
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
+            value = await fetch()
+            return value.value if isinstance(value, ShortLivedValue) else value
+
+        if entry is not None:
+            if time.time() < entry["soft_expires_at"]:
+                if self._should_refresh_early(entry):
+                    logger.info(f"만료 임박 캐시 조기 갱신: {key}")
+                    self._schedule_refresh(key, fetch, ttl, grace_seconds)
+                else:
+                    logger.info(f"캐시에서 조회: {key}")
+                return entry["value"]
+            if settings.CACHE_SWR_ENABLED:
+                logger.info(f"만료된 캐시 반환 후 백그라운드 갱신: {key}")
+                self._schedule_refresh(key, fetch, ttl, grace_seconds)
+                return entry["value"]
+
+        return await self._single_flight.do(key, lambda: self._rebuild(key, fetch, ttl, grace_seconds))
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: TTL, grace_seconds: int) -> Any:
+        started = time.monotonic()
+        value = await fetch()
+        if isinstance(value, ShortLivedValue):
+            logger.warning(f"대체 응답으로 만든 값은 짧게 캐시: {key}")
+            value, ttl = value.value, settings.CACHE_STALE_RESULT_TTL_SECONDS
+        await self.set(key, value, ttl, grace_seconds, delta=time.monotonic() - started)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: TTL, grace_seconds: Optional[int] = None, delta: float = 0.0):
+        """
+        소프트 만료 시각과 함께 저장
+        :param delta: 값을 만드는 데 걸린 시간 (XFetch 조기 갱신 확률 계산용)
+        """
+        grace_seconds = settings.CACHE_STALE_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        ttl_seconds = apply_ttl_jitter(self._resolve_ttl(ttl), settings.CACHE_TTL_JITTER_SECONDS)
+        entry = {"value": value, "soft_expires_at": time.time() + ttl_seconds, "delta": round(delta, 3)}
+        try:
+            redis = await get_redis_binary_client()
+            await redis.set(key, cache_codec.encode(entry), ex=ttl_seconds + grace_seconds)
+            logger.info(f"캐시에 저장: {key}, TTL: {ttl_seconds}초 (+유예 {grace_seconds}초)")
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패: {str(e)}")
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """
+        키 단위 갱신 잠금 획득 (워커 간 하나의 워커만 갱신)
+        :return: 잠금 토큰 (다른 워커가 잡고 있으면 None)
+        """
+        token = uuid.uuid4().hex
+        redis = await get_redis_client()
+        acquired = await redis.set(f"{self.LOCK_PREFIX}:{key}", token, nx=True, ex=settings.CACHE_REFRESH_LOCK_SECONDS)
+        return token if acquired else None
+
+    def _get_release_script(self, redis):
+        # 스크립트는 클라이언트당 한 번만 등록 (재연결로 클라이언트가 바뀌면 다시 등록)
+        if self._release_script is None or self._release_script.registered_client is not redis:
+            self._release_script = redis.register_script(RELEASE_LOCK_SCRIPT)
+        return self._release_script
+
+    async def _release_lock(self, key: str, token: str):
+        # 잠금 시간이 지나 다른 워커가 잡은 잠금은 해제하지 않음
+        try:
+            redis = await get_redis_client()
+            await self._get_release_script(redis)(keys=[f"{self.LOCK_PREFIX}:{key}"], args=[token])
+        except Exception as e:
+            logger.warning(f"캐시 갱신 잠금 해제 실패: {str(e)}")
+
+    async def _rebuild(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: TTL, grace_seconds: int) -> Any:
+        """캐시가 없을 때 재생성 (다른 워커가 재생성 중이면 저장될 때까지 대기)"""
+        try:
+            token = await self._acquire_lock(key)
+        except Exception as e:
+            logger.warning(f"캐시 재생성 잠금 실패, 직접 조회: {str(e)}")
+            return await self._fetch_and_store(key, fetch, ttl, grace_seconds)
+
+        if token is None:
+            value = await self._wait_for_rebuild(key)
+            if value is not _MISSING:
+                return value
+            logger.warning(f"다른 워커의 캐시 재생성 대기 시간 초과, 직접 조회: {key}")
+            return await self._fetch_and_store(key, fetch, ttl, grace_seconds)
+
+        try:
+            return await self._fetch_and_store(key, fetch, ttl, grace_seconds)
+        finally:
+            await self._release_lock(key, token)
+
+    async def _wait_for_rebuild(self, key: str) -> Any:
+        deadline = time.monotonic() + settings.CACHE_REBUILD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_REBUILD_POLL_SECONDS)
+            try:
+                redis = await get_redis_binary_client()
+                entry = self._parse_entry(await redis.get(key))
+            except Exception as e:
+                logger.warning(f"캐시 재생성 대기 중 조회 실패: {str(e)}")
+                return _MISSING
+            if entry is not None:
+                logger.info(f"다른 워커가 재생성한 캐시 조회: {key}")
+                return entry["value"]
+        return _MISSING
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: TTL, grace_seconds: int):
+        # 워커 내에서는 키당 하나의 갱신 작업만 실행
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._refresh(key, fetch, ttl, grace_seconds))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: TTL, grace_seconds: int):
+        try:
+            token = await self._acquire_lock(key)
+        except Exception as e:
+            logger.warning(f"캐시 갱신 잠금 실패: {str(e)}")
+            return
+        if token is None:
+            return
+
+        try:
+            await self._fetch_and_store(key, fetch, ttl, grace_seconds)
+        except Exception as e:
+            # 갱신 실패 시 하드 만료 전까지 기존 값 계속 제공
+            logger.warning(f"백그라운드 캐시 갱신 실패: {key}, {str(e)}")
+        finally:
+            await self._release_lock(key, token)
+
+# 전역 stale-while-revalidate 캐시
+swr_cache = StaleWhileRevalidateCache()
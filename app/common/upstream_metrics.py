@@ -0,0 +1,120 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlparse
+from app.common.stats import nearest_rank_percentile
+
+# 응답 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 백분위수 계산용 최근 표본 수
+RECENT_SAMPLE_SIZE = 1000
+
+class EndpointMetrics:
+    """업스트림 엔드포인트 1개의 호출 지표"""
+    def __init__(self):
+        self.requests = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.recent_latencies: Deque[float] = deque(maxlen=RECENT_SAMPLE_SIZE)
+        self.payload_bytes_sum = 0
+        self.payload_bytes_max = 0
+        self.outcomes: Dict[str, int] = {}
+        self.keys: Dict[str, int] = {}
+        self.events: Dict[str, int] = {}
+
+    def observe(self, latency: float, payload_bytes: int, key_index: Optional[int]):
+        self.requests += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.recent_latencies.append(latency)
+
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.latency_buckets[i] += 1
+                break
+        else:
+            self.latency_buckets[-1] += 1
+
+        self.payload_bytes_sum += payload_bytes
+        self.payload_bytes_max = max(self.payload_bytes_max, payload_bytes)
+
+        if key_index is not None:
+            key = str(key_index)
+            self.keys[key] = self.keys.get(key, 0) + 1
+
+    def _percentile(self, percentile: float) -> Optional[float]:
+        value = nearest_rank_percentile(self.recent_latencies, percentile)
+        return round(value, 4) if value is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        # 히스토그램은 누적 값으로 표시 (le = 이하)
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(list(LATENCY_BUCKETS) + ["+Inf"], self.latency_buckets):
+            cumulative += count
+            histogram[f"le_{bound}"] = cumulative
+
+        return {
+            "requests": self.requests,
+            "latency": {
+                "avg": round(self.latency_sum / self.requests, 4) if self.requests else None,
+                "max": round(self.latency_max, 4),
+                "p50": self._percentile(50),
+                "p95": self._percentile(95),
+                "p99": self._percentile(99),
+                "histogram": histogram,
+            },
+            "payload_bytes": {
+                "avg": self.payload_bytes_sum // self.requests if self.requests else None,
+                "max": self.payload_bytes_max,
+                "total": self.payload_bytes_sum,
+            },
+            "outcomes": dict(self.outcomes),
+            "keys": dict(self.keys),
+            "events": dict(self.events),
+        }
+
+class UpstreamMetrics:
+    """
+    업스트림(공공데이터포털) 호출 지표 수집기
+    엔드포인트(URL 경로)별 응답 시간, 응답 크기, 결과 코드, 서비스 키 사용 횟수를 기록함
+    워커 프로세스 단위로 메모리에 보관
+    """
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self.started_at = time.time()
+
+    def _get(self, url: str) -> EndpointMetrics:
+        endpoint = urlparse(url).path or url
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self._endpoints[endpoint] = metrics
+        return metrics
+
+    def observe_request(self, url: str, latency: float, payload_bytes: int, key_index: Optional[int] = None):
+        """요청 1회의 응답 시간/크기 기록"""
+        self._get(url).observe(latency, payload_bytes, key_index)
+
+    def record_outcome(self, url: str, outcome: str):
+        """
+        요청 결과 기록
+        :param outcome: 결과 코드 (00, 03, 22 ...) 또는 오류 종류 (http_502, ConnectTimeout ...)
+        """
+        outcomes = self._get(url).outcomes
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def record_event(self, url: str, event: str):
+        """재시도, 대체 응답 사용 등 이벤트 기록"""
+        events = self._get(url).events
+        events[event] = events.get(event, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": int(time.time() - self.started_at),
+            "endpoints": {endpoint: metrics.to_dict() for endpoint, metrics in self._endpoints.items()},
+        }
+
+# 전역 업스트림 지표 수집기
+upstream_metrics = UpstreamMetrics()
@@ -8,12 +8,25 @@ logger = logging.getLogger()
 class RedisClient:
     _instance: Optional['RedisClient'] = None
     _client: Optional[redis.Redis] = None
+    _binary_client: Optional[redis.Redis] = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
+    def _create_client(self, decode_responses: bool) -> redis.Redis:
+        return redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB,
+            decode_responses=decode_responses,
+            socket_timeout=5,
+            socket_connect_timeout=5,
+            encoding='utf-8',
+        )
+
     async def get_client(self) -> redis.Redis:
         if self._client is None:
             try:
@@ -21,16 +34,7 @@ class RedisClient:
                 port = settings.REDIS_PORT
                 db = settings.REDIS_DB
 
-                self._client = redis.Redis(
-                    host=host,
-                    port=port,
-                    password=settings.REDIS_PASSWORD,
-                    db=db,
-                    decode_responses=True,
-                    socket_timeout=5,
-                    socket_connect_timeout=5,
-                    encoding='utf-8',
-                )
+                self._client = self._create_client(decode_responses=True)
                 
                 # 연결 테스트
                 await self._client.ping()
@@ -42,15 +46,37 @@ class RedisClient:
                 raise
                 
         return self._client
+
+    async def get_binary_client(self) -> redis.Redis:
+        """
+        바이트 그대로 주고받는 클라이언트 (decode_responses 비활성화)
+        cache_codec으로 인코딩한 캐시 값 저장/조회용
+        """
+        if self._binary_client is None:
+            try:
+                self._binary_client = self._create_client(decode_responses=False)
+                await self._binary_client.ping()
+            except Exception as e:
+                logger.error(f"Redis 연결 실패: {str(e)}")
+                self._binary_client = None
+                raise
+
+        return self._binary_client
     
     async def close(self):
         """Redis 연결 종료"""
         if self._client:
             await self._client.close()
             self._client = None
+        if self._binary_client:
+            await self._binary_client.close()
+            self._binary_client = None
 
 # 전역 Redis 클라이언트
 redis_client = RedisClient()
 
 async def get_redis_client() -> redis.Redis:
-    return await redis_client.get_client()
\ No newline at end of file
+    return await redis_client.get_client()
+
+async def get_redis_binary_client() -> redis.Redis:
+    return await redis_client.get_binary_client()
\ No newline at end of file
@@ -1,6 +1,11 @@
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app.common.cache_on_startup import initialize_hourly_cache, initialize_weekly_cache
+from app.core.config import settings
+from app.services.weather_service import flush_uv_area_counts, prewarm_previous_weather, prewarm_uv_index
+from app.services.air_quality_station_catalog import air_quality_station_catalog
+from app.services.air_quality_snapshot import air_quality_snapshot
 from app.config.logging_config import get_logger
 
 class AirQualityScheduler:
@@ -31,6 +36,48 @@ class AirQualityScheduler:
             id="weekly_cache_update", 
             name="주간별 대기질 캐시 갱신"
         )
+
+        # 측정소 목록 갱신: 매일 새벽 3시
+        if settings.AIRQUALITY_LOCAL_STATION_INDEX_ENABLED:
+            self.scheduler.add_job(
+                func=self._refresh_station_catalog,
+                trigger=CronTrigger(hour=3, minute=0),
+                id="station_catalog_refresh",
+                name="대기질 측정소 목록 갱신"
+            )
+
+        # 실시간 측정값 스냅샷 갱신: 매시 (측정값 공개 이후)
+        if settings.AIRQUALITY_SNAPSHOT_ENABLED:
+            self.scheduler.add_job(
+                func=self._refresh_air_quality_snapshot,
+                trigger=CronTrigger(minute=settings.AIRQUALITY_SNAPSHOT_MINUTE),
+                id="air_quality_snapshot_refresh",
+                name="실시간 대기질 측정값 갱신"
+            )
+
+        # 어제 관측 기온 미리 조회: 매일 1회 (전체 ASOS 관측소)
+        if settings.WEATHER_PREV_PREWARM_ENABLED:
+            self.scheduler.add_job(
+                func=self._prewarm_previous_weather,
+                trigger=CronTrigger(hour=settings.WEATHER_PREV_PREWARM_HOUR, minute=settings.WEATHER_PREV_PREWARM_MINUTE),
+                id="previous_weather_prewarm",
+                name="어제 관측 기온 미리 조회"
+            )
+
+        # 자외선 지수 미리 조회: 발표 시각마다 조회가 많은 지역
+        if settings.WEATHER_UV_PREWARM_TOP_AREAS > 0:
+            self.scheduler.add_job(
+                func=self._prewarm_uv_index,
+                trigger=CronTrigger(hour=settings.WEATHER_UV_ISSUE_HOURS, minute=settings.WEATHER_UV_AVAILABLE_DELAY_MINUTES),
+                id="uv_index_prewarm",
+                name="자외선 지수 미리 조회"
+            )
+            self.scheduler.add_job(
+                func=self._flush_uv_area_counts,
+                trigger=IntervalTrigger(seconds=settings.WEATHER_UV_AREA_FLUSH_SECONDS),
+                id="uv_area_counts_flush",
+                name="자외선 지수 조회 지역 기록"
+            )
     
     async def _update_hourly_cache(self):
         """시간별 캐시 갱신 작업"""
@@ -50,6 +97,44 @@ class AirQualityScheduler:
         except Exception as e:
             self.logger.error(f"주간별 캐시 갱신 실패: {str(e)}")
     
+    async def _refresh_station_catalog(self):
+        """측정소 목록 갱신 작업"""
+        try:
+            self.logger.info("측정소 목록 갱신 시작")
+            await air_quality_station_catalog.refresh()
+        except Exception as e:
+            self.logger.error(f"측정소 목록 갱신 실패: {str(e)}")
+    
+    async def _refresh_air_quality_snapshot(self):
+        """실시간 측정값 스냅샷 갱신 작업"""
+        try:
+            await air_quality_snapshot.refresh()
+        except Exception as e:
+            self.logger.error(f"실시간 측정값 갱신 실패: {str(e)}")
+    
+    async def _prewarm_previous_weather(self):
+        """어제 관측 기온 미리 조회 작업"""
+        try:
+            self.logger.info("어제 관측 기온 미리 조회 시작")
+            await prewarm_previous_weather()
+        except Exception as e:
+            self.logger.error(f"어제 관측 기온 미리 조회 실패: {str(e)}")
+    
+    async def _prewarm_uv_index(self):
+        """자외선 지수 미리 조회 작업"""
+        try:
+            self.logger.info("자외선 지수 미리 조회 시작")
+            await prewarm_uv_index()
+        except Exception as e:
+            self.logger.error(f"자외선 지수 미리 조회 실패: {str(e)}")
+    
+    async def _flush_uv_area_counts(self):
+        """자외선 지수 지역별 조회 수 기록 작업"""
+        try:
+            await flush_uv_area_counts()
+        except Exception as e:
+            self.logger.error(f"자외선 지수 조회 지역 기록 실패: {str(e)}")
+    
     def start(self):
         """스케줄러 시작"""
         if self.scheduler.running:
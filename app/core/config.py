@@ -29,9 +29,91 @@ class Settings(BaseSettings):
     # SSL
     SSL_VERIFY: bool = True
 
+    # Upstream HTTP Client
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = False
+    UPSTREAM_SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Upstream Circuit Breaker
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 open
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = 30.0  # open 유지 후 half-open 시험 호출
+    UPSTREAM_STALE_FALLBACK_ENABLED: bool = True  # 장애 시 마지막 정상 응답 사용
+    UPSTREAM_STALE_TTL_SECONDS: int = 60 * 60 * 6
+    UPSTREAM_STALE_SAVE_INTERVAL_SECONDS: int = 300  # 같은 요청의 정상 응답은 이 간격으로만 저장
+
+    # Upstream Hedged Request
+    UPSTREAM_HEDGING_ENABLED: bool = False
+    UPSTREAM_HEDGE_PERCENTILE: float = 95.0  # 이 백분위 지연을 넘으면 헤지 요청
+    UPSTREAM_HEDGE_MIN_DELAY_SECONDS: float = 0.2
+    UPSTREAM_HEDGE_MIN_SAMPLES: int = 20  # 표본이 이보다 적으면 헤지 안 함
+    UPSTREAM_HEDGE_SAMPLE_SIZE: int = 200
+    UPSTREAM_HEDGE_BUDGET_RATIO: float = 0.05  # 전체 요청 대비 헤지 요청 비율 상한
+    UPSTREAM_HEDGE_BUDGET_BURST: float = 5.0
+
+    # Upstream Retry
+    UPSTREAM_RETRY_MAX_ATTEMPTS: int = 3  # 최초 요청 포함
+    UPSTREAM_RETRY_BASE_DELAY_SECONDS: float = 0.2
+    UPSTREAM_RETRY_MAX_DELAY_SECONDS: float = 2.0
+    UPSTREAM_RETRY_BUDGET_RATIO: float = 0.1  # 전체 요청 대비 재시도 비율 상한
+    UPSTREAM_RETRY_BUDGET_BURST: float = 10.0
+
+    # Upstream Metrics
+    UPSTREAM_METRICS_API_ENABLED: bool = False  # /metrics/upstream 노출 여부 (서비스 키 사용 현황 포함, 내부 확인/벤치마크용)
+
+    # Cache (stale-while-revalidate)
+    CACHE_SWR_ENABLED: bool = True  # 만료된 값을 바로 반환하고 백그라운드에서 갱신
+    CACHE_STALE_GRACE_SECONDS: int = 600  # 소프트 만료 후 만료된 값을 제공할 시간
+    CACHE_REFRESH_LOCK_SECONDS: int = 30  # 갱신/재생성 잠금 유지 시간
+    CACHE_TTL_JITTER_SECONDS: int = 60  # 만료 시각 분산 (0 ~ N초 추가)
+    CACHE_XFETCH_BETA: float = 1.0  # 조기 갱신 강도 (0이면 사용 안 함)
+    CACHE_REBUILD_WAIT_SECONDS: float = 5.0  # 다른 워커가 재생성 중일 때 기다리는 최대 시간
+    CACHE_REBUILD_POLL_SECONDS: float = 0.1
+    CACHE_STALE_RESULT_TTL_SECONDS: int = 60  # 장애 대체 응답으로 만든 값은 이 시간만 캐시
+
+    # Cache Codec
+    CACHE_CODEC_FORMAT: str = "json"  # json(orjson) | msgpack
+    CACHE_CODEC_COMPRESSION: str = "zlib"  # none | zlib | zstd | lz4
+    CACHE_CODEC_COMPRESSION_LEVEL: int = 3
+    CACHE_CODEC_COMPRESS_MIN_BYTES: int = 1024  # 이보다 작은 값은 압축하지 않음
+
+    # Astronomy
+    ASTRONOMY_SUN_SOURCE: str = "local"  # local(직접 계산) | kasi(한국천문연구원 API)
+
+    # Previous Weather (ASOS)
+    WEATHER_PREV_PREWARM_ENABLED: bool = True  # 매일 전체 관측소 어제 기온 미리 조회
+    WEATHER_PREV_PREWARM_HOUR: int = 1
+    WEATHER_PREV_PREWARM_MINUTE: int = 10
+    WEATHER_PREV_PREWARM_CONCURRENCY: int = 4  # 미리 조회 시 동시 요청 수
+
+    # Air Quality Station Catalog
+    AIRQUALITY_LOCAL_STATION_INDEX_ENABLED: bool = True  # 근접측정소 API 대신 로컬 측정소 목록 사용
+    AIRQUALITY_NEARBY_STATION_COUNT: int = 3  # 가까운 측정소 조회 개수
+    AIRQUALITY_STATION_CATALOG_RELOAD_SECONDS: int = 3600  # 워커가 Redis에서 측정소 목록을 다시 읽는 주기
+
+    # Air Quality Realtime Snapshot
+    AIRQUALITY_SNAPSHOT_ENABLED: bool = True  # 시도별 실시간 측정값을 매시 저장해두고 사용
+    AIRQUALITY_SNAPSHOT_MINUTE: int = 15  # 매시 갱신 시각 (분, 측정값 공개 이후)
+    AIRQUALITY_SNAPSHOT_MAX_AGE_HOURS: int = 24  # 이보다 오래된 측정값은 사용하지 않음
+    AIRQUALITY_SNAPSHOT_CONCURRENCY: int = 4  # 시도별 조회 동시 요청 수
+
+    # UV Index
+    WEATHER_UV_ISSUE_HOURS: str = "6,18"  # 자외선 지수 발표 시각 (쉼표로 구분)
+    WEATHER_UV_AVAILABLE_DELAY_MINUTES: int = 20  # 발표 후 조회 가능해지는 시간
+    WEATHER_UV_PREWARM_TOP_AREAS: int = 50  # 발표 직후 미리 조회할 인기 지역 수 (0이면 사용 안 함)
+    WEATHER_UV_PREWARM_CONCURRENCY: int = 4  # 자외선 지수 미리 조회 시 동시 요청 수
+    WEATHER_UV_AREA_FLUSH_SECONDS: int = 60  # 지역별 조회 수를 워커 메모리에 모아 Redis에 기록하는 주기
+
     # GOV API INFO
     GOV_DATA_API_KEY_1: str = ""
     GOV_DATA_API_KEY_2: str = ""
+    GOV_DATA_API_KEYS: str = ""  # 추가 서비스 키 (쉼표로 구분)
+    GOV_DATA_API_DAILY_LIMIT: int = 10000  # 키별 일일 호출 한도
+    SERVICE_KEY_COOLDOWN_SECONDS: int = 600  # 서비스키 에러 발생 시 제외 시간
+    SERVICE_KEY_STATE_CACHE_SECONDS: float = 1.0  # 서비스 키 상태(호출 수/제외 키) 워커 로컬 캐시 시간
     GOV_DATA_BASE_URL: str = "https://apis.data.go.kr"
     
     # Weather API URL
@@ -48,7 +130,9 @@ class Settings(BaseSettings):
     
     # Air Quality API URL
     GOV_DATA_AIRQUALITY_NEARSATIONS_URL: str = ""
+    GOV_DATA_AIRQUALITY_STATION_LIST_URL: str = ""
     GOV_DATA_AIRQUALITY_STATION_URL: str = ""
+    GOV_DATA_AIRQUALITY_SIDO_URL: str = ""
     GOV_DATA_AIRQUALITY_HOURLY_URL: str = ""
     GOV_DATA_AIRQUALITY_WEEKLY_URL: str = ""
 
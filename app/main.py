@@ -8,6 +8,7 @@ from app.config.context import request_id, client_ip, user_agent
 from app.common.cache_on_startup import initialize_cache_on_startup
 from app.config.redis_config import redis_client
 from app.core.air_quality_schedule import air_quality_scheduler
+from app.common.http_client import init_http_client, close_http_client
 import time
 import uuid
 
@@ -26,6 +27,9 @@ logger = get_logger()
 async def lifespan(app: FastAPI):
     global scheduler
     try:
+        logger.info("서버 시작 - HTTP 클라이언트 생성")
+        await init_http_client()
+
         logger.info("서버 시작 - 캐시 초기화 시작")
         await initialize_cache_on_startup()
         logger.info("서버 시작 - 캐시 초기화 완료")
@@ -42,6 +46,9 @@ async def lifespan(app: FastAPI):
     logger.info("스케줄러 종료")
     air_quality_scheduler.shutdown()
 
+    logger.info("서버 종료 - HTTP 클라이언트 정리")
+    await close_http_client()
+
     logger.info("서버 종료 - Redis 정리")
     await redis_client.close()
 
@@ -65,6 +72,10 @@ app = FastAPI(
             "name": "commons",
             "description": "공통 API (헬스 체크 등)",
         },
+        {
+            "name": "metrics",
+            "description": "업스트림 호출 지표 API",
+        },
     ],
 )
 
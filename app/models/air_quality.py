@@ -13,11 +13,17 @@ class WeeklyForecast(BaseModel):
     air_quality_score: int
 
 class HourlyAirQualityCache(BaseModel):
-    """시간별 대기질 캐시 모델 (12시간)"""
+    """
+    시간별 대기질 캐시 모델 (12시간)
+    forecasts: 발표("YYYY-MM-DD HH") -> 예보 일자("YYYY-MM-DD") -> 지역 -> {"pm10_grade", "pm25_grade"}
+    """
     forecasts: Dict[str, Any]
     cached_at: str
 
 class WeeklyAirQualityCache(BaseModel):
-    """주간별 대기질 캐시 모델 (5일)"""
+    """
+    주간별 대기질 캐시 모델 (5일)
+    forecasts: [{"base_date": "YYYYMMDD", "regions": {지역: {"korean_standard": 점수, "who_standard": 점수}}}]
+    """
     forecasts: List[Dict[str, Any]]
     cached_at: str
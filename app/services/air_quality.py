@@ -1,6 +1,7 @@
 import asyncio
+import re
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from fastapi import HTTPException
 from app.utils.convert_for_tm import convert_wgs84_to_katec
@@ -10,6 +11,8 @@ from app.common.http_client import make_request
 from app.utils.airquality_calculator import calculate_individual_air_quality_score
 from app.utils.convert_for_region import convert_lat_lon_for_region
 from app.services.cache_service import AirQualityCacheService
+from app.services.air_quality_station_catalog import air_quality_station_catalog
+from app.services.air_quality_snapshot import air_quality_snapshot
 from app.models.air_quality import HourlyAirQualityCache, WeeklyAirQualityCache
 from app.utils.airquality_calculator import convert_grade_to_value_for_hour, convert_grade_to_value_for_week
 from app.config.logging_config import get_logger
@@ -54,6 +57,10 @@ async def find_nearby_air_quality_station(lat: float, lon: float) -> Optional[Li
     
     tmx, tmy = convert_wgs84_to_katec(lat, lon)
 
+    # 로컬 측정소 목록이 있으면 근접측정소 API 호출 없이 검색
+    if settings.AIRQUALITY_LOCAL_STATION_INDEX_ENABLED and await air_quality_station_catalog.ensure_loaded():
+        return air_quality_station_catalog.find_nearest(tmx, tmy, settings.AIRQUALITY_NEARBY_STATION_COUNT)
+
     url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_AIRQUALITY_NEARSATIONS_URL}"
     
     params = {
@@ -65,7 +72,7 @@ async def find_nearby_air_quality_station(lat: float, lon: float) -> Optional[Li
     
     try:
         response = await make_request(url=url, params=params)
-        data = response.json()
+        data = response.data
         
         # 응답 확인
         items = data.get("response", {}).get("body", {}).get("items", [])
@@ -87,6 +94,18 @@ async def find_nearby_air_quality_station(lat: float, lon: float) -> Optional[Li
         logger.error(f"예상치 못한 측정소 조회 오류: {str(e)}")
         return None
 
+def _build_air_quality_result(pm10: int, pm25: int, air_quality_type: str) -> Dict[str, Any]:
+    pm10_grade, pm25_grade = calculate_individual_air_quality_score(pm10, pm25, air_quality_type)
+    worse_grade = max(pm10_grade, pm25_grade)
+    
+    return {
+        "pm10_value": pm10,
+        "pm10_grade": pm10_grade,
+        "pm25_value": pm25,
+        "pm25_grade": pm25_grade,
+        "air_quality_grade": worse_grade,
+    }
+
 async def get_air_quality_data(stations: List[str], air_quality_type: str = 'korean') -> Dict[str, Any]:
     """
     측정소명 리스트로 미세먼지 데이터 조회 (순차적으로 시도)
@@ -94,6 +113,18 @@ async def get_air_quality_data(stations: List[str], air_quality_type: str = 'kor
     :param air_quality_type: 대기질 기준 (korean/who)
     :return: 미세먼지 데이터
     """
+    # 시도별 실시간 측정값 스냅샷에서 먼저 조회 (가까운 측정소부터, 유효값이 없으면 다음 측정소)
+    if settings.AIRQUALITY_SNAPSHOT_ENABLED:
+        try:
+            measurements = await air_quality_snapshot.get_measurements(stations)
+            for station_name in stations:
+                measurement = measurements.get(station_name)
+                if measurement is not None:
+                    return _build_air_quality_result(measurement["pm10"], measurement["pm25"], air_quality_type)
+            logger.info(f"실시간 측정값 스냅샷에 유효한 데이터가 없음, 측정소별 조회: {stations}")
+        except Exception as e:
+            logger.warning(f"실시간 측정값 스냅샷 조회 실패, 측정소별 조회: {str(e)}")
+
     # 미세먼지 API URL
     url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_AIRQUALITY_STATION_URL}"
     
@@ -110,7 +141,7 @@ async def get_air_quality_data(stations: List[str], air_quality_type: str = 'kor
         
         try:
             response = await make_request(url=url, params=params)
-            data = response.json()
+            data = response.data
             
             # 응답 확인
             items = data.get("response", {}).get("body", {}).get("items", [])
@@ -179,17 +210,7 @@ async def get_air_quality_data(stations: List[str], air_quality_type: str = 'kor
                 continue
             
             # 유효한 데이터를 찾았으므로 결과 반환
-            pm10_grade, pm25_grade = calculate_individual_air_quality_score(pm10, pm25, air_quality_type)
-            worse_grade = max(pm10_grade, pm25_grade)
-            
-            results = {
-                "pm10_value": pm10,
-                "pm10_grade": pm10_grade,
-                "pm25_value": pm25,
-                "pm25_grade": pm25_grade,
-                "air_quality_grade": worse_grade,
-            }
-            return results
+            return _build_air_quality_result(pm10, pm25, air_quality_type)
             
         except Exception as e:
             logger.info(f"측정소 '{station_name}' 조회 중 오류 발생: {str(e)}, 다음 측정소 시도")
@@ -208,6 +229,69 @@ async def get_air_quality_data(stations: List[str], air_quality_type: str = 'kor
     }
     return results
 
+# 시간별 대기질 예보 발표 시각 (발표 30분 후부터 사용)
+HOURLY_AIR_QUALITY_ISSUE_HOURS = [5, 11, 17, 23]
+# dataTime 예: "2025-07-19 11시 발표"
+_DATA_TIME_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})\s*(\d{1,2})시")
+_INFORM_CODE_FIELDS = {"PM10": "pm10_grade", "PM25": "pm25_grade"}
+# 지역 정보가 없을 때 (기존 "정보없음" -> 보통과 동일)
+_DEFAULT_HOURLY_GRADES = {"pm10_grade": 2, "pm25_grade": 2}
+
+def get_hourly_air_quality_issuance(now: datetime) -> Tuple[str, int]:
+    """
+    현재 사용할 시간별 대기질 예보 발표
+    :param now: 기준 시각
+    :return: (발표 일자 YYYY-MM-DD, 발표 시각)
+    """
+    for hour in reversed(HOURLY_AIR_QUALITY_ISSUE_HOURS):
+        if (now.hour, now.minute) >= (hour, 30):
+            return now.strftime("%Y-%m-%d"), hour
+    # 05:30 이전에는 전날 23시 발표 사용
+    return (now - timedelta(days=1)).strftime("%Y-%m-%d"), HOURLY_AIR_QUALITY_ISSUE_HOURS[-1]
+
+def parse_region_grades(data_str: str) -> Dict[str, str]:
+    """
+    지역별 등급 문자열 파싱
+    "서울 : 좋음,제주 : 보통" -> {"서울": "좋음", "제주": "보통"}
+    """
+    grades = {}
+    for region_data in (data_str or "").split(","):
+        parts = region_data.split(":")
+        if len(parts) >= 2:
+            grades[parts[0].strip()] = parts[1].strip()
+    return grades
+
+def build_hourly_air_quality_table(raw_data: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Dict[str, int]]]]:
+    """
+    시간별 대기질 원본 응답을 조회용 표로 변환 (캐시 저장용)
+    발표("YYYY-MM-DD HH") -> 예보 일자("YYYY-MM-DD") -> 지역 -> {"pm10_grade", "pm25_grade"}
+    요청마다 원본 항목을 훑고 지역 문자열을 파싱하지 않도록 저장 시점에 한 번만 처리
+    """
+    table: Dict[str, Dict[str, Dict[str, Dict[str, int]]]] = {}
+    items = raw_data.get("response", {}).get("body", {}).get("items", []) or []
+    for item in items:
+        match = _DATA_TIME_PATTERN.search(item.get("dataTime", ""))
+        field = _INFORM_CODE_FIELDS.get(item.get("informCode"))
+        forecast_date = item.get("informData")
+        if not match or field is None or not forecast_date:
+            continue
+
+        issuance = f"{match.group(1)} {int(match.group(2)):02d}"
+        regions = table.setdefault(issuance, {}).setdefault(forecast_date, {})
+        for region, grade in parse_region_grades(item.get("informGrade")).items():
+            regions.setdefault(region, dict(_DEFAULT_HOURLY_GRADES))[field] = convert_grade_to_value_for_hour(grade)
+    return table
+
+def _find_region(regions: Dict[str, Any], target_region: str, default: Any) -> Any:
+    value = regions.get(target_region)
+    if value is not None:
+        return value
+    # 이름이 정확히 일치하지 않으면 기존 parse_region_data와 같은 규칙으로 검색
+    for region, value in regions.items():
+        if target_region and target_region in region:
+            return value
+    return default
+
 async def get_hourly_air_quality(lat: float, lon: float, hours: int = 12) -> Dict[str, Any]:
     cached_data = await AirQualityCacheService().get_hourly_cache()
     if cached_data:
@@ -216,108 +300,43 @@ async def get_hourly_air_quality(lat: float, lon: float, hours: int = 12) -> Dic
     else:
         logger.info("캐시된 시간별 대기질 데이터가 없습니다. API에서 조회합니다.")
         
-        now = datetime.now()
-        param_date = now.strftime("%Y-%m-%d")
-        raw_data = await fetch_hourly_air_quality_raw(param_date)
+        search_date, _ = get_hourly_air_quality_issuance(datetime.now())
+        table = build_hourly_air_quality_table(await fetch_hourly_air_quality_raw(search_date))
         cache_data = HourlyAirQualityCache(
-            forecasts=raw_data,
+            forecasts=table,
             cached_at=datetime.now().isoformat()
         )
         await AirQualityCacheService().set_hourly_cache(cache_data)
         
-        return process_air_quality_data(raw_data, lat, lon, hours)
+        return process_air_quality_data(table, lat, lon, hours)
     
-def process_air_quality_data(raw_data: Dict[str, Any], lat: float, lon: float, hours: int) -> Dict[str, Any]:
-    """시간별 대기질 데이터 가공 (캐시/API 공통 사용)"""
+def process_air_quality_data(table: Dict[str, Any], lat: float, lon: float, hours: int) -> Dict[str, Any]:
+    """
+    시간별 대기질 데이터 가공 (캐시/API 공통 사용)
+    :param table: build_hourly_air_quality_table로 만든 발표/일자/지역별 등급 표
+    """
     now = datetime.now()
-    current_hour = now.hour
-    current_minute = now.minute
-    region_data = convert_lat_lon_for_region(lat, lon)
-    region = region_data.get("subregion")
-
-    forecast_time = [5, 11, 17, 23]
-    closest_time = None
-    param_date = None
+    region = convert_lat_lon_for_region(lat, lon).get("subregion")
 
-    if current_hour < 5 or (current_hour == 5 and current_minute < 30):
-        closest_time = 23
-        param_date = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    else:
-        # 현재 시간 기준으로 가장 최근 발표 시간 찾기
-        for time in reversed(forecast_time):
-            if time == current_hour and current_minute < 30:
-                continue
-            if time <= current_hour:
-                closest_time = time
-                break
-        
-        if closest_time is None:
-            closest_time = 23
-            param_date = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-        else:
-            param_date = now.strftime("%Y-%m-%d")
-
-    items = raw_data.get("response", {}).get("body", {}).get("items", [])
-    if not items:
+    if not table:
         logger.info("대기질 예보 데이터가 없습니다.")
         return {'forecasts': []}
-        
-    closest_time_str = f"{closest_time}시 발표"
-    
-    today_pm10 = None
-    tomorrow_pm10 = None
-    today_pm25 = None
-    tomorrow_pm25 = None
-    
-    for item in items:
-        if closest_time_str in item.get("dataTime", ""):
-            if item.get("informCode") == "PM10":
-                if item.get("informData") == param_date:
-                    today_pm10 = item
-                elif item.get("informData") == (now + timedelta(days=1)).strftime("%Y-%m-%d"):
-                    tomorrow_pm10 = item
-            elif item.get("informCode") == "PM25":
-                if item.get("informData") == param_date:
-                    today_pm25 = item
-                elif item.get("informData") == (now + timedelta(days=1)).strftime("%Y-%m-%d"):
-                    tomorrow_pm25 = item
-    
-    if not today_pm10 or not today_pm25:
+
+    issue_date, issue_hour = get_hourly_air_quality_issuance(now)
+    days = table.get(f"{issue_date} {issue_hour:02d}", {})
+    if issue_date not in days:
         raise HTTPException(status_code=404, detail="오늘 대기질 예보 데이터를 찾을 수 없습니다.")
-    
+
     forecasts = []
-    start_hour = current_hour + 1
-    
-    for i in range(hours):
-        forecast_hour = (start_hour + i) % 24
-        forecast_date = now.date()
-        
-        if forecast_hour < start_hour and i > 0:
-            forecast_date = now.date() + timedelta(days=1)
-        
-        if forecast_date == now.date():
-            pm10_grade_str = parse_region_data(today_pm10.get("informGrade"), region)
-            pm25_grade_str = parse_region_data(today_pm25.get("informGrade"), region)
-        else:
-            # 내일 데이터가 없으면 오늘 데이터로 대체
-            if not tomorrow_pm10 or not tomorrow_pm25:
-                pm10_grade_str = parse_region_data(today_pm10.get("informGrade"), region)
-                pm25_grade_str = parse_region_data(today_pm25.get("informGrade"), region)
-            else:
-                pm10_grade_str = parse_region_data(tomorrow_pm10.get("informGrade"), region)
-                pm25_grade_str = parse_region_data(tomorrow_pm25.get("informGrade"), region) 
-    
-        pm10_grade = convert_grade_to_value_for_hour(pm10_grade_str)
-        pm25_grade = convert_grade_to_value_for_hour(pm25_grade_str)
-            
-        forecast_date_str = forecast_date.strftime("%Y%m%d")
-        forecast_hour = f"{forecast_hour:02d}00"
-        
+    base_hour = now.replace(minute=0, second=0, microsecond=0)
+    for i in range(1, hours + 1):
+        forecast_dt = base_hour + timedelta(hours=i)
+        # 예보 일자 데이터가 없으면 발표일 데이터로 대체
+        regions = days.get(forecast_dt.strftime("%Y-%m-%d"), days[issue_date])
         forecasts.append({
-            "base_date": forecast_date_str,
-            "base_time": forecast_hour,
-            "pm10_grade": pm10_grade,
-            "pm25_grade": pm25_grade
+            "base_date": forecast_dt.strftime("%Y%m%d"),
+            "base_time": forecast_dt.strftime("%H00"),
+            **_find_region(regions, region, _DEFAULT_HOURLY_GRADES),
         })
         
     return {"forecasts": forecasts}
@@ -333,35 +352,9 @@ async def get_hourly_air_quality_from_api(lat: float, lon: float, hours: int = 1
     :param hour: 시간 (0-23)
     :return: 현재 날씨 정보
     """
-
-    now = datetime.now()
-    current_hour = now.hour
-    current_minute = now.minute
-
-    forecast_time = [5, 11, 17, 23]
-    closest_time = None
-    param_date = None
-
-    if current_hour < 5 or (current_hour == 5 and current_minute < 30):
-        closest_time = 23
-        param_date = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    else:
-        # 현재 시간 기준으로 가장 최근 발표 시간 찾기
-        for time in reversed(forecast_time):
-            if time == current_hour and current_minute < 30:
-                continue
-            if time <= current_hour:
-                closest_time = time
-                break
-        
-        if closest_time is None:
-            closest_time = 23
-            param_date = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-        else:
-            param_date = now.strftime("%Y-%m-%d")
-    
+    param_date, _ = get_hourly_air_quality_issuance(datetime.now())
     raw_data = await fetch_hourly_air_quality_raw(param_date)
-    return process_air_quality_data(raw_data, lat, lon, hours)
+    return process_air_quality_data(build_hourly_air_quality_table(raw_data), lat, lon, hours)
 
 async def fetch_hourly_air_quality_raw(search_date: str) -> Dict[str, Any]:
     """
@@ -379,7 +372,7 @@ async def fetch_hourly_air_quality_raw(search_date: str) -> Dict[str, Any]:
     }
     try:
         response = await make_request(url=url, params=params)
-        data = response.json()
+        data = response.data
         return data
     except Exception as e:
         logger.error(f"시간별 대기질 원본 데이터 조회 오류: {str(e)}")
@@ -500,17 +493,12 @@ def extract_region_data_from_cache(cached_forecasts: List[Dict], lat: float, lon
     results = []
     
     try:
-        for i in range(min(days, len(cached_forecasts))):
-            forecast = cached_forecasts[i]
-            all_regions_data = forecast.get("all_regions_data", "")
-            
-            # 사용자 지역 데이터만 추출
-            region_value = parse_region_data(all_regions_data, region)
-            grade = convert_grade_to_value_for_week(region_value, air_quality_type)
-            
+        for forecast in cached_forecasts[:days]:
+            # 지역 정보가 없으면 기존과 같이 "정보없음" 점수 사용
+            scores = _find_region(forecast.get("regions", {}), region, _MISSING_WEEKLY_SCORES)
             results.append({
                 "base_date": forecast.get("base_date"),
-                "air_quality_score": grade
+                "air_quality_score": scores.get(air_quality_type)
             })
         
         return {"forecasts": results}
@@ -519,9 +507,24 @@ def extract_region_data_from_cache(cached_forecasts: List[Dict], lat: float, lon
         logger.error(f"요청된 위도 경도: ({lat}, {lon}), 지역: {region}")
         raise HTTPException(status_code=500, detail="캐시된 주간 대기질 데이터 처리 오류")
 
+# 주간 대기질 점수를 미리 계산해두는 기준
+WEEKLY_AIR_QUALITY_STANDARDS = ("korean_standard", "who_standard")
+_MISSING_WEEKLY_SCORES = {standard: convert_grade_to_value_for_week("정보없음", standard) for standard in WEEKLY_AIR_QUALITY_STANDARDS}
+
+def build_weekly_region_scores(all_regions_data: str) -> Dict[str, Dict[str, int]]:
+    """
+    전국 주간 예보 문자열을 지역별 기준별 점수로 변환
+    "서울 : 낮음, 인천 : 높음" -> {"서울": {"korean_standard": 2, "who_standard": 2}, ...}
+    """
+    return {
+        region: {standard: convert_grade_to_value_for_week(grade, standard) for standard in WEEKLY_AIR_QUALITY_STANDARDS}
+        for region, grade in parse_region_grades(all_regions_data).items()
+    }
+
 async def process_weekly_air_quality_for_cache() -> List[Dict[str, Any]]:
     """
     주간별 대기질 데이터 가공 (캐시 저장용 - 전국 지역 파싱, 7일치 완성)
+    :return: [{"base_date": "YYYYMMDD", "regions": {지역: {기준: 점수}}}]
     """
     now = datetime.now()
     today = now.date()
@@ -590,7 +593,11 @@ async def process_weekly_air_quality_for_cache() -> List[Dict[str, Any]]:
                     "all_regions_data": "정보없음"
                 }
         
-        forecasts.append(forecast)
+        # 요청마다 문자열을 파싱하지 않도록 지역별 점수로 저장
+        forecasts.append({
+            "base_date": forecast["base_date"],
+            "regions": build_weekly_region_scores(forecast["all_regions_data"]),
+        })
     
     return forecasts
 
@@ -610,7 +617,7 @@ async def fetch_weekly_air_quality_raw(search_date: str) -> Dict[str, Any]:
     }
     
     response = await make_request(url=url, params=params)
-    data = response.json()
+    data = response.data
     return data
     
 def parse_region_data(data_str, target_region):
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.config.redis_config import get_redis_binary_client
+from app.common.cache_codec import cache_codec
+from app.common.http_client import make_request
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+# 시도별 실시간 측정정보 조회 대상 (getCtprvnRltmMesureDnsty sidoName)
+SIDO_NAMES = [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주", "세종",
+]
+
+def parse_data_time(data_time: str) -> Optional[datetime]:
+    """에어코리아 측정 시각 파싱 (자정은 "YYYY-MM-DD 24:00"으로 표기됨)"""
+    try:
+        if data_time.endswith("24:00"):
+            return datetime.strptime(data_time[:10], "%Y-%m-%d") + timedelta(days=1)
+        return datetime.strptime(data_time, "%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return None
+
+def parse_measurement(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    PM10/PM2.5 값이 모두 유효한 측정값만 반환 ("-" 또는 빈 값은 통신 장애)
+    :return: {"pm10": int, "pm25": int, "data_time": "YYYY-MM-DD HH:MM"}
+    """
+    pm10_str = item.get("pm10Value", "")
+    pm25_str = item.get("pm25Value", "")
+    if not pm10_str or pm10_str == "-" or not pm25_str or pm25_str == "-":
+        return None
+    measured_at = parse_data_time(item.get("dataTime", ""))
+    if measured_at is None:
+        return None
+    try:
+        return {"pm10": int(pm10_str), "pm25": int(pm25_str), "data_time": measured_at.strftime("%Y-%m-%d %H:%M")}
+    except ValueError:
+        return None
+
+class AirQualitySnapshot:
+    """
+    측정소별 최신 미세먼지 측정값 (Redis 해시, 측정소명 -> 측정값)
+    매시 시도별 실시간 측정정보를 한 번씩 조회해서 갱신하고,
+    새 측정값이 장애("-")면 이전 유효값을 유지함 (기존 DAILY 조회의 과거 데이터 대체와 동일)
+    """
+    CACHE_KEY = "air_quality:realtime"
+
+    async def get_measurements(self, stations: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        측정소별 최신 유효 측정값 조회 (AIRQUALITY_SNAPSHOT_MAX_AGE_HOURS보다 오래된 값 제외)
+        :param stations: 측정소명 리스트
+        :return: 측정소명 -> 측정값 (없는 측정소는 제외)
+        """
+        if not stations:
+            return {}
+        redis = await get_redis_binary_client()
+        values = await redis.hmget(self.CACHE_KEY, stations)
+        oldest = datetime.now() - timedelta(hours=settings.AIRQUALITY_SNAPSHOT_MAX_AGE_HOURS)
+
+        measurements = {}
+        for station_name, value in zip(stations, values):
+            if not value:
+                continue
+            measurement = cache_codec.decode(value)
+            if datetime.strptime(measurement["data_time"], "%Y-%m-%d %H:%M") >= oldest:
+                measurements[station_name] = measurement
+        return measurements
+
+    async def refresh(self):
+        """시도별 실시간 측정정보 조회 후 측정소별 최신 유효값 저장 (스케줄러에서 매시 실행)"""
+        semaphore = asyncio.Semaphore(settings.AIRQUALITY_SNAPSHOT_CONCURRENCY)
+
+        async def fetch(sido_name: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._fetch_sido(sido_name)
+                except Exception as e:
+                    logger.warning(f"시도 '{sido_name}' 실시간 측정정보 조회 실패: {str(e)}")
+                    return []
+
+        results = await asyncio.gather(*(fetch(sido_name) for sido_name in SIDO_NAMES))
+
+        updates: Dict[str, bytes] = {}
+        for items in results:
+            for item in items:
+                station_name = item.get("stationName")
+                measurement = parse_measurement(item)
+                # 장애 측정값은 저장하지 않아 이전 유효값이 유지됨
+                if station_name and measurement is not None:
+                    updates[station_name] = cache_codec.encode(measurement)
+
+        if not updates:
+            logger.warning("저장할 실시간 측정값이 없습니다.")
+            return
+
+        redis = await get_redis_binary_client()
+        await redis.hset(self.CACHE_KEY, mapping=updates)
+        # 한동안 갱신되지 않으면 해시 전체 만료 (폐쇄 측정소 정리)
+        await redis.expire(self.CACHE_KEY, settings.AIRQUALITY_SNAPSHOT_MAX_AGE_HOURS * 3600)
+        logger.info(f"실시간 측정값 갱신 완료: {len(updates)}개 측정소")
+
+    async def ensure_loaded(self):
+        """스냅샷이 없으면 바로 갱신 (서버 시작 시)"""
+        redis = await get_redis_binary_client()
+        if not await redis.exists(self.CACHE_KEY):
+            await self.refresh()
+
+    async def _fetch_sido(self, sido_name: str) -> List[Dict[str, Any]]:
+        url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_AIRQUALITY_SIDO_URL}"
+        params = {
+            "returnType": "json",
+            "numOfRows": 1000,
+            "pageNo": 1,
+            "sidoName": sido_name,
+            "ver": "1.0",
+        }
+        response = await make_request(url=url, params=params)
+        return response.data.get("response", {}).get("body", {}).get("items", []) or []
+
+# 전역 실시간 측정값 스냅샷
+air_quality_snapshot = AirQualitySnapshot()
@@ -0,0 +1,140 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import numpy as np
+from app.core.config import settings
+from app.config.redis_config import get_redis_binary_client
+from app.common.cache_codec import cache_codec
+from app.common.http_client import make_request
+from app.common.single_flight import SingleFlight
+from app.utils.convert_for_tm import convert_wgs84_to_katec
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+class AirQualityStationCatalog:
+    """
+    에어코리아 측정소 목록 + 최근접 측정소 검색
+    측정소 목록(getMsrstnList)을 하루 한 번 받아 Redis에 저장하고,
+    워커마다 TM 좌표 배열을 메모리에 두고 근접측정소 API 없이 가까운 측정소를 찾음
+    공간 인덱스 없이 매번 전체 측정소와의 거리를 계산함 (약 600개 규모에서는 충분히 빠름)
+    """
+    CACHE_KEY = "air_quality:stations"
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._coords: Optional[np.ndarray] = None  # (측정소 수, 2) TM X/Y
+        self._loaded_at = 0.0
+        self.updated_at: Optional[str] = None
+        self._single_flight = SingleFlight()
+
+    @property
+    def loaded(self) -> bool:
+        return self._coords is not None and len(self._names) > 0
+
+    def _build_index(self, stations: List[Dict[str, Any]], updated_at: str):
+        self._names = [station["stationName"] for station in stations]
+        self._coords = np.array([[station["tmX"], station["tmY"]] for station in stations], dtype=np.float64)
+        self._loaded_at = time.monotonic()
+        self.updated_at = updated_at
+
+    def find_nearest(self, tmx: float, tmy: float, count: int) -> List[str]:
+        """
+        TM 좌표 기준 가까운 측정소 이름 (가까운 순서)
+        :param tmx: TM X 좌표
+        :param tmy: TM Y 좌표
+        :param count: 측정소 수
+        """
+        if not self.loaded:
+            return []
+        distances = np.hypot(self._coords[:, 0] - tmx, self._coords[:, 1] - tmy)
+        count = min(count, len(self._names))
+        nearest = np.argpartition(distances, count - 1)[:count]
+        return [self._names[i] for i in nearest[np.argsort(distances[nearest])]]
+
+    async def ensure_loaded(self) -> bool:
+        """
+        메모리 목록이 없거나 오래되었으면 Redis에서 다시 읽음 (Redis에도 없으면 API에서 조회)
+        :return: 사용 가능 여부
+        """
+        if self.loaded and time.monotonic() - self._loaded_at < settings.AIRQUALITY_STATION_CATALOG_RELOAD_SECONDS:
+            return True
+        if not self.loaded and self._loaded_at and time.monotonic() - self._loaded_at < settings.AIRQUALITY_STATION_CATALOG_RELOAD_SECONDS:
+            # 최근 로드에 실패했으면 다음 주기까지 다시 시도하지 않음
+            return False
+        await self._single_flight.do(self.CACHE_KEY, self._load)
+        return self.loaded
+
+    async def _load(self):
+        try:
+            if not await self._load_from_cache():
+                await self.refresh()
+        except Exception as e:
+            logger.warning(f"측정소 목록 로드 실패: {str(e)}")
+            # 기존 목록이 있으면 계속 사용
+            self._loaded_at = time.monotonic()
+
+    async def _load_from_cache(self) -> bool:
+        redis = await get_redis_binary_client()
+        cached_data = await redis.get(self.CACHE_KEY)
+        if not cached_data:
+            return False
+        catalog = cache_codec.decode(cached_data)
+        self._build_index(catalog["stations"], catalog["updated_at"])
+        logger.info(f"측정소 목록 캐시 로드: {len(self._names)}개 ({self.updated_at})")
+        return True
+
+    async def refresh(self):
+        """측정소 목록 API 조회 후 Redis 저장 (스케줄러에서 하루 한 번 실행)"""
+        stations = await self._fetch_stations()
+        if not stations:
+            raise ValueError("측정소 목록이 비어 있습니다.")
+
+        updated_at = datetime.now().isoformat()
+        self._build_index(stations, updated_at)
+        try:
+            redis = await get_redis_binary_client()
+            await redis.set(self.CACHE_KEY, cache_codec.encode({"stations": stations, "updated_at": updated_at}))
+        except Exception as e:
+            logger.warning(f"측정소 목록 캐시 저장 실패: {str(e)}")
+        logger.info(f"측정소 목록 갱신 완료: {len(stations)}개")
+
+    async def _fetch_stations(self) -> List[Dict[str, Any]]:
+        url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_AIRQUALITY_STATION_LIST_URL}"
+        num_of_rows = 1000
+        stations: List[Dict[str, Any]] = []
+        page_no = 1
+        while True:
+            params = {
+                "returnType": "json",
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+            }
+            response = await make_request(url=url, params=params)
+            body = response.data.get("response", {}).get("body", {})
+            items = body.get("items", []) or []
+            for item in items:
+                station = self._parse_station(item)
+                if station is not None:
+                    stations.append(station)
+
+            total_count = int(body.get("totalCount") or 0)
+            if not items or page_no * num_of_rows >= total_count:
+                return stations
+            page_no += 1
+
+    @staticmethod
+    def _parse_station(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # 에어코리아 측정소 좌표: dmX 위도, dmY 경도
+        try:
+            name = item.get("stationName")
+            lat = float(item.get("dmX"))
+            lon = float(item.get("dmY"))
+        except (TypeError, ValueError):
+            return None
+        if not name:
+            return None
+        tmx, tmy = convert_wgs84_to_katec(lat, lon)
+        return {"stationName": name, "tmX": round(tmx, 1), "tmY": round(tmy, 1)}
+
+# 전역 측정소 목록
+air_quality_station_catalog = AirQualityStationCatalog()
@@ -1,35 +1,77 @@
+from typing import Optional
 from urllib.parse import unquote
 from fastapi import HTTPException
 import httpx
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import xml.etree.ElementTree as ET
 
 from app.common.http_client import make_request
+from app.common.swr_cache import swr_cache
 from app.core.config import settings
+from app.utils.cache_utils import calculate_ttl_to_next_period
+from app.utils.solar_calculator import calculate_sunrise_sunset
 from app.config.logging_config import get_logger
 logger = get_logger()
 
+# 일출/일몰 캐시 격자 크기 (도)
+# 0.1도(약 10km) 안에서는 일출/일몰 시각 차이가 1분 미만이라 같은 값을 공유함
+SUN_CELL_DEGREES = 0.1
 
-async def get_sunrise_sunset(lat: float, lon: float, retry_days:int = 0) -> dict[str, str]:
+def get_sun_cell(lat: float, lon: float) -> tuple[float, float]:
+    """
+    일출/일몰 조회용 격자 중심 좌표
+    :return: (격자 중심 위도, 격자 중심 경도)
+    """
+    return (
+        round(round(lat / SUN_CELL_DEGREES) * SUN_CELL_DEGREES, 2),
+        round(round(lon / SUN_CELL_DEGREES) * SUN_CELL_DEGREES, 2),
+    )
+
+async def get_sunrise_sunset(lat: float, lon: float) -> dict[str, str]:
     """
     주어진 위도와 경도로 일출 및 일몰 시간 조회
+    기본은 태양 위치 계산식으로 직접 계산 (ASTRONOMY_SUN_SOURCE=kasi면 한국천문연구원 API, 격자 단위 캐시)
     :param lat: 위도
     :param lon: 경도
     :return: 일출 및 일몰 시간 정보
     """
+    cell_lat, cell_lon = get_sun_cell(lat, lon)
+    if settings.ASTRONOMY_SUN_SOURCE != "kasi":
+        return calculate_sunrise_sunset(cell_lat, cell_lon, date.today())
+
+    return await swr_cache.get_or_fetch(
+        f"astronomy:sun:{cell_lat}:{cell_lon}",
+        lambda: _fetch_sunrise_sunset(cell_lat, cell_lon),
+        ttl=lambda: calculate_ttl_to_next_period("day"),
+    )
 
-    # 날짜 셋팅
+async def _fetch_sunrise_sunset(lat: float, lon: float) -> dict[str, str]:
+    """
+    한국천문연구원 출몰시각 API 조회 (데이터가 없으면 이전 날짜로 조회)
+    :param lat: 위도
+    :param lon: 경도
+    :return: 일출 및 일몰 시간 정보
+    """
     MAX_RETRY_DAYS = 7
-    if retry_days > MAX_RETRY_DAYS:
-        raise HTTPException(status_code=400, detail=f"일출/일몰 시간을 조회할 수 없습니다.")
-    
-    target_date = datetime.now() - timedelta(days=retry_days)
-    date_str = target_date.strftime("%Y%m%d")
-    logger.info(f"일출/일몰 조회 시도: {date_str} (retry_days: {retry_days})")
+    for retry_days in range(MAX_RETRY_DAYS + 1):
+        target_date = (datetime.now() - timedelta(days=retry_days)).date()
+        logger.info(f"일출/일몰 조회 시도: {target_date:%Y%m%d} (retry_days: {retry_days})")
+        result = await fetch_kasi_sunrise_sunset(lat, lon, target_date)
+        if result is not None:
+            return result
+    raise HTTPException(status_code=404, detail="일출/일몰 데이터를 찾을 수 없습니다.")
 
+async def fetch_kasi_sunrise_sunset(lat: float, lon: float, target_date: date) -> Optional[dict[str, str]]:
+    """
+    한국천문연구원 출몰시각 API 1회 조회 (계산값 검증에도 사용)
+    :param lat: 위도
+    :param lon: 경도
+    :param target_date: 조회 날짜
+    :return: 일출 및 일몰 시간 정보 (해당 날짜 데이터가 없으면 None)
+    """
     # Request URL
     params = {
-        "locdate"	: date_str,
+        "locdate"	: target_date.strftime("%Y%m%d"),
         "longitude": lon,	
         "latitude"	: lat,
         "dnYn" : "Y"
@@ -38,25 +80,22 @@ async def get_sunrise_sunset(lat: float, lon: float, retry_days:int = 0) -> dict
 
     try:
         response = await make_request(url=url, params=params)
-        root = ET.fromstring(response.text)
+        root = response.xml
+        if root is None:
+            raise ET.ParseError("XML 응답이 아닙니다.")
         
         # xml에서 일출 및 일몰 시간 추출
         item = root.find('.//item')
         if item is None:
-            logger.warning(f"일출/일몰 데이터 없음 (retry_days: {retry_days})")
-            if retry_days < MAX_RETRY_DAYS:
-                return await get_sunrise_sunset(lat, lon, retry_days + 1)
-            raise HTTPException(status_code=404, detail="일출/일몰 데이터를 찾을 수 없습니다.")
-            
+            logger.warning(f"일출/일몰 데이터 없음 ({target_date})")
+            return None
         
         sunrise_elem = item.find('sunrise')
         sunset_elem = item.find('sunset')
 
         if sunrise_elem is None or sunset_elem is None:
-            logger.warning(f"일출/일몰 시간 정보 없음 (retry_days: {retry_days})")
-            if retry_days < MAX_RETRY_DAYS:
-                return await get_sunrise_sunset(lat, lon, retry_days + 1)
-            raise HTTPException(status_code=404, detail="일출/일몰 시간 정보를 찾을 수 없습니다.")
+            logger.warning(f"일출/일몰 시간 정보 없음 ({target_date})")
+            return None
 
         # 시간 형식 변환
         try:
@@ -66,7 +105,7 @@ async def get_sunrise_sunset(lat: float, lon: float, retry_days:int = 0) -> dict
             sunrise_time = f"{sunrise[:2]}:{sunrise[2:]}"
             sunset_time = f"{sunset[:2]}:{sunset[2:]}"
         except ValueError as e:
-            raise HTTPException(status_code=500, detail=f"시간 형식 변환 오류: {str(e)}")\
+            raise HTTPException(status_code=500, detail=f"시간 형식 변환 오류: {str(e)}")
         
         # 결과 데이터 추출        
         return {
@@ -75,14 +114,11 @@ async def get_sunrise_sunset(lat: float, lon: float, retry_days:int = 0) -> dict
         }
     except HTTPException:
         raise
+    # 업스트림 오류 재시도는 make_request의 재시도 정책에서 처리
+    # 여기서는 데이터가 없을 때만 이전 날짜로 조회함
     except ET.ParseError as e:
         logger.error(f"XML 파싱 오류: {str(e)}")
-        if retry_days < MAX_RETRY_DAYS:
-            return await get_sunrise_sunset(lat, lon, retry_days + 1)
         raise HTTPException(status_code=500, detail="XML 응답 형식 오류")
     except Exception as e:
         logger.error(f"한국천문연구원 데이터 처리 오류: {str(e)}")
-        if retry_days < MAX_RETRY_DAYS:
-            logger.info(f"일출/일몰 조회 재시도: {retry_days + 1}일 전")
-            return await get_sunrise_sunset(lat, lon, retry_days + 1)
-        raise HTTPException(status_code=500, detail="천문 서비스 오류")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="천문 서비스 오류")
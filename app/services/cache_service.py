@@ -1,7 +1,7 @@
-import json
 from typing import Optional
 from datetime import datetime
 from app.config.redis_config import RedisClient
+from app.common.cache_codec import cache_codec
 from app.models.air_quality import HourlyAirQualityCache, WeeklyAirQualityCache
 import logging
 
@@ -10,19 +10,18 @@ logger = logging.getLogger()
 class AirQualityCacheService:
     def __init__(self):
         self.redis_client = RedisClient()
-        self.HOURLY_KEY = "air_quality:hourly"
-        self.WEEKLY_KEY = "air_quality:weekly"
+        self.HOURLY_KEY = "air_quality:hourly:table"  # 원본 응답 대신 지역별 등급 표 저장
+        self.WEEKLY_KEY = "air_quality:weekly:regions"  # 지역별 점수 표 저장
 
         # 시간별 캐시 관리
     async def get_hourly_cache(self) -> Optional[HourlyAirQualityCache]:
         """시간별 대기질 캐시 조회"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             cached_data = await redis.get(self.HOURLY_KEY)
             
             if cached_data:
-                data_dict = json.loads(cached_data)
-                return HourlyAirQualityCache(**data_dict)
+                return HourlyAirQualityCache.model_validate(cache_codec.decode(cached_data))
         except Exception as e:
             logger.error(f"시간별 캐시 조회 실패: {str(e)}")
         return None
@@ -30,10 +29,9 @@ class AirQualityCacheService:
     async def set_hourly_cache(self, cache_data: HourlyAirQualityCache):
         """시간별 대기질 캐시 저장"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             
-            data_dict = cache_data.model_dump()            
-            await redis.set(self.HOURLY_KEY, json.dumps(data_dict))
+            await redis.set(self.HOURLY_KEY, cache_codec.encode(cache_data.model_dump()))
             logger.info(f"시간별 캐시 저장 완료")
         except Exception as e:
             logger.error(f"시간별 캐시 저장 실패: {str(e)}")
@@ -41,7 +39,7 @@ class AirQualityCacheService:
     async def delete_hourly_cache(self):
         """시간별 대기질 캐시 삭제"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             
             await redis.delete(self.HOURLY_KEY)
             logger.info(f"시간별 캐시 삭제 완료")
@@ -51,12 +49,11 @@ class AirQualityCacheService:
     async def get_weekly_cache(self) -> Optional[WeeklyAirQualityCache]:
         """주간별 대기질 캐시 조회"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             cached_data = await redis.get(self.WEEKLY_KEY)
             
             if cached_data:
-                data_dict = json.loads(cached_data)
-                return WeeklyAirQualityCache(**data_dict)
+                return WeeklyAirQualityCache.model_validate(cache_codec.decode(cached_data))
         except Exception as e:
             logger.error(f"주간별 캐시 조회 실패: {str(e)}")
         return None
@@ -64,10 +61,9 @@ class AirQualityCacheService:
     async def set_weekly_cache(self, cache_data: WeeklyAirQualityCache):
         """주간별 대기질 캐시 저장"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             
-            data_dict = cache_data.model_dump()
-            await redis.set(self.WEEKLY_KEY, json.dumps(data_dict))
+            await redis.set(self.WEEKLY_KEY, cache_codec.encode(cache_data.model_dump()))
             logger.info(f"주간별 캐시 저장 완료")
         except Exception as e:
             logger.error(f"주간별 캐시 저장 실패: {str(e)}")
@@ -75,7 +71,7 @@ class AirQualityCacheService:
     async def delete_weekly_cache(self):
         """주간별 대기질 캐시 삭제"""
         try:
-            redis = await self.redis_client.get_client()
+            redis = await self.redis_client.get_binary_client()
             
             await redis.delete(self.WEEKLY_KEY)
             logger.info(f"주간별 캐시 삭제 완료")
@@ -1,15 +1,16 @@
-import json
 from typing import Any, Dict
 
 from fastapi import HTTPException
-from app.config.redis_config import get_redis_client
+from app.common.swr_cache import swr_cache
 from app.services.weather_service import get_ultra_short_forecast, get_hourly_forecast, get_weekly_forecast, get_weather_uvindex
-from app.services.astronomy_service import get_sunrise_sunset
+from app.services.astronomy_service import get_sun_cell, get_sunrise_sunset
 from app.services.air_quality import get_current_air_quality, get_hourly_air_quality, get_weekly_air_quality
 from app.utils.walkability_calculator import WalkabilityCalculator
 from app.utils.airquality_calculator import calculate_combined_air_quality_score
 from app.utils.temperature_calculator import calculate_apparent_temperature
 from app.utils.cache_utils import calculate_ttl_to_next_period
+from app.utils.convert_for_grid import mapToGrid
+from app.utils.convert_for_region import convert_lat_lon_for_region
 from app.config.logging_config import get_logger
 logger = get_logger()
 
@@ -387,17 +388,26 @@ async def get_walkability_current_detail(
     """
 
     # 캐시 체크
-    cache_key = f"walkability:current:detail:{lat}:{lon}"
-    try:
-        redis = await get_redis_client()
-        cached_data = await redis.get(cache_key)
-        if cached_data:
-            logger.info(f"캐시에서 현재 날씨 상세 정보 조회: {cache_key}")
-            return {"forecasts": json.loads(cached_data)}
-    except Exception as e:
-        logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
-
+    # 좌표 대신 각 데이터가 실제로 의존하는 단위로 키 구성
+    # (초단기예보 격자, 자외선 지수 지역 코드, 일출/일몰 격자)
+    nx, ny = mapToGrid(lat, lon)
+    area_no = convert_lat_lon_for_region(lat, lon).get("region_code")
+    sun_lat, sun_lon = get_sun_cell(lat, lon)
+    cache_key = f"walkability:current:detail:{nx}:{ny}:{area_no}:{sun_lat}:{sun_lon}"
+    results = await swr_cache.get_or_fetch(
+        cache_key,
+        lambda: _build_walkability_current_detail(lat, lon),
+        ttl=lambda: calculate_ttl_to_next_period("hour"),
+    )
+    return {"forecasts": results}
 
+async def _build_walkability_current_detail(lat: float, lon: float) -> Dict[str, Any]:
+    """
+    현재 날씨 상세 정보 생성 (초단기예보 + 일출/일몰 + 자외선 지수)
+    :param lat: 위도
+    :param lon: 경도
+    :return: 현재 날씨 상세 정보
+    """
     # 캐시 없으면 API 호출 조회
     fields = ["temperature", "humidity", "wind_speed", "rainfall"]
     try:
@@ -450,16 +460,7 @@ async def get_walkability_current_detail(
     results = {
         "weather": weather_data
     }
-
-    # 캐시 저장
-    try:
-        ttl_seconds = calculate_ttl_to_next_period("hour")
-        await redis.set(cache_key, json.dumps(results, default=str), ex=ttl_seconds)
-        logger.info(f"현재 날씨 상세 정보 캐시에 저장: {cache_key}, TTL: {ttl_seconds}초")
-    except Exception as e:
-        logger.warning(f"캐시 저장 실패: {str(e)}")
-
-    return {"forecasts": results}
+    return results
 
 def _walkability_calculator(
     temperature: float,
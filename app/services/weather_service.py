@@ -1,18 +1,129 @@
-import json
+import asyncio
 from fastapi import HTTPException
-from app.config.redis_config import get_redis_client
+from app.config.redis_config import get_redis_binary_client, get_redis_client
 from app.core.config import settings
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Union
 from datetime import datetime, timedelta
-from app.utils.cache_utils import calculate_ttl_to_next_mid_forecast, calculate_ttl_to_next_period
+from app.utils.cache_utils import apply_ttl_jitter, calculate_ttl_to_next_mid_forecast, calculate_ttl_to_next_period, calculate_ttl_to_next_short_forecast, calculate_ttl_to_next_ultra_short_forecast
 from app.utils.convert_for_grid import mapToGrid
 from app.common.http_client import make_request
+from app.common.swr_cache import ShortLivedValue, swr_cache
+from app.common.cache_codec import cache_codec
 from urllib.parse import unquote
 from app.utils.weather_format_utils import convert_weather_condition, parse_rainfall
-from app.utils.convert_for_region import convert_grid_to_region, convert_lat_lon_for_region, convert_lat_lon_to_region_id
+from app.utils.convert_for_region import WEATHER_SERVICE_CODES, convert_grid_to_region, convert_lat_lon_for_region, convert_lat_lon_to_region_id
 from app.config.logging_config import get_logger
 logger = get_logger()
 
+# 관측소/날짜별 어제 시간별 기온 (지난 관측값은 바뀌지 않으므로 워커 메모리에도 보관)
+_station_temperatures: Dict[Tuple[str, str], Dict[int, float]] = {}
+
+def _is_station_day(items: List[Dict[str, Any]], date: str) -> bool:
+    """모든 시간자료의 관측 일자(tm)가 요청한 일자인지 확인"""
+    expected = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
+    return all(str(item.get("tm", "")).startswith(expected) for item in items)
+
+def _parse_station_temperatures(items: List[Dict[str, Any]], date: str) -> Dict[int, float]:
+    """ASOS 시간자료 -> {시: 기온} (요청한 일자의 자료만 사용)"""
+    expected = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
+    temperatures = {}
+    for item in items:
+        temp_value = item.get("ta")
+        item_time = item.get("tm", "")
+        if not temp_value or temp_value.strip() == "" or not item_time.startswith(expected):
+            continue
+        try:
+            time_part = item_time.split(" ")[1] if " " in item_time else "00:00"
+            temperatures[int(time_part.split(":")[0])] = float(temp_value)
+        except (ValueError, TypeError, IndexError):
+            continue
+    return temperatures
+
+def _remember_station_temperatures(station_id: str, date: str, temperatures: Dict[int, float]):
+    # 어제 이전 날짜는 더 이상 조회하지 않으므로 정리
+    oldest = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+    for key in [key for key in _station_temperatures if key[1] < oldest]:
+        del _station_temperatures[key]
+    _station_temperatures[(station_id, date)] = temperatures
+
+async def get_station_temperatures(station_id: Union[int, str], date: str) -> Dict[int, float]:
+    """
+    관측소 하루치 시간별 기온 조회 (워커 메모리 -> Redis -> API)
+    :param station_id: ASOS 관측소 ID
+    :param date: 관측 일자 (YYYYMMDD, 어제 이전)
+    :return: {시(0-23): 기온} (데이터가 없으면 빈 dict)
+    """
+    # 관측소 ID는 설정 파일에서 int로 읽히므로 캐시 키를 맞추기 위해 문자열로 통일
+    station_id = str(station_id)
+    temperatures = _station_temperatures.get((station_id, date))
+    if temperatures is not None:
+        return temperatures
+
+    cache_key = f"weather:asos:{station_id}:{date}"
+    try:
+        redis = await get_redis_binary_client()
+        cached_data = await redis.get(cache_key)
+        if cached_data:
+            temperatures = {int(hour): temp for hour, temp in cache_codec.decode(cached_data).items()}
+            if len(temperatures) == 24:
+                _remember_station_temperatures(station_id, date, temperatures)
+            return temperatures
+    except Exception as e:
+        redis = None
+        logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
+
+    params = {
+        "numOfRows": 24,
+        "dataType": "JSON",
+        "dataCd": "ASOS",
+        "dateCd": "HR",
+        "startDt": date,
+        "startHh": "00",
+        "endDt": date,
+        "endHh": "23",
+        "stnIds": station_id,
+    }
+    url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SEARCH_PREV_URL}"
+    response = await make_request(url=url, params=params)
+    items = response.data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+    temperatures = _parse_station_temperatures(items, date)
+
+    # 장애 대체 응답이나 다른 날짜가 섞인 응답은 캐시하지 않음
+    if not _is_station_day(items, date):
+        logger.warning(f"관측소 {station_id}: 요청 일자({date})와 다른 관측 자료가 포함되어 캐시하지 않음")
+    elif temperatures and not response.stale:
+        # 24시간이 모두 있으면 다음 날 자정까지, 일부만 있으면 한 시간 뒤 다시 조회
+        if len(temperatures) == 24:
+            _remember_station_temperatures(station_id, date, temperatures)
+            expires_at = datetime.strptime(date, "%Y%m%d") + timedelta(days=2)
+            ttl_seconds = max(int((expires_at - datetime.now()).total_seconds()), 60)
+        else:
+            ttl_seconds = calculate_ttl_to_next_period("hour")
+        if redis is not None:
+            try:
+                await redis.set(cache_key, cache_codec.encode({str(hour): temp for hour, temp in temperatures.items()}), ex=ttl_seconds)
+                logger.info(f"관측소 기온 캐시에 저장: {cache_key}, TTL: {ttl_seconds}초")
+            except Exception as e:
+                logger.warning(f"캐시 저장 실패: {str(e)}")
+
+    return temperatures
+
+async def prewarm_previous_weather():
+    """전체 관측소의 어제 시간별 기온 미리 조회 (스케줄러용)"""
+    date = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+    semaphore = asyncio.Semaphore(settings.WEATHER_PREV_PREWARM_CONCURRENCY)
+
+    async def warm(station_id: Union[int, str]) -> bool:
+        async with semaphore:
+            try:
+                return bool(await get_station_temperatures(station_id, date))
+            except Exception as e:
+                logger.warning(f"관측소 {station_id} 어제 기온 미리 조회 실패: {str(e)}")
+                return False
+
+    results = await asyncio.gather(*(warm(station["reg_id"]) for station in WEATHER_SERVICE_CODES))
+    logger.info(f"어제 기온 미리 조회 완료: {sum(results)}/{len(results)}개 관측소 ({date})")
+
 async def get_previous_weather(lat: float, lon: float, current_date: str, current_time: str) -> float:
     """
     어제 날씨 정보 조회
@@ -23,81 +134,23 @@ async def get_previous_weather(lat: float, lon: float, current_date: str, curren
     """
     stations = convert_lat_lon_to_region_id(lat, lon)
 
-    prev_date = (datetime.strptime(current_date, "%Y%m%d") - timedelta(days=1)).strftime("%Y-%m-%d")
-    prev_time = (datetime.strptime(current_time, "%H%M")).strftime("%H:%M")
-
-    prev_datetime = prev_date + " " + prev_time
-    params_date = prev_date.replace("-", "")
+    params_date = (datetime.strptime(current_date, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+    target_hour = datetime.strptime(current_time, "%H%M").hour
 
     for station in stations:
         try:
-            params = {
-                "numOfRows": 24,
-                "dataType": "JSON",
-                "dataCd": "ASOS",
-                "dateCd": "HR",
-                "startDt": params_date,
-                "startHh": "00",
-                "endDt": params_date,
-                "endHh": "23",
-                "stnIds": station["reg_id"],
-            }
-        
-            url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SEARCH_PREV_URL}"
-            response = await make_request(url=url, params=params)
-            data = response.json()
-
-            items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-
-            if not items:
+            temperatures = await get_station_temperatures(station["reg_id"], params_date)
+            if not temperatures:
                 logger.info(f"관측소 {station['reg_id']}: 데이터가 없습니다.")
                 continue
-            
-            yesterday_temp = None
-            for item in items:
-                item_time = item.get("tm", "")
-                if item_time == prev_datetime:
-                    temp_value = item.get("ta")
-                    if temp_value and temp_value.strip() != "":
-                        try:
-                            yesterday_temp = float(temp_value)
-                            break
-                        except (ValueError, TypeError):
-                            continue
-            
+
+            yesterday_temp = temperatures.get(target_hour)
             if yesterday_temp is None:
                 logger.info(f"관측소 {station['reg_id']}: 정확한 시간 데이터 없음, 가장 가까운 시간 사용")
-                
-                target_hour = int(prev_time.split(":")[0])
-                closest_temp = None
-                min_hour_diff = float('inf')
-                
-                for item in items:
-                    temp_value = item.get("ta")
-                    item_time = item.get("tm", "")
-                    
-                    if temp_value and temp_value.strip() != "" and item_time:
-                        try:
-                            temp = float(temp_value)
-                            # 시간 추출
-                            time_part = item_time.split(" ")[1] if " " in item_time else "00:00:00"
-                            item_hour = int(time_part.split(":")[0])
-                            
-                            hour_diff = abs(target_hour - item_hour)
-                            if hour_diff < min_hour_diff:
-                                min_hour_diff = hour_diff
-                                closest_temp = temp
-                        except (ValueError, TypeError, IndexError):
-                            continue
-                
-                yesterday_temp = closest_temp
+                closest_hour = min(sorted(temperatures), key=lambda hour: abs(target_hour - hour))
+                yesterday_temp = temperatures[closest_hour]
 
-
-            if yesterday_temp is not None:
-                return yesterday_temp
-            else:
-                logger.info(f"관측소: {station['reg_id']} 지역: {station['region']} 기상관측소: {station['meteorological']}: 유효한 온도 데이터 없음")
-                continue
+            return yesterday_temp
             
         except HTTPException as e:
             logger.warning(f"관측소 {station['reg_id']} ({station['region']}) API 오류: {e.detail}")
@@ -110,27 +163,20 @@ async def get_previous_weather(lat: float, lon: float, current_date: str, curren
     return None
      
 
-async def get_ultra_short_forecast(lat: float, lon: float, fields: List[str] = None) -> Dict[str, Any]:
+def get_ultra_short_base_time(now: datetime) -> tuple[str, str]:
     """
-    초단기 예보 조회
-    :param nx: 예보지점 X 좌표
-    :param ny: 예보지점 Y 좌표
-    :return: 초단기 예보 데이터
+    현재 시간 기준 가장 최근 초단기예보 발표 일자/시각 (매시 45분 이후 조회 가능)
+    :return: (base_date, base_time)
     """
-
-    nx, ny = mapToGrid(lat, lon)
-    
-    # Current time
-    now = datetime.now()
     if now.minute < 45:
         now = now - timedelta(hours=1)
+    return now.strftime("%Y%m%d"), now.strftime("%H00")
 
-    base_date = now.strftime("%Y%m%d")
-    base_time = now.strftime("%H00")
-    current_fcst_time = now.strftime("%H%M")
-
-
-    # Request URL
+async def _fetch_ultra_short_forecast(nx: int, ny: int, base_date: str, base_time: str) -> Dict[str, Dict[str, str]]:
+    """
+    초단기 예보 원본 조회
+    :return: 예보 시각(fcstTime)별 카테고리 값 (장애 대체 응답이면 ShortLivedValue로 감쌈)
+    """
     params = {
         "numOfRows": 1000,
         "pageNo": 1,
@@ -141,29 +187,64 @@ async def get_ultra_short_forecast(lat: float, lon: float, fields: List[str] = N
         "ny": ny,
     }
     url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_ULTRA_SHORT_URL}"
+
+    response = await make_request(url=url, params=params)
+    data = response.data
+
+    # 결과 데이터 추출
+    items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+    if not items:
+        raise HTTPException(status_code=404, detail="날씨 데이터를 찾을 수 없습니다.")
+
+    forecasts_by_time: Dict[str, Dict[str, str]] = {}
+    for item in items:
+        fcst_time = item.get("fcstTime")
+        forecasts_by_time.setdefault(fcst_time, {})[item.get("category")] = item.get("fcstValue")
+    # 장애 대체 응답이면 다음 발표까지 캐시하지 않음
+    return ShortLivedValue(forecasts_by_time) if response.stale else forecasts_by_time
+
+async def get_ultra_short_forecast_by_grid(nx: int, ny: int) -> Dict[str, Dict[str, str]]:
+    """
+    초단기 예보 원본 조회 (격자 단위 캐시, 다음 발표 시각까지 유지)
+    같은 격자(5km)의 사용자는 발표 시각마다 한 번만 업스트림을 호출함
+    :param nx: 예보지점 X 좌표
+    :param ny: 예보지점 Y 좌표
+    :return: 예보 시각(fcstTime)별 카테고리 값
+    """
+    async def fetch():
+        base_date, base_time = get_ultra_short_base_time(datetime.now())
+        return await _fetch_ultra_short_forecast(nx, ny, base_date, base_time)
+
+    return await swr_cache.get_or_fetch(
+        f"weather:ultra_short:{nx}:{ny}",
+        fetch,
+        ttl=calculate_ttl_to_next_ultra_short_forecast,
+    )
+
+async def get_ultra_short_forecast(lat: float, lon: float, fields: List[str] = None) -> Dict[str, Any]:
+    """
+    초단기 예보 조회
+    :param nx: 예보지점 X 좌표
+    :param ny: 예보지점 Y 좌표
+    :return: 초단기 예보 데이터
+    """
+
+    nx, ny = mapToGrid(lat, lon)
     
+    # Current time
+    now = datetime.now()
+    base_date, base_time = get_ultra_short_base_time(now)
+    # 발표 시각의 시 + 현재 분 (45분 이전이면 한 시간 전 기준)
+    current_fcst_time = f"{base_time[:2]}{now.strftime('%M')}"
+
     try:
-            response = await make_request(url=url, params=params)
-            data = response.json()
-            
-            # 결과 데이터 추출
-            items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-            if not items:
-                raise HTTPException(status_code=404, detail="날씨 데이터를 찾을 수 없습니다.")
-            
-            forecast_times = sorted(set(item.get("fcstTime") for item in items))
-            closest_time = min(forecast_times, key=lambda x: abs(int(x) - int(current_fcst_time)))
+            forecasts_by_time = await get_ultra_short_forecast_by_grid(nx, ny)
+
+            closest_time = min(forecasts_by_time, key=lambda x: abs(int(x) - int(current_fcst_time)))
 
             # 초 단기예보 카테고리
             # 코드 : T1H(기온), RN1(1시간 강수량), SKY(하늘상태), REH(습도), PTY(강수형태), LGT(낙뢰), VEC(풍향), WSD(풍속)
-            weather_data = {}
-            for item in items:
-                category = item.get("category")
-                fcst_time = item.get("fcstTime")
-                fcst_value = item.get("fcstValue")
-
-                if fcst_time == closest_time:
-                    weather_data[category] = fcst_value
+            weather_data = forecasts_by_time[closest_time]
 
             all_data = {
                 "temperature": float(weather_data.get("T1H", 0)),
@@ -228,55 +309,51 @@ async def get_ultra_short_forecast(lat: float, lon: float, fields: List[str] = N
         logger.error(f"초단기 예보 조회 중 예상치 못한 오류: {str(e)}")
         raise HTTPException(status_code=500, detail="초단기 날씨 서비스 오류")
 
-async def get_hourly_forecast(lat: float, lon: float, hours: int = 12) -> Dict[str, Any]:
+def get_short_forecast_base_time(now: datetime) -> tuple[str, str]:
     """
-    시간별 예보 조회 (최대 12시간)
-    :param lat: 위도
-    :param lon: 경도
-    :param hours: 조회할 시간 수 (기본값: 12시간)
-    :return: 시간별 예보 데이터 리스트
+    현재 시간 기준 가장 최근 단기예보 발표 일자/시각
+    기상청은 3시간 단위(02, 05, 08, 11, 14, 17, 20, 23시)로 예보를 제공함.
+    :return: (base_date, base_time)
     """
-    nx, ny = mapToGrid(lat, lon)
-
-    # 캐시 조회
-    cache_key = f"weather:hourly:{nx}:{ny}:{hours}"
-    try:
-        redis = await get_redis_client()
-        cached_data = await redis.get(cache_key)
-        if cached_data:
-            logger.info(f"캐시에서 시간별 날씨 예보 조회: {cache_key}")
-            return json.loads(cached_data)
-    except Exception as e:
-        logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
-    
-    now = datetime.now()
     base_date = now.strftime("%Y%m%d")
-    current_time = now.strftime("%H%M")
-    current_date = now.strftime("%Y%m%d")
-
-    
-    # 예보 기준 시간 설정
-    # 기상청은 3시간 단위로 예보를 제공함.
-    current_hour = now.hour
     base_times = [2, 5, 8, 11, 14, 17, 20, 23]
 
     # 현재 시간에 가장 가까운 예보 기준 시간 설정
     base_time = None
-    for t in reversed(sorted(base_times)):
-        if t <= current_hour:
+    for t in reversed(base_times):
+        if t <= now.hour:
             base_time = t
             break
-    
-    
+
     if base_time is None:
         yesterday = now - timedelta(days=1)
         base_date = yesterday.strftime("%Y%m%d")
         base_time = 23
-    
-    base_time = f"{base_time:02d}00"
-    
-    url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SHORT_URL}"
-    
+
+    return base_date, f"{base_time:02d}00"
+
+async def get_short_forecast_by_time(nx: int, ny: int, base_date: str, base_time: str, ttl_seconds: int = None) -> Dict[str, Dict[str, str]]:
+    """
+    단기예보 원본 조회 (격자/발표시각 단위 공유 캐시)
+    시간별 예보, 주간 예보, 오늘 최고/최저 기온이 같은 데이터를 함께 사용함
+    :param nx: 예보지점 X 좌표
+    :param ny: 예보지점 Y 좌표
+    :param base_date: 발표 일자 (YYYYMMDD)
+    :param base_time: 발표 시각 (HH00)
+    :param ttl_seconds: 캐시 유지 시간 (기본값: 다음 단기예보 발표 시간까지)
+    :return: 예보 일시("YYYYMMDD-HHMM")별 카테고리 값 (데이터가 없으면 빈 dict)
+    """
+    cache_key = f"weather:short:{nx}:{ny}:{base_date}:{base_time}"
+    try:
+        redis = await get_redis_binary_client()
+        cached_data = await redis.get(cache_key)
+        if cached_data:
+            logger.info(f"캐시에서 단기예보 조회: {cache_key}")
+            return cache_codec.decode(cached_data)
+    except Exception as e:
+        redis = None
+        logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
+
     params = {
         "numOfRows": 1000,
         "pageNo": 1,
@@ -286,56 +363,110 @@ async def get_hourly_forecast(lat: float, lon: float, hours: int = 12) -> Dict[s
         "nx": nx,
         "ny": ny,
     }
+    url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SHORT_URL}"
+
+    response = await make_request(url=url, params=params)
+    data = response.data
+    items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+
+    forecasts_by_time: Dict[str, Dict[str, str]] = {}
+    for item in items:
+        key = f"{item.get('fcstDate')}-{item.get('fcstTime')}"
+        forecasts_by_time.setdefault(key, {})[item.get("category")] = item.get("fcstValue")
+
+    # 캐시 저장
+    if redis is not None and forecasts_by_time:
+        try:
+            if response.stale:
+                # 장애 대체 응답은 잠깐만 캐시
+                ttl_seconds = settings.CACHE_STALE_RESULT_TTL_SECONDS
+            elif ttl_seconds is None:
+                ttl_seconds = calculate_ttl_to_next_short_forecast()
+            ttl_seconds = apply_ttl_jitter(ttl_seconds, settings.CACHE_TTL_JITTER_SECONDS)
+            await redis.set(cache_key, cache_codec.encode(forecasts_by_time), ex=ttl_seconds)
+            logger.info(f"단기예보 캐시에 저장: {cache_key}, TTL: {ttl_seconds}초")
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패: {str(e)}")
+
+    return forecasts_by_time
+
+async def get_hourly_forecast(lat: float, lon: float, hours: int = 12) -> Dict[str, Any]:
+    """
+    시간별 예보 조회 (최대 12시간)
+    :param lat: 위도
+    :param lon: 경도
+    :param hours: 조회할 시간 수 (기본값: 12시간)
+    :return: 시간별 예보 데이터 리스트
+    """
+    nx, ny = mapToGrid(lat, lon)
+
+    # 격자마다 남은 예보 전체를 한 번만 저장하고,
+    # 현재 시각 이후 예보를 요청한 시간 수만큼 잘라서 반환 (만료된 캐시를 반환하는 동안에도 지난 시간은 제외됨)
+    cached_result = await swr_cache.get_or_fetch(
+        f"weather:hourly:{nx}:{ny}",
+        lambda: _build_hourly_forecast(nx, ny),
+        ttl=lambda: calculate_ttl_to_next_period('hour'),
+    )
+    now_key = datetime.now().strftime("%Y%m%d%H%M")
+    forecasts = [
+        forecast for forecast in cached_result["forecasts"]
+        if forecast["forecast_date"] + forecast["forecast_time"] > now_key
+    ]
+    return {"forecasts": forecasts[:hours]}
+
+async def _build_hourly_forecast(nx: int, ny: int) -> Dict[str, Any]:
+    """
+    시간별 예보 생성 (현재 시각 이후 예보 전체)
+    :param nx: 예보지점 X 좌표
+    :param ny: 예보지점 Y 좌표
+    :return: 시간별 예보 데이터 리스트
+    """
+    now = datetime.now()
+    current_time = now.strftime("%H%M")
+    current_date = now.strftime("%Y%m%d")
+    base_date, base_time = get_short_forecast_base_time(now)
+
     try:
-        response = await make_request(url=url, params=params)
-        data = response.json()
-        
-        items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+        short_forecast = await get_short_forecast_by_time(nx, ny, base_date, base_time)
         
-        if not items:
+        if not short_forecast:
             raise HTTPException(status_code=404, detail="날씨 데이터를 찾을 수 없습니다.")
         
         # 시간대별로 데이터 그룹화
         forecasts_by_time = {}
-        for item in items:
-            fcst_date = item.get("fcstDate")
-            fcst_time = item.get("fcstTime")            
-            key = f"{fcst_date}-{fcst_time}"
-            
-            if key not in forecasts_by_time:
-                forecasts_by_time[key] = {
-                    "forecast_date": fcst_date,
-                    "forecast_time": fcst_time
-                }
-            
-            category = item.get("category")
-            value = item.get("fcstValue")
+        for key, values in short_forecast.items():
+            fcst_date, fcst_time = key.split("-")
+            forecasts_by_time[key] = {
+                "forecast_date": fcst_date,
+                "forecast_time": fcst_time
+            }
             
-            if category == "TMP":  # 기온
-                forecasts_by_time[key]["temperature"] = float(value)
-            elif category == "PTY":  # 강수형태 (0:없음, 1:비, 2:비/눈, 3:눈, 4:소나기)
-                forecasts_by_time[key]["precipitation_type"] = int(value)
-            elif category == "SKY":  # 하늘상태 (1:맑음, 3:구름많음, 4:흐림)
-                forecasts_by_time[key]["sky_condition"] = int(value)
-            elif category == "POP":  # 강수확률
-                forecasts_by_time[key]["precipitation_probability"] = int(value)
-            elif category == "PCP": # 강수량
-                # 강수없음이라는 값이 넘어올 수 있음
-                if type(value) is str:
-                    value = 0.0
-                else:
-                    value = float(value)
-
-                forecasts_by_time[key]["precipitation_amount"] = value
-                # 기상청 가이드 문자열 처리
-                # if amount >= 0.1 and amount < 1.0:
-                #     forecasts_by_time[key]["precipitation_amount"] = f"{1}mm 미만"
-                # elif amount >= 1.0 and amount < 30.0:
-                #     forecasts_by_time[key]["precipitation_amount"] = f"{value}mm"
-                # elif amount >= 30.0 and amount < 50.0:
-                #     forecasts_by_time[key]["precipitation_amount"] = f"30mm~50mm"
-                # elif amount >= 50.0:
-                #     forecasts_by_time[key]["precipitation_amount"] = f"50mm 이상"
+            for category, value in values.items():
+                if category == "TMP":  # 기온
+                    forecasts_by_time[key]["temperature"] = float(value)
+                elif category == "PTY":  # 강수형태 (0:없음, 1:비, 2:비/눈, 3:눈, 4:소나기)
+                    forecasts_by_time[key]["precipitation_type"] = int(value)
+                elif category == "SKY":  # 하늘상태 (1:맑음, 3:구름많음, 4:흐림)
+                    forecasts_by_time[key]["sky_condition"] = int(value)
+                elif category == "POP":  # 강수확률
+                    forecasts_by_time[key]["precipitation_probability"] = int(value)
+                elif category == "PCP": # 강수량
+                    # 강수없음이라는 값이 넘어올 수 있음
+                    if type(value) is str:
+                        value = 0.0
+                    else:
+                        value = float(value)
+
+                    forecasts_by_time[key]["precipitation_amount"] = value
+                    # 기상청 가이드 문자열 처리
+                    # if amount >= 0.1 and amount < 1.0:
+                    #     forecasts_by_time[key]["precipitation_amount"] = f"{1}mm 미만"
+                    # elif amount >= 1.0 and amount < 30.0:
+                    #     forecasts_by_time[key]["precipitation_amount"] = f"{value}mm"
+                    # elif amount >= 30.0 and amount < 50.0:
+                    #     forecasts_by_time[key]["precipitation_amount"] = f"30mm~50mm"
+                    # elif amount >= 50.0:
+                    #     forecasts_by_time[key]["precipitation_amount"] = f"50mm 이상"
         
         future_forecasts = {}
         for key, forecast in forecasts_by_time.items():
@@ -350,7 +481,6 @@ async def get_hourly_forecast(lat: float, lon: float, hours: int = 12) -> Dict[s
         
         # 시간 정렬
         sorted_keys = sorted(future_forecasts.keys())
-        count = 0
         for key in sorted_keys:
             forecast = forecasts_by_time[key]
             # 필수 필드 확인
@@ -363,25 +493,11 @@ async def get_hourly_forecast(lat: float, lon: float, hours: int = 12) -> Dict[s
                 forecast["base_date"] = fcst_date
                 forecast["base_time"] = fcst_time
                 result_forecasts.append(forecast)
-                count += 1
-                
-                # 지정된 시간 수에 도달하면 중단
-                if count >= hours:
-                    break
 
         # 메타데이터 추가
         result = {
             "forecasts": result_forecasts
         }
-
-        # 캐시 저장 (다음 단기예보 발표 시간까지)
-        try:
-            ttl_seconds = calculate_ttl_to_next_period('hour')
-            await redis.set(cache_key, json.dumps(result, default=str), ex=ttl_seconds)
-            logger.info(f"시간별 날씨 예보 캐시에 저장: {cache_key}, TTL: {ttl_seconds}초")
-        except Exception as e:
-            logger.warning(f"캐시 저장 실패: {str(e)}")
-        
         return result
             
     except HTTPException:
@@ -416,26 +532,15 @@ async def get_daily_temperature_range(nx: float, ny: float) -> Dict[str, Any]:
         base_date = today
         base_time = "0500"
     
-    # 단기예보 API URL
-    url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SHORT_URL}"
-
-    params = {
-        "numOfRows": 1000,
-        "pageNo": 1,
-        "dataType": "JSON",
-        "base_date": base_date,
-        "base_time": base_time,
-        "nx": nx,
-        "ny": ny,
-    }
+    # 05시 발표 예보는 다음 날 05시 30분까지 사용
+    next_refresh = datetime.strptime(base_date, "%Y%m%d").replace(hour=5, minute=30) + timedelta(days=1)
+    ttl_seconds = max(int((next_refresh - now).total_seconds()), 60)
     
     try:
-        response = await make_request(url=url, params=params)
-        data = response.json()
+        short_forecast = await get_short_forecast_by_time(nx, ny, base_date, base_time, ttl_seconds=ttl_seconds)
         
         # 결과 데이터 추출
-        items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
-        if not items:
+        if not short_forecast:
             logger.error("단기예보 API에서 날씨 데이터를 찾을 수 없습니다.")
             raise HTTPException(status_code=404, detail="날씨 데이터를 찾을 수 없습니다.")
         
@@ -443,33 +548,31 @@ async def get_daily_temperature_range(nx: float, ny: float) -> Dict[str, Any]:
         min_temp = None
         max_temp = None
         
-        for item in items:
-            fcst_date = item.get("fcstDate")
-            category = item.get("category")
-            value = item.get("fcstValue")
-            
-            # 오늘의 최고 기온과 내일의 최저 기온
-            if (fcst_date == today and category == "TMX") or (fcst_date == tomorrow and category == "TMN"):
-                if category == "TMN":
-                    try:
-                        min_temp = float(value)
-                    except (ValueError, TypeError):
-                        pass
-                elif category == "TMX":
-                    try:
-                        max_temp = float(value)
-                    except (ValueError, TypeError):
-                        pass
+        for key, values in short_forecast.items():
+            fcst_date = key.split("-")[0]
+            for category, value in values.items():
+                # 오늘의 최고 기온과 내일의 최저 기온
+                if (fcst_date == today and category == "TMX") or (fcst_date == tomorrow and category == "TMN"):
+                    if category == "TMN":
+                        try:
+                            min_temp = float(value)
+                        except (ValueError, TypeError):
+                            pass
+                    elif category == "TMX":
+                        try:
+                            max_temp = float(value)
+                        except (ValueError, TypeError):
+                            pass
         
         # 최고/최저 기온이 없으면 시간별 예보에서 계산
         if min_temp is None or max_temp is None:
             
             # 오늘의 시간별 예보에서 최고/최저 기온 계산
             today_temps = []
-            for item in items:
-                if item.get("fcstDate") == today and item.get("category") == "TMP":
+            for key, values in short_forecast.items():
+                if key.startswith(today) and "TMP" in values:
                     try:
-                        temp = float(item.get("fcstValue", 0))
+                        temp = float(values["TMP"])
                         today_temps.append(temp)
                     except (ValueError, TypeError):
                         pass
@@ -507,19 +610,24 @@ async def get_weekly_forecast(lat: float, lon: float, days: int = 7) -> Dict[str
     # 격자 좌표 변환
     nx, ny = mapToGrid(lat, lon)
 
+    # 다음 중기예보 발표 또는 자정 중 먼저 오는 시점까지 캐시
+    cached_result = await swr_cache.get_or_fetch(
+        f"weather:weekly:{nx}:{ny}:{days}",
+        lambda: _build_weekly_forecast(nx, ny, days),
+        ttl=lambda: min(calculate_ttl_to_next_mid_forecast(), calculate_ttl_to_next_period("day")),
+    )
+    # 자정 이후 만료된 캐시를 반환하는 동안 지난 날짜는 제외
     today = datetime.now().strftime("%Y%m%d")
-    cache_key = f"weather:weekly:{nx}:{ny}:{days}:{today}"
-    
-    # 캐시 조회
-    try:
-        redis = await get_redis_client()
-        cached_data = await redis.get(cache_key)
-        if cached_data:
-            logger.info(f"캐시에서 주간 날씨 예보 조회: {cache_key}")
-            return json.loads(cached_data)
-    except Exception as e:
-        logger.warning(f"캐시 조회 실패, 새로운 데이터 조회: {str(e)}")
-    
+    return {"forecasts": [forecast for forecast in cached_result["forecasts"] if forecast["base_date"] > today]}
+
+async def _build_weekly_forecast(nx: int, ny: int, days: int) -> Dict[str, Any]:
+    """
+    내일부터 일주일간의 날씨 예보 생성 (단기예보 + 중기예보)
+    :param nx: 예보지점 X 좌표
+    :param ny: 예보지점 Y 좌표
+    :param days: 조회할 일수
+    :return: 일주일 예보 데이터
+    """
     # 현재 시간 기준
     now = datetime.now()
     today = now.date()
@@ -622,118 +730,95 @@ async def get_weekly_forecast(lat: float, lon: float, days: int = 7) -> Dict[str
     weekly_forecast = weekly_forecast[:days]
 
     result = {'forecasts': weekly_forecast}
-
-    # 캐시 저장
-    try:
-        ttl_seconds = calculate_ttl_to_next_mid_forecast()
-        await redis.set(cache_key, json.dumps(result, default=str), ex=ttl_seconds)
-        logger.info(f"주간 날씨 예보 캐시에 저장: {cache_key}, TTL: {ttl_seconds}초")
-    except Exception as e:
-        logger.warning(f"캐시 저장 실패: {str(e)}")
-    
     return result
 
 # 단기예보(주간예보용)
 async def get_short_range_forecast(nx: int, ny: int) -> List[Dict[str, Any]]:
     """단기예보 API로 상세 예보 데이터 조회"""
-    # 현재 시간
-    now = datetime.now()
-    base_date = now.strftime("%Y%m%d")
-    
-    # 예보 기준 시간 설정
-    current_hour = now.hour
-    base_times = [2, 5, 8, 11, 14, 17, 20, 23]
-    
-    # 현재 시간에 가장 가까운 예보 기준 시간 설정
-    base_time = None
-    for t in reversed(sorted(base_times)):
-        if t <= current_hour:
-            base_time = t
-            break
-    
-    if base_time is None:
-        yesterday = now - timedelta(days=1)
-        base_date = yesterday.strftime("%Y%m%d")
-        base_time = 23
-    
-    base_time = f"{base_time:02d}00"
-    
-    # API 요청
-    url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_SHORT_URL}"
-    params = {
-        "numOfRows": 1000,
-        "pageNo": 1,
-        "dataType": "JSON",
-        "base_date": base_date,
-        "base_time": base_time,
-        "nx": nx,
-        "ny": ny,
-    }
-    
-    response = await make_request(url=url, params=params)
-    data = response.json()
-    
-    # 응답 처리
-    items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+    base_date, base_time = get_short_forecast_base_time(datetime.now())
+    short_forecast = await get_short_forecast_by_time(nx, ny, base_date, base_time)
     
     # 시간대별로 데이터 그룹화
     forecasts_by_time = {}
-    for item in items:
-        fcst_date = item.get("fcstDate")
-        fcst_time = item.get("fcstTime")
-        key = f"{fcst_date}-{fcst_time}"
-        
-        if key not in forecasts_by_time:
-            forecasts_by_time[key] = {
-                "base_date": fcst_date,
-                "base_time": fcst_time
-            }
+    for key, values in short_forecast.items():
+        fcst_date, fcst_time = key.split("-")
+        forecasts_by_time[key] = {
+            "base_date": fcst_date,
+            "base_time": fcst_time
+        }
         
-        # 값 처리
-        category = item.get("category")
-        value = item.get("fcstValue")
         # 각 카테고리 처리
-        if category == "TMP":  # 기온
-            forecasts_by_time[key]["temperature"] = float(value)
-        elif category == "POP":  # 강수확률
-            forecasts_by_time[key]["precipitation_probability"] = int(value)
-        elif category == "PTY":  # 강수형태
-            forecasts_by_time[key]["precipitation_type"] = int(value)
-        elif category == "SKY":  # 하늘상태
-            forecasts_by_time[key]["sky_condition"] = int(value)
+        for category, value in values.items():
+            if category == "TMP":  # 기온
+                forecasts_by_time[key]["temperature"] = float(value)
+            elif category == "POP":  # 강수확률
+                forecasts_by_time[key]["precipitation_probability"] = int(value)
+            elif category == "PTY":  # 강수형태
+                forecasts_by_time[key]["precipitation_type"] = int(value)
+            elif category == "SKY":  # 하늘상태
+                forecasts_by_time[key]["sky_condition"] = int(value)
     
     return list(forecasts_by_time.values())
 
 # 중기예보
+def get_mid_forecast_issuance(now: datetime) -> Tuple[str, int]:
+    """
+    현재 사용할 중기예보 발표 시각
+    06시 발표: 4~10일 예보, 18시 발표: 5~10일 예보
+    :return: (tmFc "YYYYMMDDHHMM", 시작 일차)
+    """
+    if now.hour < 6:
+        # 전날 18시 발표 예보 (5일부터)
+        return f"{(now - timedelta(days=1)).strftime('%Y%m%d')}1800", 5
+    if now.hour < 18:
+        # 당일 06시 발표 예보 (4일부터)
+        return f"{now.strftime('%Y%m%d')}0600", 4
+    # 당일 18시 발표 예보 (5일부터)
+    return f"{now.strftime('%Y%m%d')}1800", 5
+
 async def get_mid_range_forecast(nx: int, ny: int) -> List[Dict[str, Any]]:
     """중기예보 API로 3~7일 후 예보 조회 """
-    # 현재 시간
     now = datetime.now()
-    today = now.strftime("%Y%m%d")
-    current_hour = now.hour
-    
-    # 중기예보 발표 시간에 따라 4일 또는 5일부터 제공
-    # 06시 발표: 4~10일 예보, 18시 발표: 5~10일 예보
-    if current_hour < 6:
-        # 전날 18시 발표 예보 (5일부터)
-        yesterday = now - timedelta(days=1)
-        base_date = yesterday.strftime("%Y%m%d")
-        base_time = "1800"
-        mid_start_day = 5
-    elif current_hour < 18:
-        # 당일 06시 발표 예보 (4일부터)
-        base_date = today
-        base_time = "0600"
-        mid_start_day = 4
-    else:
-        # 당일 18시 발표 예보 (5일부터)
-        base_date = today
-        base_time = "1800"
-        mid_start_day = 5
-    
-    # 위경도를 행정구역코드로 변환
+    tm_fc, mid_start_day = get_mid_forecast_issuance(now)
+
+    # 격자를 중기예보 구역코드로 변환 (여러 격자가 같은 구역을 공유)
     region_id = convert_grid_to_region(nx, ny)
-    
+
+    try:
+        region_forecast = await get_mid_forecast_by_region(region_id, tm_fc, mid_start_day)
+    except ValueError as e:
+        logger.warning(f"중기예보 데이터 없음 ({region_id}, {tm_fc}): {str(e)}")
+        return []
+
+    # 일차(i)를 실제 날짜로 변환 (3일 후부터)
+    start_date = now.date()
+    return [
+        {
+            "base_date": (start_date + timedelta(days=day["day"] - 2)).strftime("%Y%m%d"),
+            **{field: value for field, value in day.items() if field != "day"},
+        }
+        for day in region_forecast["days"]
+    ]
+
+async def get_mid_forecast_by_region(region_id: str, tm_fc: str, mid_start_day: int) -> Dict[str, Any]:
+    """
+    구역/발표 단위 중기예보 (다음 발표까지 캐시)
+    :param region_id: 중기예보 구역코드 (regId)
+    :param tm_fc: 발표 시각 (YYYYMMDDHHMM)
+    :param mid_start_day: 시작 일차
+    :return: {"days": [{"day": 일차, "min_temperature": ..., ...}]}
+    """
+    return await swr_cache.get_or_fetch(
+        f"weather:mid:{region_id}:{tm_fc}",
+        lambda: _fetch_mid_range_forecast(region_id, tm_fc, mid_start_day),
+        ttl=calculate_ttl_to_next_mid_forecast,
+    )
+
+async def _fetch_mid_range_forecast(region_id: str, tm_fc: str, mid_start_day: int) -> Dict[str, Any]:
+    """
+    중기기온/육상예보 조회 후 일차별로 정리
+    데이터가 없으면 ValueError (캐시하지 않음), 장애 대체 응답이면 ShortLivedValue로 감쌈
+    """
     # 두 API 동시 요청 준비
     temp_url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_MID_OUTLOOK_URL}" # 기온예보
     weather_url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_MID_LAND_URL}" # 육상예보
@@ -743,36 +828,29 @@ async def get_mid_range_forecast(nx: int, ny: int) -> List[Dict[str, Any]]:
         "pageNo": 1,
         "dataType": "JSON",
         "regId": region_id,
-        "tmFc": f"{base_date}{base_time}"
+        "tmFc": tm_fc
     }
     
     # 두 API 동시 요청
     temp_response = await make_request(url=temp_url, params=common_params)
     weather_response = await make_request(url=weather_url, params=common_params)
     
-    temp_data = temp_response.json()
-    weather_data = weather_response.json()
+    temp_data = temp_response.data
+    weather_data = weather_response.data
     
     # 데이터 추출
     temp_items = temp_data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
     weather_items = weather_data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
     
     if not temp_items or not weather_items:
-        return []
+        raise ValueError("중기예보 응답에 데이터가 없습니다.")
     
     # 첫 번째 아이템만 사용
     temp_item = temp_items[0]
     weather_item = weather_items[0]
     
-    # 일주일 예보 생성
-    forecasts = []
-    start_date = now.date()
-    
-    # 3일 후부터 7일 후까지 데이터 처리
+    days = []
     for i in range(mid_start_day, 11):
-        forecast_date = start_date + timedelta(days=i-2)  # 실제 날짜로 변환 (3일 후부터)
-        date_str = forecast_date.strftime("%Y%m%d")
-
         # 중기예보 데이터 키 (i는 원래 키 값 그대로 사용)
         min_key = f"taMin{i}"
         max_key = f"taMax{i}"
@@ -801,45 +879,167 @@ async def get_mid_range_forecast(nx: int, ny: int) -> List[Dict[str, Any]]:
             int(temp_item.get(pop_key_pm, 0)) if i <= 7 else int(temp_item.get(pop_key, 0))
         )
         
-        day_forecast = {
-            "base_date": date_str,
+        days.append({
+            "day": i,
             "min_temperature": float(temp_item.get(min_key, 0)),
             "max_temperature": float(temp_item.get(max_key, 0)),
             "sky_condition": weather_info["sky_condition"],
             "precipitation_type": weather_info["precipitation_type"],
             "precipitation_probability": precipitation_probability,
-        }
-        
-        forecasts.append(day_forecast)
+        })
     
-    return forecasts
+    if temp_response.stale or weather_response.stale:
+        return ShortLivedValue({"days": days})
+    return {"days": days}
+
+UV_POPULAR_AREAS_KEY = "weather:uv:popular"
+# 아직 Redis에 기록하지 않은 지역별 조회 수 (WEATHER_UV_AREA_FLUSH_SECONDS마다 기록)
+_uv_area_counts: Dict[str, int] = {}
+
+def _uv_issue_hours() -> List[int]:
+    return sorted(int(hour) for hour in settings.WEATHER_UV_ISSUE_HOURS.split(","))
+
+def get_uv_issuance(now: datetime) -> datetime:
+    """
+    현재 사용할 자외선 지수 발표 시각 (발표 후 WEATHER_UV_AVAILABLE_DELAY_MINUTES 이후부터 사용)
+    :return: 발표 시각 (정각)
+    """
+    issue_hours = _uv_issue_hours()
+    available = now - timedelta(minutes=settings.WEATHER_UV_AVAILABLE_DELAY_MINUTES)
+    for hour in reversed(issue_hours):
+        if available.hour >= hour:
+            return available.replace(hour=hour, minute=0, second=0, microsecond=0)
+    # 첫 발표 전에는 전날 마지막 발표 사용
+    return (available - timedelta(days=1)).replace(hour=issue_hours[-1], minute=0, second=0, microsecond=0)
+
+def _calculate_ttl_to_next_uv_issuance(issuance: datetime) -> int:
+    """다음 발표가 조회 가능해질 때까지의 초"""
+    issue_hours = _uv_issue_hours()
+    next_hour = next((hour for hour in issue_hours if hour > issuance.hour), None)
+    if next_hour is None:
+        next_issuance = (issuance + timedelta(days=1)).replace(hour=issue_hours[0])
+    else:
+        next_issuance = issuance.replace(hour=next_hour)
+    available_at = next_issuance + timedelta(minutes=settings.WEATHER_UV_AVAILABLE_DELAY_MINUTES)
+    return max(int((available_at - datetime.now()).total_seconds()), 60)
+
+def select_uv_index(series: Dict[str, Any], now: datetime) -> int:
+    """
+    발표 시각 기준 3시간 간격 예보(h0, h3 ...)에서 현재 시각에 가장 가까운 값 선택
+    :param series: {"issuance": "YYYYMMDDHH", "values": {"h0": "3", ...}}
+    :return: 자외선 지수
+    """
+    issuance = datetime.strptime(series["issuance"], "%Y%m%d%H")
+    elapsed_hours = (now - issuance).total_seconds() / 3600
+    best_uv_index = "0"
+    min_hour_diff = float('inf')
+    for key, uv_value in series["values"].items():
+        hour_diff = abs(elapsed_hours - int(key[1:]))
+        if hour_diff < min_hour_diff:
+            min_hour_diff = hour_diff
+            best_uv_index = uv_value
+    try:
+        return int(float(best_uv_index)) if best_uv_index and best_uv_index.strip() != "" else 0
+    except (ValueError, AttributeError):
+        return 0
+
+async def get_uv_series(region_code: str, issuance: datetime) -> Dict[str, Any]:
+    """
+    지역/발표 단위 자외선 지수 예보 (h0 ~ h24, 다음 발표까지 캐시)
+    :param region_code: 지역 코드 (areaNo)
+    :param issuance: 발표 시각
+    """
+    return await swr_cache.get_or_fetch(
+        f"weather:uv:{region_code}:{issuance:%Y%m%d%H}",
+        lambda: _fetch_uv_series(region_code, issuance),
+        ttl=lambda: _calculate_ttl_to_next_uv_issuance(issuance),
+    )
+
+def _record_uv_area(region_code: str):
+    # 발표 직후 미리 조회할 지역을 고르기 위해 지역별 조회 수 기록 (요청 경로에서는 메모리에만 기록)
+    if settings.WEATHER_UV_PREWARM_TOP_AREAS <= 0:
+        return
+    _uv_area_counts[region_code] = _uv_area_counts.get(region_code, 0) + 1
+
+async def flush_uv_area_counts():
+    """모아둔 지역별 조회 수를 Redis에 한 번에 기록 (스케줄러용)"""
+    if not _uv_area_counts:
+        return
+    counts = dict(_uv_area_counts)
+    _uv_area_counts.clear()
+    try:
+        redis = await get_redis_client()
+        pipe = redis.pipeline()
+        for region_code, count in counts.items():
+            pipe.zincrby(UV_POPULAR_AREAS_KEY, count, region_code)
+        await pipe.execute()
+    except Exception as e:
+        # 다음 주기에 다시 기록
+        for region_code, count in counts.items():
+            _uv_area_counts[region_code] = _uv_area_counts.get(region_code, 0) + count
+        logger.warning(f"자외선 지수 조회 지역 기록 실패: {str(e)}")
 
 async def get_weather_uvindex(lat: float, lon: float) -> int:
     """
-    자외선 지수 조회
+    자외선 지수 조회 (지역 코드/발표 시각 단위 캐시)
     :param lat: 위도
     :param lon: 경도
     :return: 자외선 지수 데이터
     """
-    now = datetime.now()
-    current_hour = now.hour
-    current_datetime = now.strftime("%Y%m%d%H")
     region_data = convert_lat_lon_for_region(lat, lon)
-    region_code = region_data.get("region_code")
-    
+    region_code = str(region_data.get("region_code"))
+    now = datetime.now()
+    _record_uv_area(region_code)
+    series = await get_uv_series(region_code, get_uv_issuance(now))
+    return select_uv_index(series, now)
+
+async def prewarm_uv_index():
+    """조회가 많은 지역의 최신 발표 자외선 지수 미리 조회 (스케줄러용)"""
+    await flush_uv_area_counts()
+    try:
+        redis = await get_redis_client()
+        region_codes = await redis.zrevrange(UV_POPULAR_AREAS_KEY, 0, settings.WEATHER_UV_PREWARM_TOP_AREAS - 1)
+        # 오래된 조회 수의 영향이 줄어들도록 점수를 절반으로 감소
+        await redis.zunionstore(UV_POPULAR_AREAS_KEY, {UV_POPULAR_AREAS_KEY: 0.5})
+    except Exception as e:
+        logger.warning(f"자외선 지수 인기 지역 조회 실패: {str(e)}")
+        return
+
+    issuance = get_uv_issuance(datetime.now())
+    semaphore = asyncio.Semaphore(settings.WEATHER_UV_PREWARM_CONCURRENCY)
+
+    async def warm(region_code: str) -> bool:
+        async with semaphore:
+            try:
+                await get_uv_series(region_code, issuance)
+                return True
+            except Exception as e:
+                logger.warning(f"지역 {region_code} 자외선 지수 미리 조회 실패: {str(e)}")
+                return False
+
+    results = await asyncio.gather(*(warm(region_code) for region_code in region_codes))
+    logger.info(f"자외선 지수 미리 조회 완료: {sum(results)}/{len(results)}개 지역 ({issuance:%Y%m%d%H})")
+
+async def _fetch_uv_series(region_code: str, issuance: datetime) -> Dict[str, Any]:
+    """
+    자외선 지수 예보 조회
+    :param region_code: 지역 코드 (areaNo)
+    :param issuance: 발표 시각
+    :return: {"issuance": "YYYYMMDDHH", "values": {"h0": "3", "h3": "5", ... "h24": "0"}} (장애 대체 응답이면 ShortLivedValue로 감쌈)
+    """
     params = {
         "pageNo": 1,
         "numOfRows": 10,
         "dataType": "JSON",
         "areaNo": region_code,
-        "time": current_datetime,
+        "time": issuance.strftime("%Y%m%d%H"),
     }
     
     url = f"{settings.GOV_DATA_BASE_URL}{settings.GOV_DATA_WEATHER_LIVING_UV_URL}"
 
     try:
         response = await make_request(url=url, params=params)
-        data = response.json()
+        data = response.data
 
         items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
         if not items:
@@ -847,32 +1047,21 @@ async def get_weather_uvindex(lat: float, lon: float) -> int:
             raise HTTPException(status_code=500, detail="자외선 지수 정보를 찾을 수 없습니다.")
         
         uv_data = items[0]
-            
-        best_uv_index = "0"
-        min_hour_diff = float('inf')
-
+        values = {}
         for hour_offset in range(0, 25, 3):
-            key = f"h{hour_offset}"
-            if key in uv_data:
-                uv_value = uv_data[key]
+            uv_value = uv_data.get(f"h{hour_offset}")
+            if uv_value == "" or uv_value is None:
+                continue
+            values[f"h{hour_offset}"] = uv_value
 
-                if uv_value == "" or uv_value is None:
-                    continue
-                
-                hour_diff = abs(current_hour - hour_offset)
-        
-                if hour_diff > 12:
-                    hour_diff = 24 - hour_diff
-                
-                if hour_diff < min_hour_diff:
-                    min_hour_diff = hour_diff
-                    best_uv_index = uv_value
-        try:
-            return int(float(best_uv_index)) if best_uv_index and best_uv_index.strip() != "" else 0
-        except (ValueError, AttributeError):
-            return 0
+        series = {
+            # 응답의 발표 시각(date)을 우선 사용
+            "issuance": str(uv_data.get("date") or issuance.strftime("%Y%m%d%H"))[:10],
+            "values": values,
+        }
+        return ShortLivedValue(series) if response.stale else series
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"자외선 지수 조회 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"자외선 지수 조회 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"자외선 지수 조회 오류: {str(e)}")
@@ -0,0 +1,55 @@
+"""
+일출/일몰 계산값 검증 (한국천문연구원 출몰시각 API와 비교)
+실행: python -m app.tests.sun_validation --days 30 --locations 10
+서비스 키(GOV_DATA_API_KEY_*)와 GOV_DATA_ASTRONOMY_SUN_URL 설정이 필요함
+"""
+import argparse
+import asyncio
+from datetime import date, timedelta
+from typing import List, Optional
+from app.services.astronomy_service import fetch_kasi_sunrise_sunset, get_sun_cell
+from scripts.benchmark.runner import load_locations
+from app.utils.solar_calculator import calculate_sunrise_sunset
+
+def _diff_minutes(calculated: Optional[str], expected: Optional[str]) -> Optional[int]:
+    if not calculated or not expected:
+        return None
+    to_minutes = lambda value: int(value[:2]) * 60 + int(value[3:5])
+    return to_minutes(calculated) - to_minutes(expected)
+
+async def validate(days: int, locations: int, seed: int, start: date) -> List[int]:
+    diffs: List[int] = []
+    for location in load_locations(locations, seed):
+        lat, lon = get_sun_cell(location["lat"], location["lon"])
+        for offset in range(days):
+            target_date = start + timedelta(days=offset)
+            expected = await fetch_kasi_sunrise_sunset(lat, lon, target_date)
+            if expected is None:
+                continue
+            calculated = calculate_sunrise_sunset(lat, lon, target_date)
+            for event in ("sunrise", "sunset"):
+                diff = _diff_minutes(calculated[event], expected[event])
+                if diff is None:
+                    continue
+                diffs.append(diff)
+                if abs(diff) > 1:
+                    print(f"  {target_date} ({lat}, {lon}) {event}: 계산 {calculated[event]} / 천문연 {expected[event]}")
+    return diffs
+
+def main():
+    parser = argparse.ArgumentParser(description="일출/일몰 계산값 검증")
+    parser.add_argument("--days", type=int, default=30, help="검증할 날짜 수")
+    parser.add_argument("--locations", type=int, default=10, help="검증할 좌표 수")
+    parser.add_argument("--seed", type=int, default=42, help="좌표 선택 시드")
+    parser.add_argument("--start", type=date.fromisoformat, default=date.today(), help="시작 날짜 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    diffs = asyncio.run(validate(args.days, args.locations, args.seed, args.start))
+    if not diffs:
+        raise SystemExit("비교할 천문연 데이터가 없습니다.")
+
+    within_one = sum(1 for diff in diffs if abs(diff) <= 1)
+    print(f"비교 {len(diffs)}건, 최대 오차 {max(abs(diff) for diff in diffs)}분, 1분 이내 {within_one / len(diffs):.1%}")
+
+if __name__ == "__main__":
+    main()
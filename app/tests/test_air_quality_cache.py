@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+import pytest
+import app.services.air_quality as air_quality_module
+from app.services.air_quality import (
+    WEEKLY_AIR_QUALITY_STANDARDS,
+    build_hourly_air_quality_table,
+    build_weekly_region_scores,
+    extract_region_data_from_cache,
+    parse_region_data,
+    process_air_quality_data,
+)
+from scripts.fake_upstream.responses import AIR_QUALITY_REGIONS, air_quality_forecast, air_quality_weekly, seeded_random
+from app.utils.airquality_calculator import convert_grade_to_value_for_hour, convert_grade_to_value_for_week
+
+SEOUL = (37.5665, 126.978)
+SUWON = (37.2636, 127.0286)  # 예보 지역명 "경기남부"
+# 20시 기준 최신 발표는 17시 발표
+NOW = datetime(2025, 7, 19, 20, 10)
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+@pytest.fixture
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(air_quality_module, "datetime", FixedDatetime)
+
+def _hourly_raw():
+    params = {"searchDate": NOW.strftime("%Y-%m-%d"), "returnType": "json", "numOfRows": 100, "pageNo": 1}
+    return air_quality_forecast(params, seeded_random("getMinuDustFrcstDspth", params), NOW)
+
+@pytest.mark.unit
+def test_hourly_table_structure():
+    """발표("YYYY-MM-DD HH") -> 예보 일자 -> 지역 -> PM10/PM2.5 등급"""
+    table = build_hourly_air_quality_table(_hourly_raw())
+
+    # 20시 기준으로 05/11/17시 발표까지만 존재
+    assert sorted(table) == ["2025-07-19 05", "2025-07-19 11", "2025-07-19 17"]
+    for days in table.values():
+        assert sorted(days) == ["2025-07-19", "2025-07-20", "2025-07-21"]
+        for regions in days.values():
+            assert set(regions) == set(AIR_QUALITY_REGIONS)
+            for grades in regions.values():
+                assert set(grades) == {"pm10_grade", "pm25_grade"}
+                assert all(grade in (1, 2, 3, 4) for grade in grades.values())
+
+@pytest.mark.unit
+def test_hourly_table_matches_raw_region_strings():
+    """표의 등급이 원본 지역 문자열을 직접 파싱한 값과 같음"""
+    raw = _hourly_raw()
+    table = build_hourly_air_quality_table(raw)
+    field = {"PM10": "pm10_grade", "PM25": "pm25_grade"}
+
+    for item in raw["response"]["body"]["items"]:
+        # "2025-07-19 5시 발표" -> "2025-07-19 05"
+        issue_date, issue_hour = item["dataTime"].split()[:2]
+        issuance = f"{issue_date} {int(issue_hour.rstrip('시')):02d}"
+        regions = table[issuance][item["informData"]]
+        for region in AIR_QUALITY_REGIONS:
+            expected = convert_grade_to_value_for_hour(parse_region_data(item["informGrade"], region))
+            assert regions[region][field[item["informCode"]]] == expected
+
+@pytest.mark.unit
+def test_hourly_table_skips_malformed_items():
+    """발표 시각/예보 코드/예보 일자가 없는 항목은 제외"""
+    raw = {"response": {"body": {"items": [
+        {"dataTime": "발표 없음", "informCode": "PM10", "informData": "2025-07-19", "informGrade": "서울 : 좋음"},
+        {"dataTime": "2025-07-19 17시 발표", "informCode": "O3", "informData": "2025-07-19", "informGrade": "서울 : 좋음"},
+        {"dataTime": "2025-07-19 17시 발표", "informCode": "PM10", "informData": "", "informGrade": "서울 : 좋음"},
+    ]}}}
+    assert build_hourly_air_quality_table(raw) == {}
+    assert build_hourly_air_quality_table({}) == {}
+
+@pytest.mark.unit
+def test_hourly_lookup_uses_latest_issuance_and_region(fixed_now):
+    """최신 발표의 예보 일자별 지역 등급을 시간마다 조회"""
+    table = build_hourly_air_quality_table(_hourly_raw())
+    result = process_air_quality_data(table, *SEOUL, hours=6)
+
+    latest = table["2025-07-19 17"]
+    forecasts = result["forecasts"]
+    assert len(forecasts) == 6
+    for i, forecast in enumerate(forecasts, start=1):
+        moment = NOW.replace(minute=0) + timedelta(hours=i)
+        assert forecast["base_date"] == moment.strftime("%Y%m%d")
+        assert forecast["base_time"] == moment.strftime("%H00")
+        expected = latest[moment.strftime("%Y-%m-%d")]["서울"]
+        assert forecast["pm10_grade"] == expected["pm10_grade"]
+        assert forecast["pm25_grade"] == expected["pm25_grade"]
+
+@pytest.mark.unit
+def test_hourly_lookup_region_fallbacks(fixed_now):
+    """예보 지역명이 없으면 보통(2), 예보 일자가 없으면 발표일 값 사용"""
+    table = {"2025-07-19 17": {"2025-07-19": {"서울": {"pm10_grade": 4, "pm25_grade": 3}}}}
+
+    seoul = process_air_quality_data(table, *SEOUL, hours=6)["forecasts"]
+    assert all(forecast["pm10_grade"] == 4 and forecast["pm25_grade"] == 3 for forecast in seoul)
+
+    suwon = process_air_quality_data(table, *SUWON, hours=1)["forecasts"]
+    assert suwon[0]["pm10_grade"] == 2 and suwon[0]["pm25_grade"] == 2
+
+@pytest.mark.unit
+def test_hourly_lookup_without_latest_issuance_raises(fixed_now):
+    """최신 발표의 발표일 데이터가 없으면 404"""
+    table = {"2025-07-19 11": {"2025-07-19": {"서울": {"pm10_grade": 1, "pm25_grade": 1}}}}
+    with pytest.raises(air_quality_module.HTTPException) as error:
+        process_air_quality_data(table, *SEOUL, hours=1)
+    assert error.value.status_code == 404
+    assert process_air_quality_data({}, *SEOUL, hours=1) == {"forecasts": []}
+
+def _weekly_item():
+    params = {"searchDate": NOW.strftime("%Y-%m-%d"), "returnType": "json", "numOfRows": 100, "pageNo": 1}
+    return air_quality_weekly(params, seeded_random("getMinuDustWeekFrcstDspth", params), NOW)["response"]["body"]["items"][0]
+
+@pytest.mark.unit
+def test_weekly_region_scores_structure():
+    """지역 -> 기준(korean_standard/who_standard) -> 점수, 원본 문자열 파싱 결과와 같음"""
+    forecast_value = _weekly_item()["frcstOneCn"]
+    scores = build_weekly_region_scores(forecast_value)
+
+    assert set(scores) == set(AIR_QUALITY_REGIONS)
+    for region, region_scores in scores.items():
+        assert set(region_scores) == set(WEEKLY_AIR_QUALITY_STANDARDS)
+        for standard, score in region_scores.items():
+            assert score == convert_grade_to_value_for_week(parse_region_data(forecast_value, region), standard)
+
+@pytest.mark.unit
+def test_weekly_region_scores_without_data():
+    """예보 문자열이 없으면 빈 표"""
+    assert build_weekly_region_scores("정보없음") == {}
+    assert build_weekly_region_scores("") == {}
+
+@pytest.mark.unit
+def test_weekly_lookup_by_region_and_standard():
+    """캐시된 지역별 점수에서 사용자 지역/기준 점수 조회, 요청 일수만큼만 반환"""
+    item = _weekly_item()
+    cached_forecasts = [
+        {"base_date": item[f"frcst{name}Dt"].replace("-", ""), "regions": build_weekly_region_scores(item[f"frcst{name}Cn"])}
+        for name in ["One", "Two", "Three", "Four"]
+    ]
+
+    for standard in WEEKLY_AIR_QUALITY_STANDARDS:
+        result = extract_region_data_from_cache(cached_forecasts, *SUWON, standard, days=3)["forecasts"]
+        assert [forecast["base_date"] for forecast in result] == [forecast["base_date"] for forecast in cached_forecasts[:3]]
+        for forecast, cached in zip(result, cached_forecasts):
+            assert forecast["air_quality_score"] == cached["regions"]["경기남부"][standard]
+
+@pytest.mark.unit
+def test_weekly_lookup_missing_region_uses_no_data_score():
+    """지역 정보가 없으면 "정보없음" 점수 (기존 문자열 조회와 같음)"""
+    cached_forecasts = [{"base_date": "20250722", "regions": {}}]
+    result = extract_region_data_from_cache(cached_forecasts, *SEOUL, "korean_standard", days=7)["forecasts"]
+    assert result == [{"base_date": "20250722", "air_quality_score": convert_grade_to_value_for_week("정보없음", "korean_standard")}]
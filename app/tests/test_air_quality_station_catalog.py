@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+import app.services.air_quality_station_catalog as catalog_module
+from app.common.cache_codec import cache_codec
+from app.common.http_client import UpstreamResponse
+from app.services.air_quality_station_catalog import AirQualityStationCatalog
+from app.utils.convert_for_tm import convert_wgs84_to_katec
+
+# 기준점(200000, 450000)에서의 거리: 중앙 0, 동쪽 100, 북쪽 200, 서쪽 300, 남쪽 400
+STATIONS = [
+    {"stationName": "남쪽", "tmX": 200000.0, "tmY": 449600.0},
+    {"stationName": "동쪽", "tmX": 200100.0, "tmY": 450000.0},
+    {"stationName": "서쪽", "tmX": 199700.0, "tmY": 450000.0},
+    {"stationName": "중앙", "tmX": 200000.0, "tmY": 450000.0},
+    {"stationName": "북쪽", "tmX": 200000.0, "tmY": 450200.0},
+]
+
+@pytest.fixture
+def catalog():
+    station_catalog = AirQualityStationCatalog()
+    station_catalog._build_index(STATIONS, "2025-07-19T03:00:00")
+    return station_catalog
+
+@pytest.mark.unit
+def test_find_nearest_orders_by_distance(catalog):
+    """가까운 순서로 요청한 수만큼 반환"""
+    assert catalog.find_nearest(200000.0, 450000.0, 3) == ["중앙", "동쪽", "북쪽"]
+    assert catalog.find_nearest(200000.0, 450000.0, 1) == ["중앙"]
+    # 기준점이 바뀌면 순서도 바뀜
+    assert catalog.find_nearest(199650.0, 450000.0, 2) == ["서쪽", "중앙"]
+    assert catalog.find_nearest(200000.0, 449500.0, 2) == ["남쪽", "중앙"]
+
+@pytest.mark.unit
+def test_find_nearest_count_larger_than_catalog(catalog):
+    """요청 수가 측정소 수 이상이면 전체를 가까운 순서로 반환"""
+    expected = ["중앙", "동쪽", "북쪽", "서쪽", "남쪽"]
+    assert catalog.find_nearest(200000.0, 450000.0, len(STATIONS)) == expected
+    assert catalog.find_nearest(200000.0, 450000.0, 100) == expected
+
+@pytest.mark.unit
+def test_find_nearest_without_catalog():
+    """목록을 불러오기 전에는 빈 목록 (호출자는 근접측정소 API 사용)"""
+    assert AirQualityStationCatalog().find_nearest(200000.0, 450000.0, 3) == []
+
+@pytest.mark.unit
+def test_parse_station_converts_dm_to_katec():
+    """dmX는 위도, dmY는 경도로 읽어 TM(EPSG:5181) 좌표로 변환"""
+    station = AirQualityStationCatalog._parse_station({"stationName": "중구", "dmX": "37.564639", "dmY": "126.975961"})
+    tmx, tmy = convert_wgs84_to_katec(37.564639, 126.975961)
+    assert station == {"stationName": "중구", "tmX": round(tmx, 1), "tmY": round(tmy, 1)}
+    # 서울 중구: 원점(38N, 127E, 200000/500000) 기준 약간 서쪽/남쪽
+    assert 197000 < station["tmX"] < 199000
+    assert 451000 < station["tmY"] < 452500
+
+@pytest.mark.unit
+@pytest.mark.parametrize("item", [
+    {"stationName": "좌표없음", "dmX": "", "dmY": "126.9"},
+    {"stationName": "좌표오류", "dmX": "-", "dmY": "126.9"},
+    {"stationName": "", "dmX": "37.5", "dmY": "126.9"},
+    {"dmX": "37.5", "dmY": "126.9"},
+])
+def test_parse_station_skips_invalid_items(item):
+    """이름/좌표가 없는 측정소는 제외"""
+    assert AirQualityStationCatalog._parse_station(item) is None
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+@pytest.mark.unit
+def test_refresh_pages_through_station_list(monkeypatch):
+    """측정소 목록을 페이지 단위로 모두 받아 변환 후 Redis에 저장, 다른 워커는 Redis에서 로드"""
+    fake_redis = FakeRedis()
+    pages = {
+        1: [{"stationName": f"측정소{i}", "dmX": f"{37.0 + i * 0.01:.6f}", "dmY": "127.000000"} for i in range(1000)],
+        2: [{"stationName": "측정소1000", "dmX": "36.000000", "dmY": "127.000000"}, {"stationName": "좌표없음", "dmX": "", "dmY": ""}],
+    }
+    requested_pages = []
+
+    async def get_client():
+        return fake_redis
+
+    async def make_request(url, params=None, **kwargs):
+        requested_pages.append(params["pageNo"])
+        body = {"items": pages[params["pageNo"]], "totalCount": 1002}
+        return UpstreamResponse(status_code=200, content=b"", result_code="00", result_msg="NORMAL_CODE", data={"response": {"body": body}})
+
+    monkeypatch.setattr(catalog_module, "get_redis_binary_client", get_client)
+    monkeypatch.setattr(catalog_module, "make_request", make_request)
+
+    catalog = AirQualityStationCatalog()
+    asyncio.run(catalog.refresh())
+    assert requested_pages == [1, 2]
+    assert len(catalog._names) == 1001
+
+    # 원점(38N, 127E)에 가장 가까운 측정소부터
+    tmx, tmy = convert_wgs84_to_katec(38.0, 127.0)
+    assert catalog.find_nearest(tmx, tmy, 2) == ["측정소100", "측정소99"]
+
+    stored = cache_codec.decode(fake_redis.data[AirQualityStationCatalog.CACHE_KEY])
+    assert len(stored["stations"]) == 1001
+
+    other_worker = AirQualityStationCatalog()
+    assert asyncio.run(other_worker.ensure_loaded())
+    assert requested_pages == [1, 2]
+    assert other_worker.find_nearest(tmx, tmy, 2) == ["측정소100", "측정소99"]
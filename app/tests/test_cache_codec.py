@@ -0,0 +1,74 @@
+import json
+import pytest
+from app.common.cache_codec import CODEC_VERSION, COMPRESSIONS, FORMATS, HEADER, MAGIC, CacheCodec, CacheCodecError
+
+FORECAST = {"20250101-1200": {"TMP": "3", "SKY": "1", "PTY": "0"}, "regions": ["서울", "부산"], "score": 87.5}
+
+@pytest.fixture
+def codec():
+    return CacheCodec("json", "zlib", compress_min_bytes=64)
+
+def _header(data: bytes):
+    return HEADER.unpack_from(data)
+
+@pytest.mark.unit
+def test_small_value_round_trip_without_compression(codec):
+    """작은 값은 압축하지 않고 헤더만 붙여 저장"""
+    encoded = codec.encode({"a": 1})
+    assert _header(encoded) == (MAGIC, CODEC_VERSION, FORMATS["json"], COMPRESSIONS["none"])
+    assert codec.decode(encoded) == {"a": 1}
+
+@pytest.mark.unit
+def test_large_value_round_trip_with_compression(codec):
+    """기준 크기 이상은 압축해서 저장"""
+    value = {**FORECAST, "padding": ["비"] * 200}
+    encoded = codec.encode(value)
+    assert _header(encoded)[3] == COMPRESSIONS["zlib"]
+    assert len(encoded) < len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+    assert codec.decode(encoded) == value
+
+@pytest.mark.unit
+def test_legacy_headerless_json_is_decoded(codec):
+    """헤더 없는 값은 이전 방식(JSON 문자열)으로 읽음"""
+    legacy = json.dumps(FORECAST, ensure_ascii=False)
+    assert codec.decode(legacy) == FORECAST
+    assert codec.decode(legacy.encode("utf-8")) == FORECAST
+
+@pytest.mark.unit
+def test_values_written_with_other_settings_are_readable(codec):
+    """압축 설정이 바뀌어도 기존 값은 헤더대로 읽음"""
+    uncompressed = CacheCodec("json", "none", compress_min_bytes=0).encode(FORECAST)
+    compressed = CacheCodec("json", "zlib", compress_min_bytes=0).encode(FORECAST)
+    assert codec.decode(uncompressed) == FORECAST
+    assert codec.decode(compressed) == FORECAST
+
+@pytest.mark.unit
+def test_unavailable_codec_falls_back():
+    """설치되지 않았거나 알 수 없는 방식은 json/zlib으로 대체"""
+    codec = CacheCodec("unknown", "unknown", compress_min_bytes=0)
+    assert codec.format_id == FORMATS["json"]
+    assert codec.compression_id == COMPRESSIONS["zlib"]
+    assert codec.decode(codec.encode(FORECAST)) == FORECAST
+
+@pytest.mark.unit
+def test_bytes_round_trip_and_legacy_bytes(codec):
+    """업스트림 응답 본문은 바이트 그대로 저장/조회, 헤더 없는 값은 본문 그대로"""
+    body = b'{"response": {"header": {"resultCode": "00"}}}' * 10
+    encoded = codec.encode_bytes(body)
+    assert _header(encoded)[2] == FORMATS["raw"]
+    assert codec.decode_bytes(encoded) == body
+    assert codec.decode_bytes(body) == body
+
+@pytest.mark.unit
+def test_decode_bytes_rejects_serialized_values(codec):
+    """직렬화된 값을 바이트로 읽으면 에러"""
+    with pytest.raises(CacheCodecError):
+        codec.decode_bytes(codec.encode(FORECAST))
+
+@pytest.mark.unit
+def test_unknown_version_raises(codec):
+    """알 수 없는 버전은 CacheCodecError (호출자는 캐시 없음으로 처리)"""
+    data = HEADER.pack(MAGIC, CODEC_VERSION + 1, FORMATS["json"], COMPRESSIONS["none"]) + b"{}"
+    with pytest.raises(CacheCodecError):
+        codec.decode(data)
+    assert issubclass(CacheCodecError, ValueError)
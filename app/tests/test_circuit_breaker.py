@@ -0,0 +1,85 @@
+import pytest
+import app.common.circuit_breaker as circuit_breaker_module
+from app.common.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+class FakeClock:
+    """time.monotonic 대체 (테스트에서 시간을 직접 진행)"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "time", fake_clock)
+    return fake_clock
+
+@pytest.mark.unit
+def test_closed_open_half_open_closed(clock):
+    """연속 실패 -> open -> 복구 시간 후 half-open 시험 호출 한 건 -> 성공 시 closed"""
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=30)
+
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 29
+    assert not breaker.allow_request()
+
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # 시험 호출이 끝나기 전에는 다른 요청 차단
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert breaker.allow_request()
+
+@pytest.mark.unit
+def test_success_resets_consecutive_failures(clock):
+    """중간에 성공하면 연속 실패 수 초기화"""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.unit
+def test_half_open_failure_reopens(clock):
+    """half-open 시험 호출이 실패하면 다시 open, 복구 시간도 다시 시작"""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 10
+    assert not breaker.allow_request()
+
+@pytest.mark.unit
+def test_lost_probe_is_retried_after_recovery_timeout(clock):
+    """결과가 기록되지 않은 시험 호출은 복구 시간이 지나면 다시 허용"""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow_request()
+    clock.now += 30
+    assert breaker.allow_request()
+
+@pytest.mark.unit
+def test_registry_shares_breaker_per_path():
+    """같은 경로는 호스트/쿼리와 무관하게 같은 브레이커 사용"""
+    registry = CircuitBreakerRegistry()
+    first = registry.get("http://a/1360000/getVilageFcst?x=1")
+    assert first is registry.get("http://b/1360000/getVilageFcst")
+    assert first is not registry.get("http://a/1360000/getUltraSrtFcst")
@@ -0,0 +1,138 @@
+import asyncio
+import pytest
+from app.common.budget import TokenBucketBudget
+from app.common.hedging import LatencyTracker, RequestHedger
+from app.core.config import settings
+
+URL = "http://api/1360000/VilageFcstInfoService_2.0/getVilageFcst"
+DELAY = 0.05
+
+@pytest.fixture
+def hedger(monkeypatch):
+    """최근 응답 시간 p95 = DELAY초, 최소 대기 시간 없음"""
+    monkeypatch.setattr(settings, "UPSTREAM_HEDGE_PERCENTILE", 95.0)
+    monkeypatch.setattr(settings, "UPSTREAM_HEDGE_MIN_SAMPLES", 20)
+    monkeypatch.setattr(settings, "UPSTREAM_HEDGE_MIN_DELAY_SECONDS", 0.0)
+    request_hedger = RequestHedger()
+    request_hedger.budget = TokenBucketBudget(ratio=0.0, burst=10.0)
+    for _ in range(20):
+        request_hedger.record_latency(URL, DELAY)
+    return request_hedger
+
+class Call:
+    """헤지 테스트용 요청 (지연 후 값 반환 또는 에러, 시작/취소 시각 기록)"""
+    def __init__(self, delay: float, result=None, error: Exception = None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.started_at = None
+        self.cancelled = False
+
+    async def __call__(self):
+        loop = asyncio.get_running_loop()
+        self.started_at = loop.time()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+def _run(hedger: RequestHedger, primary: Call, hedge: Call):
+    async def main():
+        started_at = asyncio.get_running_loop().time()
+        result = await hedger.run(URL, primary, hedge)
+        # 취소된 요청이 정리될 때까지 한 번 양보
+        await asyncio.sleep(0)
+        return result, started_at
+
+    return asyncio.run(main())
+
+@pytest.mark.unit
+def test_latency_percentile():
+    """엔드포인트별 최근 응답 시간 백분위수, 표본 부족 시 None"""
+    tracker = LatencyTracker(max_samples=100)
+    for seconds in range(1, 101):
+        tracker.record("/a", seconds / 100)
+    assert tracker.percentile("/a", 95) == 0.95
+    assert tracker.percentile("/a", 50) == 0.5
+    assert tracker.percentile("/a", 95, min_samples=101) is None
+    assert tracker.percentile("/b", 95) is None
+
+@pytest.mark.unit
+def test_fast_primary_does_not_hedge(hedger):
+    """백분위 지연 안에 응답하면 헤지 요청 없음"""
+    primary, hedge = Call(0.0, "primary"), Call(0.0, "hedge")
+    result, _ = _run(hedger, primary, hedge)
+    assert result == "primary"
+    assert hedge.started_at is None
+
+@pytest.mark.unit
+def test_no_hedge_without_enough_samples(hedger, monkeypatch):
+    """표본이 부족하면 헤지하지 않고 기본 요청만 대기"""
+    monkeypatch.setattr(settings, "UPSTREAM_HEDGE_MIN_SAMPLES", 21)
+    primary, hedge = Call(DELAY * 2, "primary"), Call(0.0, "hedge")
+    result, _ = _run(hedger, primary, hedge)
+    assert result == "primary"
+    assert hedge.started_at is None
+
+@pytest.mark.unit
+def test_hedge_fires_after_percentile_delay(hedger):
+    """기본 요청이 백분위 지연을 넘으면 헤지 요청을 보내고, 먼저 성공한 결과 사용 (늦은 요청은 취소)"""
+    primary, hedge = Call(1.0, "primary"), Call(0.0, "hedge")
+    result, started_at = _run(hedger, primary, hedge)
+    assert result == "hedge"
+    assert hedge.started_at - started_at >= DELAY
+    assert primary.cancelled
+
+@pytest.mark.unit
+def test_primary_wins_and_hedge_is_cancelled(hedger):
+    """헤지 요청 후 기본 요청이 먼저 끝나면 헤지 요청 취소"""
+    primary, hedge = Call(DELAY * 2, "primary"), Call(1.0, "hedge")
+    result, _ = _run(hedger, primary, hedge)
+    assert result == "primary"
+    assert hedge.started_at is not None
+    assert hedge.cancelled
+
+@pytest.mark.unit
+def test_budget_blocks_hedge(hedger):
+    """헤지 예산이 없으면 헤지하지 않고 기본 요청 대기"""
+    hedger.budget = TokenBucketBudget(ratio=0.0, burst=0.0)
+    primary, hedge = Call(DELAY * 2, "primary"), Call(0.0, "hedge")
+    result, _ = _run(hedger, primary, hedge)
+    assert result == "primary"
+    assert hedge.started_at is None
+
+@pytest.mark.unit
+def test_fast_error_does_not_beat_slower_success(hedger):
+    """먼저 끝난 요청이 실패해도 나머지 요청의 성공 결과 사용"""
+    primary, hedge = Call(DELAY * 2, error=RuntimeError("primary 5xx")), Call(DELAY * 3, "hedge")
+    assert _run(hedger, primary, hedge)[0] == "hedge"
+
+    primary, hedge = Call(DELAY * 3, "primary"), Call(0.0, error=RuntimeError("hedge 22"))
+    assert _run(hedger, primary, hedge)[0] == "primary"
+
+@pytest.mark.unit
+def test_both_fail_raises_first_error(hedger):
+    """두 요청 모두 실패하면 먼저 실패한 에러 전달"""
+    primary, hedge = Call(DELAY * 2, error=RuntimeError("primary")), Call(DELAY * 4, error=RuntimeError("hedge"))
+    with pytest.raises(RuntimeError, match="primary"):
+        _run(hedger, primary, hedge)
+
+@pytest.mark.unit
+def test_caller_cancellation_cancels_both(hedger):
+    """호출자가 취소되면 진행 중인 요청 모두 취소"""
+    primary, hedge = Call(1.0, "primary"), Call(1.0, "hedge")
+
+    async def main():
+        task = asyncio.ensure_future(hedger.run(URL, primary, hedge))
+        await asyncio.sleep(DELAY * 2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert primary.cancelled and hedge.cancelled
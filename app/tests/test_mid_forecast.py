@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime
+import pytest
+import app.common.swr_cache as swr_cache_module
+import app.services.weather_service as weather_service
+from app.common.http_client import UpstreamResponse
+from app.common.swr_cache import ShortLivedValue
+from app.core.config import settings
+from app.services.weather_service import _fetch_mid_range_forecast, get_mid_forecast_issuance, get_mid_range_forecast
+
+REGION_ID = "11B10101"
+
+def _fix_now(monkeypatch, now: datetime):
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(weather_service, "datetime", FixedDatetime)
+
+def _mid_items():
+    """getMidTa/getMidLandFcst 응답 항목 (일차 i의 최저기온 = i, 최고기온 = i + 10)"""
+    temp_item = {f"taMin{day}": day for day in range(3, 11)}
+    temp_item.update({f"taMax{day}": day + 10 for day in range(3, 11)})
+    temp_item.update({f"rnSt{day}Am": 10 * day for day in range(3, 7)})
+    temp_item.update({f"rnSt{day}Pm": 0 for day in range(3, 8)})
+    temp_item.update({"rnSt7Am": 0, "rnSt8": 80, "rnSt9": 90, "rnSt10": 0})
+    weather_item = {f"wf{day}Pm": "맑음" for day in range(3, 8)}
+    weather_item.update({f"wf{day}": "흐리고 비" for day in range(8, 11)})
+    return temp_item, weather_item
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """중기예보 업스트림 대체 (요청 파라미터 기록, 응답 항목/대체 응답 여부 변경 가능)"""
+    temp_item, weather_item = _mid_items()
+    state = {"temp": [temp_item], "weather": [weather_item], "stale": False, "requests": []}
+
+    async def make_request(url, params=None, **kwargs):
+        state["requests"].append((url, dict(params)))
+        items = state["temp"] if url.endswith(settings.GOV_DATA_WEATHER_MID_OUTLOOK_URL) else state["weather"]
+        data = {"response": {"header": {"resultCode": "00"}, "body": {"items": {"item": items}}}}
+        return UpstreamResponse(status_code=200, content=b"", result_code="00", result_msg="NORMAL_SERVICE", data=data, stale=state["stale"])
+
+    monkeypatch.setattr(settings, "GOV_DATA_WEATHER_MID_OUTLOOK_URL", "/1360000/MidFcstInfoService/getMidTa")
+    monkeypatch.setattr(settings, "GOV_DATA_WEATHER_MID_LAND_URL", "/1360000/MidFcstInfoService/getMidLandFcst")
+    monkeypatch.setattr(weather_service, "make_request", make_request)
+    return state
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, expected", [
+    # 06시 전에는 전날 18시 발표 (5일차부터)
+    (datetime(2025, 7, 19, 0, 0), ("202507181800", 5)),
+    (datetime(2025, 7, 19, 5, 59), ("202507181800", 5)),
+    # 06시 ~ 17시 59분은 당일 06시 발표 (4일차부터)
+    (datetime(2025, 7, 19, 6, 0), ("202507190600", 4)),
+    (datetime(2025, 7, 19, 17, 59), ("202507190600", 4)),
+    # 18시 이후는 당일 18시 발표 (5일차부터)
+    (datetime(2025, 7, 19, 18, 0), ("202507191800", 5)),
+    (datetime(2025, 7, 19, 23, 59), ("202507191800", 5)),
+    # 연/월이 바뀌는 새벽
+    (datetime(2025, 1, 1, 3, 0), ("202412311800", 5)),
+    (datetime(2024, 3, 1, 5, 0), ("202402291800", 5)),
+])
+def test_mid_forecast_issuance(now, expected):
+    """현재 시각에 사용할 발표 시각(tmFc)과 시작 일차"""
+    assert get_mid_forecast_issuance(now) == expected
+
+@pytest.mark.unit
+def test_fetch_normalizes_days_by_index(upstream):
+    """발표 단위 값은 날짜 대신 일차(day)로 저장, 시작 일차부터 10일차까지"""
+    forecast = asyncio.run(_fetch_mid_range_forecast(REGION_ID, "202507190600", 4))
+
+    assert [request[1]["tmFc"] for request in upstream["requests"]] == ["202507190600", "202507190600"]
+    assert [day["day"] for day in forecast["days"]] == [4, 5, 6, 7, 8, 9, 10]
+    day4, day8 = forecast["days"][0], forecast["days"][4]
+    assert (day4["min_temperature"], day4["max_temperature"]) == (4.0, 14.0)
+    assert day4["precipitation_probability"] == 40
+    assert (day8["min_temperature"], day8["max_temperature"]) == (8.0, 18.0)
+    assert day8["precipitation_probability"] == 80
+    assert "base_date" not in day4
+
+@pytest.mark.unit
+def test_fetch_skips_days_without_values(upstream):
+    """기온/하늘상태 값이 없는 일차는 제외"""
+    del upstream["temp"][0]["taMax6"]
+    del upstream["weather"][0]["wf9"]
+    forecast = asyncio.run(_fetch_mid_range_forecast(REGION_ID, "202507191800", 5))
+    assert [day["day"] for day in forecast["days"]] == [5, 7, 8, 10]
+
+@pytest.mark.unit
+@pytest.mark.parametrize("empty", ["temp", "weather"])
+def test_fetch_empty_response_raises(upstream, empty):
+    """둘 중 한 응답이라도 비어 있으면 ValueError (캐시하지 않음)"""
+    upstream[empty] = []
+    with pytest.raises(ValueError):
+        asyncio.run(_fetch_mid_range_forecast(REGION_ID, "202507190600", 4))
+
+@pytest.mark.unit
+def test_fetch_stale_response_is_short_lived(upstream):
+    """장애 대체 응답으로 만든 값은 짧게 캐시하도록 감쌈"""
+    upstream["stale"] = True
+    forecast = asyncio.run(_fetch_mid_range_forecast(REGION_ID, "202507190600", 4))
+    assert isinstance(forecast, ShortLivedValue)
+    assert forecast.value["days"][0]["day"] == 4
+
+def _stub_region_forecast(monkeypatch, days):
+    calls = []
+
+    async def get_mid_forecast_by_region(region_id, tm_fc, mid_start_day):
+        calls.append((region_id, tm_fc, mid_start_day))
+        return {"days": [{"day": day, "min_temperature": float(day)} for day in days]}
+
+    monkeypatch.setattr(weather_service, "convert_grid_to_region", lambda nx, ny: REGION_ID)
+    monkeypatch.setattr(weather_service, "get_mid_forecast_by_region", get_mid_forecast_by_region)
+    return calls
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, tm_fc, days, expected_dates", [
+    # 일차 i -> 조회 일자 + (i - 2)일
+    (datetime(2025, 7, 19, 10, 0), "202507190600", [4, 5, 10], ["20250721", "20250722", "20250727"]),
+    (datetime(2025, 7, 19, 20, 0), "202507191800", [5, 6], ["20250722", "20250723"]),
+    # 자정 이후 전날 18시 발표를 사용해도 조회 일자 기준
+    (datetime(2025, 7, 20, 1, 0), "202507191800", [5, 6], ["20250723", "20250724"]),
+    # 월/연 경계
+    (datetime(2025, 12, 30, 12, 0), "202512300600", [4, 10], ["20260101", "20260107"]),
+    (datetime(2024, 2, 27, 12, 0), "202402270600", [4, 5], ["20240229", "20240301"]),
+])
+def test_mid_range_forecast_dates_are_derived_at_read_time(monkeypatch, now, tm_fc, days, expected_dates):
+    """저장된 일차를 조회 시점에 날짜로 변환 (캐시 도중 날짜가 바뀌어도 다시 계산)"""
+    _fix_now(monkeypatch, now)
+    calls = _stub_region_forecast(monkeypatch, days)
+
+    forecasts = asyncio.run(get_mid_range_forecast(60, 127))
+    assert calls == [(REGION_ID, tm_fc, get_mid_forecast_issuance(now)[1])]
+    assert [forecast["base_date"] for forecast in forecasts] == expected_dates
+    assert [forecast["min_temperature"] for forecast in forecasts] == [float(day) for day in days]
+    assert all("day" not in forecast for forecast in forecasts)
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (swr_cache가 사용하는 명령만 지원)"""
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def register_script(self, script):
+        async def release(keys, args):
+            if self.data.get(keys[0]) == args[0]:
+                del self.data[keys[0]]
+        release.registered_client = self
+        return release
+
+@pytest.mark.unit
+def test_empty_mid_forecast_returns_empty_list_and_is_not_cached(upstream, monkeypatch):
+    """업스트림 응답이 비어 있으면 []를 반환하고 캐시하지 않아 다음 요청에서 다시 조회"""
+    fake_redis = FakeRedis()
+
+    async def get_client():
+        return fake_redis
+
+    monkeypatch.setattr(swr_cache_module, "get_redis_binary_client", get_client)
+    monkeypatch.setattr(swr_cache_module, "get_redis_client", get_client)
+    monkeypatch.setattr(weather_service, "convert_grid_to_region", lambda nx, ny: REGION_ID)
+    _fix_now(monkeypatch, datetime(2025, 7, 19, 10, 0))
+    upstream["temp"] = []
+
+    async def main():
+        first = await get_mid_range_forecast(60, 127)
+        second = await get_mid_range_forecast(60, 127)
+        return first, second
+
+    assert asyncio.run(main()) == ([], [])
+    assert fake_redis.data == {}
+    assert len(upstream["requests"]) == 4
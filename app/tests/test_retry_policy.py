@@ -0,0 +1,79 @@
+import pytest
+from fastapi import HTTPException
+from app.common.budget import TokenBucketBudget
+from app.common.retry_policy import RetryPolicy, UpstreamError
+
+def _error(result_code=None, upstream_failure=False) -> UpstreamError:
+    return UpstreamError(
+        HTTPException(status_code=502, detail="upstream error"),
+        key_index=0,
+        result_code=result_code,
+        upstream_failure=upstream_failure,
+    )
+
+@pytest.fixture
+def policy():
+    retry_policy = RetryPolicy()
+    retry_policy.max_attempts = 3
+    retry_policy.budget = TokenBucketBudget(ratio=0.0, burst=100.0)
+    return retry_policy
+
+@pytest.mark.unit
+@pytest.mark.parametrize("result_code, is_key_error, upstream_failure", [
+    ("22", True, False),  # 요청제한횟수 초과
+    ("30", True, False),  # 등록되지 않은 서비스키
+    ("01", False, True),  # 어플리케이션 에러
+    ("99", False, True),  # 기타에러
+    ("03", False, False),  # 데이터없음
+    ("10", False, False),  # 잘못된 요청 파라메터
+])
+def test_error_classification(result_code, is_key_error, upstream_failure):
+    """공공데이터포털 결과 코드 분류"""
+    error = _error(result_code)
+    assert error.is_key_error == is_key_error
+    assert error.upstream_failure == upstream_failure
+
+@pytest.mark.unit
+def test_connection_error_is_upstream_failure(policy):
+    """연결 오류/5xx(결과 코드 없음)는 같은 요청 재시도"""
+    assert policy.should_retry(_error(upstream_failure=True), attempt=1, available_keys=0)
+
+@pytest.mark.unit
+def test_key_error_retries_only_with_another_key(policy):
+    """키 에러는 다른 키가 남아 있을 때만 재시도"""
+    assert policy.should_retry(_error("22"), attempt=1, available_keys=1)
+    assert not policy.should_retry(_error("22"), attempt=1, available_keys=0)
+
+@pytest.mark.unit
+def test_request_errors_are_not_retried(policy):
+    """데이터없음/파라미터 오류는 재시도해도 결과가 같음"""
+    assert not policy.should_retry(_error("03"), attempt=1, available_keys=2)
+    assert not policy.should_retry(_error("11"), attempt=1, available_keys=2)
+
+@pytest.mark.unit
+def test_max_attempts(policy):
+    """최대 시도 횟수에 도달하면 재시도 안 함"""
+    assert policy.should_retry(_error("01"), attempt=2, available_keys=0)
+    assert not policy.should_retry(_error("01"), attempt=3, available_keys=0)
+
+@pytest.mark.unit
+def test_budget_exhaustion_stops_retries(policy):
+    """재시도 예산을 다 쓰면 재시도하지 않고, 요청이 쌓이면 다시 재시도"""
+    policy.budget = TokenBucketBudget(ratio=0.5, burst=2.0)
+    assert policy.should_retry(_error("01"), attempt=1, available_keys=0)
+    assert policy.should_retry(_error("01"), attempt=1, available_keys=0)
+    assert not policy.should_retry(_error("01"), attempt=1, available_keys=0)
+
+    policy.on_request()
+    assert not policy.should_retry(_error("01"), attempt=1, available_keys=0)
+    policy.on_request()
+    assert policy.should_retry(_error("01"), attempt=1, available_keys=0)
+
+@pytest.mark.unit
+def test_backoff_is_capped(policy):
+    """지수 백오프 + full jitter, 최대 지연 이하"""
+    policy.base_delay = 0.1
+    policy.max_delay = 0.5
+    for attempt in range(1, 10):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(0.5, 0.1 * 2 ** (attempt - 1))
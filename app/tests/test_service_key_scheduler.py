@@ -0,0 +1,198 @@
+import asyncio
+import pytest
+import app.utils.service_key_scheduler as scheduler_module
+from app.core.config import settings
+from app.utils.service_key_scheduler import ServiceKeyScheduler
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (스케줄러가 사용하는 명령만 지원)"""
+    def __init__(self):
+        self.hashes = {}
+        self.data = {}
+        self.expires = {}
+        self.state_reads = 0
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def hgetall(self, key):
+        self.state_reads += 1
+        return {field: str(value) for field, value in self.hashes.get(key, {}).items()}
+
+    async def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = fields.get(field, 0) + amount
+        return fields[field]
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake_redis = FakeRedis()
+
+    async def get_client():
+        return fake_redis
+
+    monkeypatch.setattr(scheduler_module, "get_redis_client", get_client)
+    return fake_redis
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(settings, "GOV_DATA_API_KEY_1", "key-0")
+    monkeypatch.setattr(settings, "GOV_DATA_API_KEY_2", "key-1")
+    monkeypatch.setattr(settings, "GOV_DATA_API_KEYS", "key-2")
+    monkeypatch.setattr(settings, "GOV_DATA_API_DAILY_LIMIT", 10000)
+    monkeypatch.setattr(settings, "SERVICE_KEY_STATE_CACHE_SECONDS", 0.0)
+    return ServiceKeyScheduler()
+
+def _set_usage(redis: FakeRedis, scheduler: ServiceKeyScheduler, index: int, calls: int, errors: int = 0):
+    key_id = scheduler.key_ids[index]
+    redis.hashes.setdefault(scheduler._usage_key(), {}).update({f"{key_id}:calls": calls, f"{key_id}:errors": errors})
+
+async def _acquire(scheduler: ServiceKeyScheduler, **kwargs):
+    result = await scheduler.acquire(**kwargs)
+    await asyncio.gather(*scheduler._pending_writes)
+    return result
+
+@pytest.mark.unit
+def test_weight_is_remaining_quota_times_health(scheduler):
+    """가중치 = 남은 할당량 x (1 - 에러율), 표본이 적으면 호출 10건 기준으로 에러율 계산"""
+    assert scheduler._weight(0, 0) == 10000
+    assert scheduler._weight(9000, 0) == 1000
+    assert scheduler._weight(5000, 2500) == 5000 * 0.5
+    assert scheduler._weight(2, 1) == 9998 * 0.9
+    # 에러율이 높아도 건강도 최소 0.05 유지
+    assert scheduler._weight(100, 100) == 9900 * 0.05
+    assert scheduler._weight(10000, 0) == 0
+
+@pytest.mark.unit
+def test_acquire_picks_keys_by_weight(redis, scheduler, monkeypatch):
+    """Redis에 기록된 호출/에러 수로 가중치를 계산해 키 선택, 할당량을 다 쓴 키는 제외"""
+    _set_usage(redis, scheduler, 0, calls=9000)
+    _set_usage(redis, scheduler, 1, calls=5000, errors=2500)
+    _set_usage(redis, scheduler, 2, calls=10000)
+    seen = []
+
+    def choices(candidates, weights, k):
+        seen.append((candidates, weights))
+        return [candidates[0]]
+
+    monkeypatch.setattr(scheduler_module.random, "choices", choices)
+    assert asyncio.run(_acquire(scheduler)) == (0, "key-0")
+    assert seen == [([0, 1], [1000, 2500.0])]
+    # 호출 수는 Redis에 기록
+    assert redis.hashes[scheduler._usage_key()][f"{scheduler.key_ids[0]}:calls"] == 9001
+
+@pytest.mark.unit
+def test_quota_exceeded_disables_key_until_midnight(redis, scheduler, monkeypatch):
+    """22(요청제한횟수 초과)는 자정까지 제외"""
+    monkeypatch.setattr(scheduler_module, "calculate_ttl_to_next_period", lambda period: 1234 if period == "day" else 0)
+
+    async def main():
+        await scheduler.report_error(0, "22")
+        return [(await _acquire(scheduler))[0] for _ in range(20)]
+
+    assert 0 not in asyncio.run(main())
+    assert redis.expires[scheduler._disabled_key(scheduler.key_ids[0])] == 1234
+
+@pytest.mark.unit
+@pytest.mark.parametrize("result_code", ["20", "21", "30", "31", "32", "33"])
+def test_key_errors_disable_key_for_cooldown(redis, scheduler, result_code):
+    """서비스 키 에러는 SERVICE_KEY_COOLDOWN_SECONDS 동안 제외"""
+    async def main():
+        await scheduler.report_error(1, result_code)
+        return [(await _acquire(scheduler))[0] for _ in range(20)]
+
+    assert 1 not in asyncio.run(main())
+    assert redis.expires[scheduler._disabled_key(scheduler.key_ids[1])] == settings.SERVICE_KEY_COOLDOWN_SECONDS
+
+@pytest.mark.unit
+def test_other_errors_are_counted_without_disabling(redis, scheduler):
+    """업스트림 장애 코드는 에러 수만 기록 (건강도 반영), 키는 제외하지 않음"""
+    async def main():
+        await scheduler.report_error(2, "99")
+        await asyncio.gather(*scheduler._pending_writes)
+
+    asyncio.run(main())
+    assert redis.data == {}
+    assert redis.hashes[scheduler._usage_key()][f"{scheduler.key_ids[2]}:errors"] == 1
+
+@pytest.mark.unit
+def test_exclude_skips_keys(redis, scheduler):
+    """재시도/헤지 요청은 이미 사용한 키를 제외하고 선택"""
+    async def main():
+        return [(await _acquire(scheduler, exclude={0, 2}))[0] for _ in range(20)]
+
+    assert set(asyncio.run(main())) == {1}
+
+@pytest.mark.unit
+def test_all_keys_unavailable_falls_back_to_least_used(redis, scheduler):
+    """사용 가능한 키가 없으면 제외 목록 밖에서 호출 수가 가장 적은 키, 모두 제외되면 전체에서 선택"""
+    _set_usage(redis, scheduler, 0, calls=10000)
+    _set_usage(redis, scheduler, 1, calls=10500)
+    _set_usage(redis, scheduler, 2, calls=10200)
+
+    assert asyncio.run(_acquire(scheduler))[0] == 0
+    assert asyncio.run(_acquire(scheduler, exclude={0}))[0] == 2
+    assert asyncio.run(_acquire(scheduler, exclude={0, 1, 2}))[0] == 0
+
+@pytest.mark.unit
+def test_state_is_cached_between_requests(redis, scheduler, monkeypatch):
+    """상태 캐시 시간 안에는 Redis를 다시 조회하지 않고, 자신의 호출/제외는 바로 반영"""
+    monkeypatch.setattr(settings, "SERVICE_KEY_STATE_CACHE_SECONDS", 60.0)
+
+    async def main():
+        await scheduler.acquire(exclude={1, 2})
+        await scheduler.acquire(exclude={1, 2})
+        await scheduler.report_error(0, "30")
+        indexes = [(await scheduler.acquire())[0] for _ in range(20)]
+        await asyncio.gather(*scheduler._pending_writes)
+        return indexes
+
+    indexes = asyncio.run(main())
+    assert redis.state_reads == 1
+    calls, _, disabled_ids = scheduler._state[1:]
+    assert calls[scheduler.key_ids[0]] == 2
+    assert scheduler.key_ids[0] in disabled_ids
+    assert 0 not in indexes
+    assert redis.hashes[scheduler._usage_key()][f"{scheduler.key_ids[0]}:calls"] == 2
+
+@pytest.mark.unit
+def test_redis_failure_uses_local_state(scheduler, monkeypatch):
+    """Redis 장애 시 워커 로컬 호출 수/제외 상태로 계속 선택"""
+    async def broken_client():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(scheduler_module, "get_redis_client", broken_client)
+
+    async def main():
+        await scheduler.report_error(0, "22")
+        indexes = [(await _acquire(scheduler, exclude={2}))[0] for _ in range(5)]
+        return indexes, await scheduler.get_current_stats()
+
+    indexes, stats = asyncio.run(main())
+    assert set(indexes) == {1}
+    assert stats["keys"][0]["disabled"] and stats["keys"][0]["errors"] == 1
+    assert stats["keys"][1]["calls"] == 5
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime
+import pytest
+import app.services.weather_service as weather_service
+from app.common.cache_codec import cache_codec
+from app.common.http_client import UpstreamResponse
+from app.core.config import settings
+from app.services.weather_service import get_short_forecast_base_time, get_short_forecast_by_time
+
+NX, NY = 60, 127
+NOW = datetime(2025, 7, 19, 0, 30)
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (get/set만 지원)"""
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+def _short_response(stale: bool = False) -> UpstreamResponse:
+    """2025-07-19 01시 ~ 03시 단기예보 (시간별/주간 예보에 필요한 카테고리 포함)"""
+    items = [
+        {"fcstDate": "20250719", "fcstTime": f"{hour:02d}00", "category": category, "fcstValue": value}
+        for hour in (1, 2, 3)
+        for category, value in [("TMP", "24"), ("SKY", "1"), ("PTY", "0"), ("POP", "10"), ("PCP", "강수없음")]
+    ]
+    data = {"response": {"header": {"resultCode": "00"}, "body": {"items": {"item": items}}}}
+    return UpstreamResponse(status_code=200, content=b"", result_code="00", result_msg="NORMAL_SERVICE", data=data, stale=stale)
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Redis/업스트림 대체, 업스트림 요청 파라미터 기록"""
+    fake_redis = FakeRedis()
+    requests = []
+    responses = {"stale": False}
+
+    async def get_client():
+        return fake_redis
+
+    async def make_request(url, params=None, **kwargs):
+        requests.append(dict(params))
+        return _short_response(stale=responses["stale"])
+
+    monkeypatch.setattr(weather_service, "get_redis_binary_client", get_client)
+    monkeypatch.setattr(weather_service, "make_request", make_request)
+    monkeypatch.setattr(weather_service, "datetime", FixedDatetime)
+    monkeypatch.setattr(weather_service, "calculate_ttl_to_next_short_forecast", lambda: 5400)
+    monkeypatch.setattr(settings, "CACHE_TTL_JITTER_SECONDS", 0)
+    return fake_redis, requests, responses
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 7, 19, 0, 0), ("20250718", "2300")),
+    (datetime(2025, 7, 19, 1, 59), ("20250718", "2300")),
+    (datetime(2025, 7, 19, 2, 0), ("20250719", "0200")),
+    (datetime(2025, 7, 19, 13, 10), ("20250719", "1100")),
+    (datetime(2025, 7, 19, 23, 59), ("20250719", "2300")),
+    # 연/월이 바뀌는 자정 직후
+    (datetime(2025, 1, 1, 1, 30), ("20241231", "2300")),
+    (datetime(2024, 3, 1, 0, 10), ("20240229", "2300")),
+])
+def test_short_forecast_base_time(now, expected):
+    """00:00 ~ 01:59는 전날 23시 발표, 그 외에는 가장 최근 3시간 단위 발표"""
+    assert get_short_forecast_base_time(now) == expected
+
+@pytest.mark.unit
+def test_hourly_and_weekly_share_one_short_forecast(upstream):
+    """시간별 예보와 주간 예보(단기 구간)는 같은 격자/발표 키를 함께 사용 (업스트림 한 번 호출)"""
+    redis, requests, _ = upstream
+
+    async def main():
+        hourly = await weather_service._build_hourly_forecast(NX, NY)
+        weekly = await weather_service.get_short_range_forecast(NX, NY)
+        return hourly, weekly
+
+    hourly, weekly = asyncio.run(main())
+    assert list(redis.data) == [f"weather:short:{NX}:{NY}:20250718:2300"]
+    assert len(requests) == 1
+    assert (requests[0]["base_date"], requests[0]["base_time"]) == ("20250718", "2300")
+    assert [forecast["forecast_time"] for forecast in hourly["forecasts"]] == ["0100", "0200", "0300"]
+    assert [forecast["base_time"] for forecast in weekly] == ["0100", "0200", "0300"]
+
+@pytest.mark.unit
+def test_short_forecast_ttl(upstream):
+    """기본은 다음 발표까지, 호출자가 TTL을 주면 그 값으로 캐시"""
+    redis, requests, _ = upstream
+
+    async def main():
+        await get_short_forecast_by_time(NX, NY, "20250718", "2300")
+        await get_short_forecast_by_time(NX, NY, "20250718", "0500", ttl_seconds=86400)
+        # 캐시된 값은 다시 요청하지 않음
+        return await get_short_forecast_by_time(NX, NY, "20250718", "2300")
+
+    cached = asyncio.run(main())
+    assert redis.expires == {
+        f"weather:short:{NX}:{NY}:20250718:2300": 5400,
+        f"weather:short:{NX}:{NY}:20250718:0500": 86400,
+    }
+    assert len(requests) == 2
+    assert cached["20250719-0100"]["TMP"] == "24"
+
+@pytest.mark.unit
+def test_stale_short_forecast_is_cached_briefly(upstream):
+    """장애 대체 응답은 호출자가 준 TTL과 관계없이 CACHE_STALE_RESULT_TTL_SECONDS만 캐시"""
+    redis, _, responses = upstream
+    responses["stale"] = True
+
+    async def main():
+        await get_short_forecast_by_time(NX, NY, "20250718", "2300")
+        await get_short_forecast_by_time(NX, NY, "20250718", "0500", ttl_seconds=86400)
+
+    asyncio.run(main())
+    assert set(redis.expires.values()) == {settings.CACHE_STALE_RESULT_TTL_SECONDS}
+    assert cache_codec.decode(redis.data[f"weather:short:{NX}:{NY}:20250718:2300"])["20250719-0100"]["SKY"] == "1"
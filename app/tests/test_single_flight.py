@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from app.common.single_flight import SingleFlight, build_request_key
+
+@pytest.mark.unit
+def test_request_key_ignores_service_key_and_param_order():
+    """serviceKey와 파라미터 순서는 요청 키에 영향 없음"""
+    first = build_request_key("get", "http://api/x", {"nx": 60, "ny": 127, "serviceKey": "a"})
+    second = build_request_key("GET", "http://api/x", {"ny": 127, "serviceKey": "b", "nx": 60})
+    assert first == second
+    assert first != build_request_key("GET", "http://api/x", {"nx": 61, "ny": 127})
+
+@pytest.mark.unit
+def test_concurrent_calls_are_coalesced():
+    """같은 키로 동시에 들어온 호출은 한 번만 실행하고 결과 공유"""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    async def main():
+        single_flight = SingleFlight()
+        results = await asyncio.gather(*(single_flight.do("key", fetch) for _ in range(10)))
+        assert single_flight.in_flight() == 0
+        return results
+
+    results = asyncio.run(main())
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+
+@pytest.mark.unit
+def test_different_keys_run_separately():
+    """다른 키는 각각 실행"""
+    calls = []
+
+    async def main():
+        single_flight = SingleFlight()
+
+        def fetch(key):
+            async def run():
+                calls.append(key)
+                await asyncio.sleep(0.01)
+                return key
+            return run
+
+        return await asyncio.gather(single_flight.do("a", fetch("a")), single_flight.do("b", fetch("b")))
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+@pytest.mark.unit
+def test_error_is_propagated_to_every_caller_and_not_cached():
+    """실패하면 기다리던 호출자 모두 같은 예외를 받고, 다음 호출은 다시 실행"""
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    async def succeeding():
+        return "ok"
+
+    async def main():
+        single_flight = SingleFlight()
+        results = await asyncio.gather(*(single_flight.do("key", failing) for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        return await single_flight.do("key", succeeding)
+
+    assert asyncio.run(main()) == "ok"
+    assert calls == 1
+
+@pytest.mark.unit
+def test_cancelled_caller_does_not_cancel_shared_call():
+    """호출자 하나가 취소되어도 공유 작업은 끝까지 실행"""
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        single_flight = SingleFlight()
+        cancelled = asyncio.ensure_future(single_flight.do("key", slow))
+        waiting = asyncio.ensure_future(single_flight.do("key", slow))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await waiting
+
+    assert asyncio.run(main()) == "done"
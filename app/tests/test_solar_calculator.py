@@ -0,0 +1,35 @@
+from datetime import date
+import pytest
+from app.utils.solar_calculator import build_yearly_sun_table, calculate_sunrise_sunset
+
+# 한국천문연구원 출몰시각 (서울, 하지/동지/춘분)
+SEOUL = (37.5665, 126.978)
+KASI_SEOUL = [
+    (date(2024, 6, 21), "05:11", "19:57"),
+    (date(2024, 12, 21), "07:43", "17:17"),
+    (date(2024, 3, 20), "06:36", "18:44"),
+]
+
+def _to_minutes(value: str) -> int:
+    return int(value[:2]) * 60 + int(value[3:5])
+
+@pytest.mark.unit
+@pytest.mark.parametrize("day, sunrise, sunset", KASI_SEOUL)
+def test_seoul_matches_kasi(day, sunrise, sunset):
+    """서울 일출/일몰 계산값이 천문연 값과 1분 이내"""
+    result = calculate_sunrise_sunset(*SEOUL, day)
+    assert abs(_to_minutes(result["sunrise"]) - _to_minutes(sunrise)) <= 1
+    assert abs(_to_minutes(result["sunset"]) - _to_minutes(sunset)) <= 1
+
+@pytest.mark.unit
+def test_polar_day_has_no_sunset():
+    """백야(해가 지지 않음)는 None"""
+    result = calculate_sunrise_sunset(80.0, 15.0, date(2024, 6, 21))
+    assert result == {"sunrise": None, "sunset": None}
+
+@pytest.mark.unit
+def test_yearly_table_covers_every_day():
+    """1년치 표는 윤년 포함 모든 날짜를 같은 계산값으로 채움"""
+    table = build_yearly_sun_table(*SEOUL, 2024)
+    assert len(table) == 366
+    assert table["20240621"] == calculate_sunrise_sunset(*SEOUL, date(2024, 6, 21))
@@ -0,0 +1,261 @@
+import asyncio
+import time
+import pytest
+import app.common.swr_cache as swr_cache_module
+from app.common.cache_codec import cache_codec
+from app.common.swr_cache import StaleWhileRevalidateCache
+from app.core.config import settings
+
+class FakeReleaseScript:
+    """잠금 해제 Lua 스크립트 대체 (토큰이 같을 때만 삭제)"""
+    def __init__(self, redis: "FakeRedis"):
+        self.registered_client = redis
+
+    async def __call__(self, keys, args):
+        if self.registered_client.data.get(keys[0]) == args[0]:
+            await self.registered_client.delete(keys[0])
+            return 1
+        return 0
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (get/set(nx, ex)/delete/register_script만 지원)"""
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.registered_scripts = 0
+
+    def register_script(self, script):
+        self.registered_scripts += 1
+        return FakeReleaseScript(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.expires[key] = ex
+        return True
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+        self.expires.pop(key, None)
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake_redis = FakeRedis()
+
+    async def get_client():
+        return fake_redis
+
+    monkeypatch.setattr(swr_cache_module, "get_redis_binary_client", get_client)
+    monkeypatch.setattr(swr_cache_module, "get_redis_client", get_client)
+    # 지터/조기 갱신 없이 만료 시각을 그대로 검증
+    monkeypatch.setattr(settings, "CACHE_TTL_JITTER_SECONDS", 0)
+    monkeypatch.setattr(settings, "CACHE_XFETCH_BETA", 0.0)
+    monkeypatch.setattr(settings, "CACHE_SWR_ENABLED", True)
+    return fake_redis
+
+def _counting_fetch(values):
+    """호출될 때마다 values를 순서대로 반환하는 fetch"""
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        return values[len(calls) - 1]
+
+    return fetch, calls
+
+def _store_entry(redis: FakeRedis, key: str, value, soft_expires_at: float):
+    redis.data[key] = cache_codec.encode({"value": value, "soft_expires_at": soft_expires_at, "delta": 0.0})
+
+@pytest.mark.unit
+def test_miss_fetches_and_stores_with_grace(redis):
+    """캐시가 없으면 조회 후 저장, Redis TTL은 소프트 만료 + 유예 시간"""
+    fetch, calls = _counting_fetch([{"temp": 1}])
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        first = await cache.get_or_fetch("weather:test", fetch, ttl=100, grace_seconds=50)
+        second = await cache.get_or_fetch("weather:test", fetch, ttl=100, grace_seconds=50)
+        return first, second
+
+    assert asyncio.run(main()) == ({"temp": 1}, {"temp": 1})
+    assert len(calls) == 1
+    assert redis.expires["weather:test"] == 150
+    entry = cache_codec.decode(redis.data["weather:test"])
+    assert 99 <= entry["soft_expires_at"] - time.time() <= 100
+
+@pytest.mark.unit
+def test_soft_expired_value_is_served_while_refreshing(redis):
+    """소프트 만료 후에는 기존 값을 바로 반환하고 백그라운드에서 갱신"""
+    _store_entry(redis, "weather:test", "old", time.time() - 1)
+    fetch, calls = _counting_fetch(["new"])
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        value = await cache.get_or_fetch("weather:test", fetch, ttl=100)
+        await asyncio.gather(*cache._refreshing.values())
+        return value
+
+    assert asyncio.run(main()) == "old"
+    assert len(calls) == 1
+    assert cache_codec.decode(redis.data["weather:test"])["value"] == "new"
+
+@pytest.mark.unit
+def test_soft_expired_without_swr_fetches_synchronously(redis, monkeypatch):
+    """SWR을 끄면 소프트 만료 값은 사용하지 않음"""
+    monkeypatch.setattr(settings, "CACHE_SWR_ENABLED", False)
+    _store_entry(redis, "weather:test", "old", time.time() - 1)
+    fetch, _ = _counting_fetch(["new"])
+
+    value = asyncio.run(StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100))
+    assert value == "new"
+
+@pytest.mark.unit
+def test_failed_background_refresh_keeps_old_value(redis):
+    """백그라운드 갱신이 실패하면 하드 만료 전까지 기존 값 유지"""
+    _store_entry(redis, "weather:test", "old", time.time() - 1)
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        value = await cache.get_or_fetch("weather:test", failing, ttl=100)
+        await asyncio.gather(*cache._refreshing.values())
+        return value
+
+    assert asyncio.run(main()) == "old"
+    assert cache_codec.decode(redis.data["weather:test"])["value"] == "old"
+
+@pytest.mark.unit
+def test_hard_expired_fetches_once_for_concurrent_callers(redis):
+    """하드 만료(키 없음) 시 동시 호출은 한 번만 조회"""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "fresh"
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        return await asyncio.gather(*(cache.get_or_fetch("weather:test", fetch, ttl=100) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["fresh"] * 5
+    assert len(calls) == 1
+
+@pytest.mark.unit
+def test_legacy_entry_without_soft_expiry_is_a_miss(redis):
+    """이전 형식(소프트 만료 정보 없음) 값은 캐시 없음으로 처리"""
+    redis.data["weather:test"] = b'{"temp": 1}'
+    fetch, calls = _counting_fetch(["fresh"])
+
+    assert asyncio.run(StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100)) == "fresh"
+    assert len(calls) == 1
+
+@pytest.mark.unit
+def test_rebuild_takes_nx_lock_and_releases_it(redis):
+    """재생성 중에는 잠금을 잡고, 저장 후 해제"""
+    lock_key = f"{StaleWhileRevalidateCache.LOCK_PREFIX}:weather:test"
+    seen_locks = []
+
+    async def fetch():
+        seen_locks.append((redis.data.get(lock_key), redis.expires.get(lock_key)))
+        return "fresh"
+
+    assert asyncio.run(StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100)) == "fresh"
+    token, lock_ttl = seen_locks[0]
+    assert token is not None
+    assert lock_ttl == settings.CACHE_REFRESH_LOCK_SECONDS
+    assert lock_key not in redis.data
+
+@pytest.mark.unit
+def test_waits_for_rebuild_by_another_worker(redis, monkeypatch):
+    """다른 워커가 잠금을 잡고 있으면 조회하지 않고 저장될 때까지 대기"""
+    monkeypatch.setattr(settings, "CACHE_REBUILD_WAIT_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "CACHE_REBUILD_POLL_SECONDS", 0.01)
+    redis.data[f"{StaleWhileRevalidateCache.LOCK_PREFIX}:weather:test"] = "other-worker"
+    fetch, calls = _counting_fetch(["mine"])
+
+    async def other_worker():
+        await asyncio.sleep(0.05)
+        _store_entry(redis, "weather:test", "theirs", time.time() + 100)
+
+    async def main():
+        asyncio.ensure_future(other_worker())
+        return await StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100)
+
+    assert asyncio.run(main()) == "theirs"
+    assert calls == []
+
+@pytest.mark.unit
+def test_fetches_directly_when_rebuild_wait_times_out(redis, monkeypatch):
+    """다른 워커의 재생성을 기다리다 시간이 지나면 직접 조회, 남의 잠금은 해제하지 않음"""
+    monkeypatch.setattr(settings, "CACHE_REBUILD_WAIT_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "CACHE_REBUILD_POLL_SECONDS", 0.01)
+    lock_key = f"{StaleWhileRevalidateCache.LOCK_PREFIX}:weather:test"
+    redis.data[lock_key] = "other-worker"
+    fetch, calls = _counting_fetch(["mine"])
+
+    assert asyncio.run(StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100)) == "mine"
+    assert len(calls) == 1
+    assert redis.data[lock_key] == "other-worker"
+
+@pytest.mark.unit
+def test_background_refresh_skipped_when_locked(redis):
+    """다른 워커가 갱신 중이면 백그라운드 갱신 생략"""
+    _store_entry(redis, "weather:test", "old", time.time() - 1)
+    redis.data[f"{StaleWhileRevalidateCache.LOCK_PREFIX}:weather:test"] = "other-worker"
+    fetch, calls = _counting_fetch(["new"])
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        value = await cache.get_or_fetch("weather:test", fetch, ttl=100)
+        await asyncio.gather(*cache._refreshing.values())
+        return value
+
+    assert asyncio.run(main()) == "old"
+    assert calls == []
+
+@pytest.mark.unit
+def test_ttl_jitter_is_added(redis, monkeypatch):
+    """만료 시각에 0 ~ CACHE_TTL_JITTER_SECONDS 지터 추가"""
+    monkeypatch.setattr(settings, "CACHE_TTL_JITTER_SECONDS", 30)
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        for index in range(20):
+            await cache.set(f"weather:test:{index}", index, ttl=100, grace_seconds=0)
+
+    asyncio.run(main())
+    assert all(100 <= ttl <= 130 for ttl in redis.expires.values())
+
+@pytest.mark.unit
+def test_release_keeps_lock_taken_over_by_another_worker(redis):
+    """잠금이 만료되어 다른 워커가 다시 잡았으면 토큰이 달라 해제하지 않음"""
+    lock_key = f"{StaleWhileRevalidateCache.LOCK_PREFIX}:weather:test"
+
+    async def fetch():
+        # 조회가 길어져 잠금이 만료되고 다른 워커가 잠금을 잡음
+        redis.data[lock_key] = "other-worker"
+        return "fresh"
+
+    assert asyncio.run(StaleWhileRevalidateCache().get_or_fetch("weather:test", fetch, ttl=100)) == "fresh"
+    assert redis.data[lock_key] == "other-worker"
+
+@pytest.mark.unit
+def test_release_script_is_registered_once(redis):
+    """잠금 해제 스크립트는 클라이언트당 한 번만 등록"""
+    fetch, calls = _counting_fetch(["a", "b", "c"])
+
+    async def main():
+        cache = StaleWhileRevalidateCache()
+        for index in range(3):
+            await cache.get_or_fetch(f"weather:test:{index}", fetch, ttl=100)
+
+    asyncio.run(main())
+    assert len(calls) == 3
+    assert redis.registered_scripts == 1
@@ -0,0 +1,166 @@
+import asyncio
+from datetime import datetime
+import pytest
+import app.services.weather_service as weather_service
+from app.core.config import settings
+from app.services.weather_service import (
+    UV_POPULAR_AREAS_KEY,
+    _calculate_ttl_to_next_uv_issuance,
+    flush_uv_area_counts,
+    get_uv_issuance,
+    select_uv_index,
+)
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    def zincrby(self, key, amount, member):
+        self.commands.append((key, amount, member))
+
+    async def execute(self):
+        if self.redis.broken:
+            raise ConnectionError("redis down")
+        for key, amount, member in self.commands:
+            scores = self.redis.sorted_sets.setdefault(key, {})
+            scores[member] = scores.get(member, 0) + amount
+        self.redis.round_trips += 1
+
+class FakeRedis:
+    """테스트용 인메모리 Redis (zincrby 파이프라인만 지원)"""
+    def __init__(self):
+        self.sorted_sets = {}
+        self.round_trips = 0
+        self.broken = False
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+@pytest.fixture
+def uv_settings(monkeypatch):
+    monkeypatch.setattr(settings, "WEATHER_UV_ISSUE_HOURS", "6,18")
+    monkeypatch.setattr(settings, "WEATHER_UV_AVAILABLE_DELAY_MINUTES", 20)
+    monkeypatch.setattr(settings, "WEATHER_UV_PREWARM_TOP_AREAS", 50)
+
+def _fix_now(monkeypatch, now: datetime):
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(weather_service, "datetime", FixedDatetime)
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, expected", [
+    # 첫 발표(06시)가 조회 가능해지기 전에는 전날 18시 발표
+    (datetime(2025, 7, 19, 0, 10), datetime(2025, 7, 18, 18)),
+    (datetime(2025, 7, 19, 6, 19), datetime(2025, 7, 18, 18)),
+    (datetime(2025, 7, 19, 6, 20), datetime(2025, 7, 19, 6)),
+    (datetime(2025, 7, 19, 18, 19), datetime(2025, 7, 19, 6)),
+    (datetime(2025, 7, 19, 18, 20), datetime(2025, 7, 19, 18)),
+    (datetime(2025, 7, 19, 23, 59), datetime(2025, 7, 19, 18)),
+    # 월/연이 바뀌는 새벽
+    (datetime(2025, 1, 1, 3, 0), datetime(2024, 12, 31, 18)),
+    (datetime(2024, 3, 1, 6, 0), datetime(2024, 2, 29, 18)),
+])
+def test_uv_issuance(uv_settings, now, expected):
+    """발표 후 WEATHER_UV_AVAILABLE_DELAY_MINUTES가 지난 가장 최근 발표"""
+    assert get_uv_issuance(now) == expected
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, issuance, expected_seconds", [
+    # 06시 발표 -> 같은 날 18:20까지
+    (datetime(2025, 7, 19, 12, 0), datetime(2025, 7, 19, 6), 6 * 3600 + 20 * 60),
+    # 18시 발표 -> 다음 날 06:20까지 (자정 전/후)
+    (datetime(2025, 7, 19, 20, 0), datetime(2025, 7, 19, 18), 10 * 3600 + 20 * 60),
+    (datetime(2025, 7, 20, 2, 0), datetime(2025, 7, 19, 18), 4 * 3600 + 20 * 60),
+    (datetime(2025, 12, 31, 22, 0), datetime(2025, 12, 31, 18), 8 * 3600 + 20 * 60),
+    # 다음 발표 시각이 이미 지났으면 최소 60초
+    (datetime(2025, 7, 20, 6, 30), datetime(2025, 7, 19, 18), 60),
+])
+def test_ttl_to_next_uv_issuance(uv_settings, monkeypatch, now, issuance, expected_seconds):
+    """다음 발표가 조회 가능해지는 시각까지 캐시"""
+    _fix_now(monkeypatch, now)
+    assert _calculate_ttl_to_next_uv_issuance(issuance) == expected_seconds
+
+@pytest.mark.unit
+def test_ttl_follows_issue_hours_setting(monkeypatch):
+    """발표 시각 설정 순서와 관계없이 다음 발표 사용"""
+    monkeypatch.setattr(settings, "WEATHER_UV_ISSUE_HOURS", "18,6,12")
+    monkeypatch.setattr(settings, "WEATHER_UV_AVAILABLE_DELAY_MINUTES", 0)
+    _fix_now(monkeypatch, datetime(2025, 7, 19, 7, 0))
+    assert _calculate_ttl_to_next_uv_issuance(datetime(2025, 7, 19, 6)) == 5 * 3600
+    assert get_uv_issuance(datetime(2025, 7, 19, 13, 0)) == datetime(2025, 7, 19, 12)
+
+SERIES = {"issuance": "2025071918", "values": {"h0": "6", "h3": "4", "h6": "0", "h9": "0", "h12": "2", "h15": "7"}}
+
+@pytest.mark.unit
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 7, 19, 18, 30), 6),
+    (datetime(2025, 7, 19, 20, 0), 4),
+    # 발표 다음 날: 경과 시간으로 계산 (자정을 넘어도 h6, h12 ...)
+    (datetime(2025, 7, 20, 0, 10), 0),
+    (datetime(2025, 7, 20, 6, 0), 2),
+    (datetime(2025, 7, 20, 10, 0), 7),
+    # 마지막 예보 이후에는 가장 가까운 마지막 값
+    (datetime(2025, 7, 20, 23, 0), 7),
+])
+def test_select_uv_index(now, expected):
+    """발표 시각 이후 경과 시간에 가장 가까운 3시간 간격 예보 값"""
+    assert select_uv_index(SERIES, now) == expected
+
+@pytest.mark.unit
+def test_select_uv_index_without_values():
+    """값이 없거나 숫자가 아니면 0"""
+    now = datetime(2025, 7, 19, 18, 30)
+    assert select_uv_index({"issuance": "2025071918", "values": {}}, now) == 0
+    assert select_uv_index({"issuance": "2025071918", "values": {"h0": " "}}, now) == 0
+    assert select_uv_index({"issuance": "2025071918", "values": {"h0": "-"}}, now) == 0
+    assert select_uv_index({"issuance": "2025071918", "values": {"h0": "5.0"}}, now) == 5
+
+@pytest.fixture
+def redis(monkeypatch, uv_settings):
+    fake_redis = FakeRedis()
+
+    async def get_client():
+        return fake_redis
+
+    monkeypatch.setattr(weather_service, "get_redis_client", get_client)
+    monkeypatch.setattr(weather_service, "_uv_area_counts", {})
+    return fake_redis
+
+@pytest.mark.unit
+def test_area_counts_are_flushed_in_one_round_trip(redis):
+    """요청 경로에서는 메모리에만 기록하고, 주기적으로 한 번에 Redis에 기록"""
+    for region_code in ["1100000000", "1100000000", "2600000000"]:
+        weather_service._record_uv_area(region_code)
+    assert redis.round_trips == 0
+
+    asyncio.run(flush_uv_area_counts())
+    assert redis.sorted_sets[UV_POPULAR_AREAS_KEY] == {"1100000000": 2, "2600000000": 1}
+    assert redis.round_trips == 1
+    assert weather_service._uv_area_counts == {}
+
+    # 기록할 값이 없으면 Redis를 호출하지 않음
+    asyncio.run(flush_uv_area_counts())
+    assert redis.round_trips == 1
+
+@pytest.mark.unit
+def test_failed_flush_keeps_counts(redis):
+    """기록에 실패하면 다음 주기에 다시 기록"""
+    weather_service._record_uv_area("1100000000")
+    redis.broken = True
+    asyncio.run(flush_uv_area_counts())
+    weather_service._record_uv_area("1100000000")
+
+    redis.broken = False
+    asyncio.run(flush_uv_area_counts())
+    assert redis.sorted_sets[UV_POPULAR_AREAS_KEY] == {"1100000000": 2}
+
+@pytest.mark.unit
+def test_area_counts_disabled(redis, monkeypatch):
+    """미리 조회를 끄면 조회 수도 기록하지 않음"""
+    monkeypatch.setattr(settings, "WEATHER_UV_PREWARM_TOP_AREAS", 0)
+    weather_service._record_uv_area("1100000000")
+    assert weather_service._uv_area_counts == {}
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta
 from typing import Literal
 
@@ -99,3 +100,28 @@ def calculate_ttl_to_next_short_forecast() -> int:
     
     # 최소 60초는 보장
     return max(ttl_seconds, 60)
+
+def calculate_ttl_to_next_ultra_short_forecast() -> int:
+    """
+    다음 초단기예보 발표 시간까지의 TTL 계산
+    초단기예보는 매시 30분에 생성되어 45분 이후 조회 가능함
+    """
+    now = datetime.now()
+    next_forecast_time = now.replace(minute=45, second=0, microsecond=0)
+    if now >= next_forecast_time:
+        next_forecast_time += timedelta(hours=1)
+
+    # TTL 계산 (초 단위)
+    ttl_seconds = int((next_forecast_time - now).total_seconds())
+
+    # 최소 60초는 보장
+    return max(ttl_seconds, 60)
+
+def apply_ttl_jitter(ttl_seconds: int, max_jitter_seconds: int) -> int:
+    """
+    TTL에 0 ~ max_jitter_seconds 초를 더해 만료 시각 분산
+    정각/발표 시각 기준 TTL은 모든 키가 같은 순간에 만료되므로 갱신 요청이 한꺼번에 몰리는 것을 방지
+    """
+    if max_jitter_seconds <= 0:
+        return ttl_seconds
+    return ttl_seconds + random.randint(0, max_jitter_seconds)
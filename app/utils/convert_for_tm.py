@@ -2,7 +2,9 @@ import math
 from typing import Tuple
 from pyproj import Transformer
 
+# 변환기 생성 비용이 커서 한 번만 생성
+_WGS84_TO_KATEC = Transformer.from_crs("EPSG:4326", "EPSG:5181", always_xy=True)
+
 def convert_wgs84_to_katec(lat: float, lon: float) -> Tuple[float, float]:
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:5181", always_xy=True)
-    tmX, tmY = transformer.transform(lon, lat)
+    tmX, tmY = _WGS84_TO_KATEC.transform(lon, lat)
     return tmX, tmY
\ No newline at end of file
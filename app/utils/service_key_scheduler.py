@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+from app.core.config import settings
+from app.config.redis_config import get_redis_client
+from app.utils.cache_utils import calculate_ttl_to_next_period
+from app.config.logging_config import get_logger
+
+logger = get_logger()
+
+# 공공데이터포털 에러 코드 분류
+QUOTA_EXCEEDED_CODES = {"22"}  # 서비스 요청제한횟수 초과
+KEY_ERROR_CODES = {"20", "21", "30", "31", "32", "33"}  # 서비스키 관련 에러
+
+class ServiceKeyScheduler:
+    """
+    서비스 키 스케줄러
+    키별 일일 호출 수와 에러율을 Redis에 기록해 모든 워커가 공유하고,
+    남은 할당량 x 건강도 비율로 키를 선택함.
+    할당량 초과(22) 키는 자정까지, 서비스키 에러 키는 쿨다운 동안 제외함.
+    요청 경로에 Redis 왕복이 늘지 않도록 조회한 상태는 SERVICE_KEY_STATE_CACHE_SECONDS 동안 재사용하고,
+    호출 수 기록은 백그라운드로 보냄.
+    """
+    USAGE_KEY_PREFIX = "service_key:usage"
+    DISABLED_KEY_PREFIX = "service_key:disabled"
+
+    def __init__(self):
+        self.service_keys = self._load_service_keys()
+        self.key_ids = [hashlib.sha1(key.encode()).hexdigest()[:10] for key in self.service_keys]
+        self.daily_limit = settings.GOV_DATA_API_DAILY_LIMIT
+
+        # Redis 장애 시 사용할 워커 로컬 상태
+        self._local_date = None
+        self._local_calls: Dict[str, int] = {}
+        self._local_errors: Dict[str, int] = {}
+        self._local_disabled_until: Dict[str, float] = {}
+
+        # Redis에서 조회한 상태 캐시 (조회 시각, 호출 수, 에러 수, 비활성 키 ID)
+        self._state: Optional[Tuple[float, Dict[str, int], Dict[str, int], Set[str]]] = None
+        self._pending_writes: Set[asyncio.Task] = set()
+        logger.info(f"서비스 키 스케줄러 초기화 완료 - 총 {len(self.service_keys)}개 키")
+
+    @property
+    def key_count(self) -> int:
+        return len(self.service_keys)
+
+    @staticmethod
+    def _load_service_keys() -> List[str]:
+        """설정에서 서비스 키 목록 로드 (GOV_DATA_API_KEY_1/2 + GOV_DATA_API_KEYS)"""
+        candidates = [settings.GOV_DATA_API_KEY_1, settings.GOV_DATA_API_KEY_2]
+        candidates += settings.GOV_DATA_API_KEYS.split(",")
+
+        keys = []
+        for key in candidates:
+            key = unquote(key.strip())
+            if key and key not in keys:
+                keys.append(key)
+
+        if not keys:
+            logger.warning("설정된 서비스 키가 없습니다.")
+            keys = [""]
+        return keys
+
+    def _usage_key(self) -> str:
+        return f"{self.USAGE_KEY_PREFIX}:{datetime.now().strftime('%Y%m%d')}"
+
+    def _disabled_key(self, key_id: str) -> str:
+        return f"{self.DISABLED_KEY_PREFIX}:{key_id}"
+
+    def _reset_local_if_new_day(self):
+        today = datetime.now().strftime("%Y%m%d")
+        if self._local_date != today:
+            self._local_date = today
+            self._local_calls.clear()
+            self._local_errors.clear()
+
+    async def _load_state(self) -> Tuple[Dict[str, int], Dict[str, int], Set[str]]:
+        """키별 (호출 수, 에러 수, 비활성 키 ID) 조회 (SERVICE_KEY_STATE_CACHE_SECONDS 동안은 캐시 사용)"""
+        if self._state is not None and time.monotonic() - self._state[0] < settings.SERVICE_KEY_STATE_CACHE_SECONDS:
+            _, calls, errors, disabled_ids = self._state
+            return calls, errors, disabled_ids
+        try:
+            redis = await get_redis_client()
+            pipe = redis.pipeline()
+            pipe.hgetall(self._usage_key())
+            pipe.mget([self._disabled_key(key_id) for key_id in self.key_ids])
+            usage, disabled = await pipe.execute()
+
+            calls = {key_id: int(usage.get(f"{key_id}:calls", 0)) for key_id in self.key_ids}
+            errors = {key_id: int(usage.get(f"{key_id}:errors", 0)) for key_id in self.key_ids}
+            disabled_ids = {key_id for key_id, flag in zip(self.key_ids, disabled) if flag}
+            self._state = (time.monotonic(), calls, errors, disabled_ids)
+            return calls, errors, disabled_ids
+        except Exception as e:
+            logger.warning(f"서비스 키 상태 조회 실패, 로컬 상태 사용: {str(e)}")
+            self._state = None
+            self._reset_local_if_new_day()
+            now = time.time()
+            disabled_ids = {key_id for key_id, until in self._local_disabled_until.items() if until > now}
+            return dict(self._local_calls), dict(self._local_errors), disabled_ids
+
+    def _weight(self, calls: int, errors: int) -> float:
+        """남은 할당량 x 건강도 (표본이 적을 때 에러율 과대평가 방지)"""
+        remaining = max(self.daily_limit - calls, 0)
+        error_rate = errors / max(calls, 10)
+        health = max(1.0 - error_rate, 0.05)
+        return remaining * health
+
+    async def acquire(self, exclude: Optional[Set[int]] = None) -> Tuple[int, str]:
+        """
+        다음에 사용할 서비스 키 선택 후 호출 수 기록
+        :param exclude: 제외할 키 인덱스 (재시도/헤징 시 다른 키 사용)
+        :return: (키 인덱스, 서비스 키)
+        """
+        exclude = exclude or set()
+        calls, errors, disabled_ids = await self._load_state()
+
+        candidates = []
+        weights = []
+        for index, key_id in enumerate(self.key_ids):
+            if index in exclude or key_id in disabled_ids:
+                continue
+            weight = self._weight(calls.get(key_id, 0), errors.get(key_id, 0))
+            if weight > 0:
+                candidates.append(index)
+                weights.append(weight)
+
+        if candidates:
+            index = random.choices(candidates, weights=weights, k=1)[0]
+        else:
+            # 사용 가능한 키가 없으면 호출 수가 가장 적은 키로 시도
+            fallback = [i for i in range(len(self.key_ids)) if i not in exclude] or list(range(len(self.key_ids)))
+            index = min(fallback, key=lambda i: calls.get(self.key_ids[i], 0))
+            logger.warning(f"사용 가능한 서비스 키 없음, 인덱스 {index} 키로 시도")
+
+        self._increment(self.key_ids[index], "calls")
+        logger.debug(f"서비스 키 사용: 인덱스 {index}")
+        return index, self.service_keys[index]
+
+    def _increment(self, key_id: str, field: str):
+        """로컬 상태와 상태 캐시에 바로 반영하고, Redis 기록은 백그라운드로 실행"""
+        self._reset_local_if_new_day()
+        local = self._local_calls if field == "calls" else self._local_errors
+        local[key_id] = local.get(key_id, 0) + 1
+        if self._state is not None:
+            cached = self._state[1] if field == "calls" else self._state[2]
+            cached[key_id] = cached.get(key_id, 0) + 1
+
+        task = asyncio.ensure_future(self._write_increment(key_id, field))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def _write_increment(self, key_id: str, field: str):
+        try:
+            redis = await get_redis_client()
+            usage_key = self._usage_key()
+            pipe = redis.pipeline()
+            pipe.hincrby(usage_key, f"{key_id}:{field}", 1)
+            pipe.expire(usage_key, 60 * 60 * 48)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"서비스 키 사용량 기록 실패: {str(e)}")
+
+    async def _disable(self, key_id: str, ttl_seconds: int):
+        self._local_disabled_until[key_id] = time.time() + ttl_seconds
+        if self._state is not None:
+            self._state[3].add(key_id)
+        try:
+            redis = await get_redis_client()
+            await redis.set(self._disabled_key(key_id), "1", ex=ttl_seconds)
+        except Exception as e:
+            logger.warning(f"서비스 키 비활성화 기록 실패: {str(e)}")
+
+    async def report_error(self, index: int, response_code: str):
+        """
+        API 에러 코드 기록
+        :param index: 키 인덱스
+        :param response_code: 공공데이터포털 응답 코드
+        """
+        key_id = self.key_ids[index]
+        self._increment(key_id, "errors")
+
+        if response_code in QUOTA_EXCEEDED_CODES:
+            ttl_seconds = max(calculate_ttl_to_next_period("day"), 60)
+            logger.warning(f"서비스 키 할당량 초과 (인덱스 {index}), {ttl_seconds}초 동안 제외")
+            await self._disable(key_id, ttl_seconds)
+        elif response_code in KEY_ERROR_CODES:
+            ttl_seconds = settings.SERVICE_KEY_COOLDOWN_SECONDS
+            logger.warning(f"서비스 키 에러 (인덱스 {index}, Code: {response_code}), {ttl_seconds}초 동안 제외")
+            await self._disable(key_id, ttl_seconds)
+
+    async def get_current_stats(self) -> dict:
+        """현재 상태 정보 반환"""
+        calls, errors, disabled_ids = await self._load_state()
+        keys = []
+        for index, key_id in enumerate(self.key_ids):
+            keys.append({
+                "index": index,
+                "key_preview": self.service_keys[index][-4:] + "****",  # 마지막 4자리만 표시
+                "calls": calls.get(key_id, 0),
+                "errors": errors.get(key_id, 0),
+                "remaining": max(self.daily_limit - calls.get(key_id, 0), 0),
+                "disabled": key_id in disabled_ids,
+            })
+        return {
+            "total_keys": len(self.service_keys),
+            "daily_limit": self.daily_limit,
+            "keys": keys,
+        }
+
+# 전역 서비스 키 스케줄러 인스턴스
+service_key_scheduler = ServiceKeyScheduler()
@@ -0,0 +1,102 @@
+import math
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# 일출/일몰 기준 태양 천정각 (대기굴절 34' + 태양 반지름 16', 한국천문연구원과 동일)
+SUN_EVENT_ZENITH = 90.833
+# 한국 표준시 (UTC+9)
+KST_OFFSET_MINUTES = 9 * 60
+
+def _julian_day(day: date) -> float:
+    """해당 날짜 0시(UTC)의 율리우스일"""
+    return day.toordinal() + 1721424.5
+
+def _solar_declination_and_equation_of_time(julian_day: float) -> Tuple[float, float]:
+    """
+    NOAA 태양 위치 계산식
+    :return: (태양 적위(라디안), 균시차(분))
+    """
+    t = (julian_day - 2451545.0) / 36525.0
+
+    mean_longitude = math.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360)
+    mean_anomaly = math.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    center = (
+        math.sin(mean_anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * mean_anomaly) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * t)
+    apparent_longitude = math.radians(math.degrees(mean_longitude) + center - 0.00569 - 0.00478 * math.sin(omega))
+
+    mean_obliquity = 23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_longitude))
+
+    y = math.tan(obliquity / 2) ** 2
+    equation_of_time = 4 * math.degrees(
+        y * math.sin(2 * mean_longitude)
+        - 2 * eccentricity * math.sin(mean_anomaly)
+        + 4 * eccentricity * y * math.sin(mean_anomaly) * math.cos(2 * mean_longitude)
+        - 0.5 * y * y * math.sin(4 * mean_longitude)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+    )
+    return declination, equation_of_time
+
+def _sun_event_minutes(lat: float, lon: float, day: date, rising: bool) -> Optional[float]:
+    """
+    일출/일몰 시각 계산
+    :return: 해당 날짜 0시(KST)부터의 분 (해가 뜨거나 지지 않으면 None)
+    """
+    base_julian_day = _julian_day(day) - KST_OFFSET_MINUTES / 1440
+    # 정오 기준으로 한 번 계산한 뒤 구한 시각으로 다시 계산해서 오차를 줄임
+    minutes = 12 * 60.0
+    for _ in range(2):
+        declination, equation_of_time = _solar_declination_and_equation_of_time(base_julian_day + minutes / 1440)
+        cos_hour_angle = (
+            math.cos(math.radians(SUN_EVENT_ZENITH)) / (math.cos(math.radians(lat)) * math.cos(declination))
+            - math.tan(math.radians(lat)) * math.tan(declination)
+        )
+        if not -1.0 <= cos_hour_angle <= 1.0:
+            return None
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+        if rising:
+            hour_angle = -hour_angle
+        minutes = 720 - 4 * (lon - hour_angle) - equation_of_time + KST_OFFSET_MINUTES
+    return minutes
+
+def _format_minutes(minutes: Optional[float]) -> Optional[str]:
+    if minutes is None:
+        return None
+    total = int(round(minutes)) % (24 * 60)
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+@lru_cache(maxsize=4096)
+def calculate_sunrise_sunset(lat: float, lon: float, day: date) -> Dict[str, Optional[str]]:
+    """
+    위도/경도/날짜로 일출/일몰 시각 계산 (KST, 분 단위 반올림)
+    한국천문연구원 출몰시각 API와 같은 형식으로 반환
+    :param lat: 위도
+    :param lon: 경도 (동경 +)
+    :param day: 날짜
+    :return: {"sunrise": "HH:MM", "sunset": "HH:MM"}
+    """
+    return {
+        "sunrise": _format_minutes(_sun_event_minutes(lat, lon, day, rising=True)),
+        "sunset": _format_minutes(_sun_event_minutes(lat, lon, day, rising=False)),
+    }
+
+def build_yearly_sun_table(lat: float, lon: float, year: int) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    1년치 일출/일몰 표 생성 (지역별 사전 계산/검증용)
+    :return: {"YYYYMMDD": {"sunrise": "HH:MM", "sunset": "HH:MM"}}
+    """
+    table = {}
+    day = date(year, 1, 1)
+    while day.year == year:
+        table[day.strftime("%Y%m%d")] = calculate_sunrise_sunset.__wrapped__(lat, lon, day)
+        day += timedelta(days=1)
+    return table
@@ -0,0 +1,14 @@
+"""
+산책 지수 엔드포인트 벤치마크
+
+준비 (로컬, 업스트림 할당량 사용 안 함):
+    1. redis-server
+    2. python -m scripts.fake_upstream
+    3. set -a && source scripts/fake_upstream/upstream.env && set +a && WORKERS=1 python run.py
+
+실행:
+    python -m scripts.benchmark --concurrency 20 --requests 500 \\
+        --redis-url redis://localhost:6379/0 --fake-upstream-url http://127.0.0.1:3600
+
+결과는 results/{시각}-{커밋}.json 에 저장되고, 직전 결과(또는 --baseline)와 비교해 출력함
+"""
@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from scripts.benchmark.runner import (
+    RESULTS_DIR,
+    SCENARIOS,
+    latest_result,
+    print_report,
+    run_benchmark,
+    save_result,
+)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="산책 지수 엔드포인트 벤치마크")
+    parser.add_argument("--app-url", default="http://127.0.0.1:8000", help="벤치마크 대상 앱 주소")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="실행할 시나리오 (쉼표로 구분)")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--warmup", type=int, default=0, help="시나리오별 워밍업 요청 수 (집계 제외)")
+    parser.add_argument("--locations", type=int, default=50, help="요청에 사용할 좌표 수 (캐시 키 공간 크기)")
+    parser.add_argument("--seed", type=int, default=42, help="좌표/파라미터 선택 시드")
+    parser.add_argument("--redis-url", default=None, help="캐시 적중률 측정용 Redis 주소")
+    parser.add_argument("--fake-upstream-url", default=None, help="업스트림 호출 수 측정용 가짜 업스트림 주소")
+    parser.add_argument("--cold", action="store_true", help="시나리오마다 Redis DB를 비우고 시작 (로컬 전용)")
+    parser.add_argument("--output-dir", type=Path, default=RESULTS_DIR, help="결과 저장 디렉토리")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 결과 파일 (기본값: 직전 결과)")
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오: {', '.join(unknown)} (가능: {', '.join(SCENARIOS)})")
+
+    report = asyncio.run(run_benchmark(
+        app_url=args.app_url,
+        scenarios=scenarios,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        warmup=args.warmup,
+        locations=args.locations,
+        seed=args.seed,
+        redis_url=args.redis_url,
+        fake_upstream_url=args.fake_upstream_url,
+        cold=args.cold,
+    ))
+
+    saved = None if args.no_save else save_result(report, args.output_dir)
+    baseline_path = args.baseline or latest_result(args.output_dir, exclude=saved)
+    baseline = None
+    if baseline_path is not None and baseline_path.exists():
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+    if saved is not None:
+        print(f"\n결과 저장: {saved}")
+
+if __name__ == "__main__":
+    main()
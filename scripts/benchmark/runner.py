@@ -0,0 +1,300 @@
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import httpx
+
+ZONE_FILE = Path(__file__).resolve().parents[2] / "app" / "assets" / "zone" / "admin_district_code.json"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# 벤치마크 대상 엔드포인트 (이름 -> 경로, 고정 쿼리 파라미터)
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "current": {"path": "/api/v1/walkability/current", "params": {}},
+    "hourly": {"path": "/api/v1/walkability/hourly", "params": {"hours": 12}},
+    "weekly": {"path": "/api/v1/walkability/weekly", "params": {"days": 7}},
+    "detail": {"path": "/api/v1/walkability/current/detail", "params": {}},
+}
+DOG_PROFILES = [
+    {"dog_size": "small", "coat_type": "double", "coat_length": "long", "sensitivities": "", "air_quality_type": "who"},
+    {"dog_size": "medium", "coat_type": "single", "coat_length": "short", "sensitivities": "", "air_quality_type": "korean"},
+    {"dog_size": "large", "coat_type": "double", "coat_length": "short", "sensitivities": "", "air_quality_type": "who"},
+]
+
+def load_locations(count: int, seed: int) -> List[Dict[str, float]]:
+    """
+    요청에 사용할 좌표 목록 (행정구역 중심 좌표에서 추출)
+    좌표 수가 캐시 키 공간 크기를 결정하므로 캐시 적중률 실험에 사용
+    """
+    with open(ZONE_FILE, "r", encoding="utf-8") as f:
+        zones = json.load(f)
+    rng = random.Random(seed)
+    picked = rng.sample(zones, min(count, len(zones)))
+    return [{"lat": round(zone["latitude"], 4), "lon": round(zone["longitude"], 4)} for zone in picked]
+
+def percentile(ordered: List[float], p: float) -> Optional[float]:
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, math.ceil(len(ordered) * p / 100) - 1))
+    return round(ordered[index] * 1000, 2)
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int = 0
+    duration: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    status_codes: Dict[str, int] = field(default_factory=dict)
+    cache: Dict[str, Any] = field(default_factory=dict)
+    upstream: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "duration_seconds": round(self.duration, 3),
+            "throughput_rps": round(self.requests / self.duration, 2) if self.duration else None,
+            "latency_ms": {
+                "avg": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else None,
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "max": round(ordered[-1] * 1000, 2) if ordered else None,
+            },
+            "status_codes": dict(self.status_codes),
+            "cache": self.cache,
+            "upstream": self.upstream,
+        }
+
+class CacheProbe:
+    """Redis INFO stats의 keyspace_hits/misses 변화량으로 캐시 적중률 계산"""
+    def __init__(self, redis_url: Optional[str]):
+        self.redis_url = redis_url
+        self._client = None
+
+    async def _stats(self) -> Optional[Dict[str, int]]:
+        if not self.redis_url:
+            return None
+        try:
+            if self._client is None:
+                import redis.asyncio as redis
+                self._client = redis.from_url(self.redis_url, decode_responses=True)
+            info = await self._client.info("stats")
+            return {"hits": int(info.get("keyspace_hits", 0)), "misses": int(info.get("keyspace_misses", 0))}
+        except Exception as e:
+            print(f"  Redis 통계 조회 실패: {str(e)}")
+            return None
+
+    async def flush(self):
+        if self.redis_url and await self._stats() is not None:
+            await self._client.flushdb()
+
+    async def snapshot(self) -> Optional[Dict[str, int]]:
+        return await self._stats()
+
+    @staticmethod
+    def diff(before: Optional[Dict[str, int]], after: Optional[Dict[str, int]], requests: int) -> Dict[str, Any]:
+        if before is None or after is None:
+            return {}
+        hits = after["hits"] - before["hits"]
+        misses = after["misses"] - before["misses"]
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "lookups_per_request": round(lookups / requests, 2) if requests else None,
+        }
+
+class UpstreamProbe:
+    """
+    업스트림 호출 수 집계
+    가짜 업스트림 서버(/_stats)가 있으면 그 값을, 없으면 앱의 /api/v1/metrics/upstream 값을 사용
+    (앱 지표는 워커별 메모리 값이므로 단일 워커일 때만 정확함)
+    둘 다 조회할 수 없으면 None (결과에는 업스트림 호출 수 없이 기록)
+    """
+    def __init__(self, client: httpx.AsyncClient, app_url: str, fake_upstream_url: Optional[str]):
+        self.client = client
+        self.app_url = app_url.rstrip("/")
+        self.fake_upstream_url = fake_upstream_url.rstrip("/") if fake_upstream_url else None
+
+    async def snapshot(self) -> Optional[Dict[str, int]]:
+        try:
+            if self.fake_upstream_url:
+                response = await self.client.get(f"{self.fake_upstream_url}/_stats")
+                return dict(response.json().get("calls", {}))
+
+            response = await self.client.get(f"{self.app_url}/api/v1/metrics/upstream")
+            # success_response 형식: {"status", "message", "data": {"endpoints": ...}}
+            endpoints = (response.json().get("data") or {}).get("endpoints")
+            if endpoints is None:
+                raise RuntimeError(f"업스트림 지표 응답에 data.endpoints가 없습니다: {response.text[:200]}")
+            return {endpoint.rsplit("/", 1)[-1]: metrics.get("requests", 0) for endpoint, metrics in endpoints.items()}
+        except (httpx.HTTPError, ValueError, RuntimeError) as e:
+            # 지표 API가 꺼져 있는 경우(UPSTREAM_METRICS_API_ENABLED=false) 등
+            print(f"  업스트림 호출 수 조회 실패 (집계 생략): {str(e)}")
+            return None
+
+    @staticmethod
+    def diff(before: Optional[Dict[str, int]], after: Optional[Dict[str, int]], requests: int) -> Dict[str, Any]:
+        if before is None or after is None:
+            return {}
+        calls = {op: count - before.get(op, 0) for op, count in after.items() if count - before.get(op, 0) > 0}
+        total = sum(calls.values())
+        return {
+            "calls": total,
+            "calls_per_request": round(total / requests, 3) if requests else None,
+            "by_operation": calls,
+        }
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    app_url: str,
+    name: str,
+    locations: List[Dict[str, float]],
+    concurrency: int,
+    total_requests: int,
+    seed: int,
+) -> ScenarioResult:
+    """시나리오 1개를 지정한 동시성으로 실행"""
+    scenario = SCENARIOS[name]
+    url = f"{app_url.rstrip('/')}{scenario['path']}"
+    rng = random.Random(seed)
+
+    def next_params() -> Dict[str, Any]:
+        params = dict(rng.choice(locations))
+        if name != "detail":
+            params.update(rng.choice(DOG_PROFILES))
+        params.update(scenario["params"])
+        return params
+
+    result = ScenarioResult(name=name)
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total_requests):
+        queue.put_nowait(next_params())
+
+    async def worker():
+        while True:
+            try:
+                params = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.get(url, params=params)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            result.latencies.append(time.perf_counter() - started)
+            result.status_codes[status] = result.status_codes.get(status, 0) + 1
+            result.requests += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.duration = time.perf_counter() - started
+    return result
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def save_result(report: Dict[str, Any], output_dir: Path = RESULTS_DIR) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{report['revision']}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+def latest_result(output_dir: Path = RESULTS_DIR, exclude: Optional[Path] = None) -> Optional[Path]:
+    candidates = sorted(p for p in output_dir.glob("*.json") if p != exclude)
+    return candidates[-1] if candidates else None
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """결과 표 출력 (기준 결과가 있으면 변화율 함께 표시)"""
+    def delta(current, previous) -> str:
+        if current is None or not previous:
+            return ""
+        return f" ({(current - previous) / previous * 100:+.1f}%)"
+
+    print(f"\n revision {report['revision']} / concurrency {report['config']['concurrency']} / locations {report['config']['locations']}")
+    if baseline:
+        print(f" baseline {baseline['revision']} ({baseline['created_at']})")
+    header = f"{'scenario':<10}{'rps':>16}{'p50 ms':>18}{'p95 ms':>18}{'p99 ms':>18}{'cache hit':>11}{'upstream/req':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, current in report["scenarios"].items():
+        previous = (baseline or {}).get("scenarios", {}).get(name, {})
+        latency = current["latency_ms"]
+        prev_latency = previous.get("latency_ms", {})
+        hit_rate = current["cache"].get("hit_rate")
+        per_request = current["upstream"].get("calls_per_request")
+        print(
+            f"{name:<10}"
+            f"{str(current['throughput_rps']) + delta(current['throughput_rps'], previous.get('throughput_rps')):>16}"
+            f"{str(latency['p50']) + delta(latency['p50'], prev_latency.get('p50')):>18}"
+            f"{str(latency['p95']) + delta(latency['p95'], prev_latency.get('p95')):>18}"
+            f"{str(latency['p99']) + delta(latency['p99'], prev_latency.get('p99')):>18}"
+            f"{'-' if hit_rate is None else f'{hit_rate:.1%}':>11}"
+            f"{'-' if per_request is None else per_request:>14}"
+        )
+
+async def run_benchmark(
+    app_url: str,
+    scenarios: List[str],
+    concurrency: int,
+    requests: int,
+    warmup: int,
+    locations: int,
+    seed: int,
+    redis_url: Optional[str] = None,
+    fake_upstream_url: Optional[str] = None,
+    cold: bool = False,
+) -> Dict[str, Any]:
+    """
+    벤치마크 실행
+    :param cold: 시나리오마다 Redis DB를 비우고 시작 (로컬 Redis 전용)
+    """
+    location_list = load_locations(locations, seed)
+    cache_probe = CacheProbe(redis_url)
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2)
+
+    report: Dict[str, Any] = {
+        "revision": git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "app_url": app_url,
+            "concurrency": concurrency,
+            "requests": requests,
+            "warmup": warmup,
+            "locations": len(location_list),
+            "seed": seed,
+            "cold": cold,
+        },
+        "scenarios": {},
+    }
+
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+        upstream_probe = UpstreamProbe(client, app_url, fake_upstream_url)
+        for name in scenarios:
+            if cold:
+                await cache_probe.flush()
+            print(f"- {name}: {requests} requests, concurrency {concurrency}")
+            if warmup:
+                # 워밍업 요청은 결과와 캐시/업스트림 집계에서 제외
+                await run_scenario(client, app_url, name, location_list, concurrency, warmup, seed)
+
+            cache_before = await cache_probe.snapshot()
+            upstream_before = await upstream_probe.snapshot()
+            result = await run_scenario(client, app_url, name, location_list, concurrency, requests, seed)
+            result.cache = CacheProbe.diff(cache_before, await cache_probe.snapshot(), result.requests)
+            result.upstream = UpstreamProbe.diff(upstream_before, await upstream_probe.snapshot(), result.requests)
+
+            report["scenarios"][name] = result.to_dict()
+    return report
@@ -0,0 +1,20 @@
+"""
+공공데이터포털(data.go.kr) 가짜 업스트림 서버
+서비스 키 할당량을 쓰지 않고 부하 테스트/벤치마크/통합 테스트를 돌리기 위한 용도
+
+실행:
+    python -m scripts.fake_upstream            # 127.0.0.1:3600
+    FAKE_UPSTREAM_LATENCY_MS=300 FAKE_UPSTREAM_ERROR_RATE=0.1 python -m scripts.fake_upstream
+
+앱 연결:
+    upstream.env 의 GOV_DATA_BASE_URL / GOV_DATA_*_URL 을 환경변수로 지정
+
+녹화:
+    FAKE_UPSTREAM_RECORD_FROM=https://apis.data.go.kr FAKE_UPSTREAM_FIXTURES_DIR=scripts/fake_upstream/fixtures \\
+        python -m scripts.fake_upstream
+    이후 FAKE_UPSTREAM_FIXTURES_DIR만 지정하면 녹화된 응답을 그대로 돌려줌
+"""
+from scripts.fake_upstream.config import FakeUpstreamSettings
+from scripts.fake_upstream.server import FakeUpstream, create_app
+
+__all__ = ["FakeUpstreamSettings", "FakeUpstream", "create_app"]
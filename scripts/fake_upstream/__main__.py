@@ -0,0 +1,7 @@
+import uvicorn
+from scripts.fake_upstream.config import FakeUpstreamSettings
+from scripts.fake_upstream.server import create_app
+
+if __name__ == "__main__":
+    config = FakeUpstreamSettings()
+    uvicorn.run(create_app(config), host=config.HOST, port=config.PORT, log_level="warning")
@@ -0,0 +1,32 @@
+from typing import Literal, Optional
+from pydantic_settings import BaseSettings
+from pydantic import ConfigDict
+
+class FakeUpstreamSettings(BaseSettings):
+    """
+    가짜 업스트림 서버 설정 (환경변수 접두사: FAKE_UPSTREAM_)
+    실행 중에는 POST /_control 로 변경 가능
+    """
+    model_config = ConfigDict(env_prefix="FAKE_UPSTREAM_", case_sensitive=False)
+
+    HOST: str = "127.0.0.1"
+    PORT: int = 3600
+
+    # 응답 지연 (밀리초) = LATENCY_MS ± LATENCY_JITTER_MS
+    LATENCY_MS: float = 50.0
+    LATENCY_JITTER_MS: float = 20.0
+
+    # 에러 주입
+    # code: JSON 응답의 resultCode를 ERROR_CODE로 반환
+    # xml: OpenAPI_ServiceResponse XML 에러 (returnReasonCode = ERROR_CODE)
+    # http: HTTP 502 응답
+    # timeout: TIMEOUT_SECONDS 동안 대기 후 응답
+    ERROR_RATE: float = 0.0
+    ERROR_MODE: Literal["code", "xml", "http", "timeout"] = "code"
+    ERROR_CODE: str = "99"
+    TIMEOUT_SECONDS: float = 60.0
+
+    # 녹화 응답 디렉토리 ({operation}.json / {operation}.xml 파일이 있으면 합성 응답 대신 사용)
+    FIXTURES_DIR: Optional[str] = None
+    # 녹화 모드: 지정한 실제 업스트림(예: https://apis.data.go.kr)으로 요청을 전달하고 응답을 FIXTURES_DIR에 저장
+    RECORD_FROM: Optional[str] = None
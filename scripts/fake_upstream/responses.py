@@ -0,0 +1,402 @@
+import hashlib
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Union
+
+# 대기질 예보 지역 (에어코리아 예보 문자열 형식: "서울 : 보통,인천 : 좋음,...")
+AIR_QUALITY_REGIONS = [
+    "서울", "제주", "전남", "전북", "광주", "경남", "경북", "울산", "대구", "부산",
+    "충남", "충북", "세종", "대전", "영동", "영서", "경기남부", "경기북부", "인천",
+]
+SIDO_NAMES = [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주", "세종",
+]
+HOURLY_GRADES = ["좋음", "보통", "보통", "나쁨", "매우나쁨"]
+WEEKLY_GRADES = ["낮음", "낮음", "높음"]
+MID_WEATHER_CONDITIONS = ["맑음", "구름많음", "흐림", "구름많고 비", "흐리고 비", "흐리고 눈", "구름많고 소나기"]
+# 시간별 대기질 예보 발표 시각
+HOURLY_ISSUE_HOURS = [5, 11, 17, 23]
+
+Body = Union[Dict[str, Any], str]
+
+def seeded_random(operation: str, params: Dict[str, Any]) -> random.Random:
+    """같은 요청(serviceKey 제외)에는 항상 같은 값을 돌려주도록 요청 파라미터로 시드 고정"""
+    items = sorted((k, str(v)) for k, v in params.items() if k != "serviceKey")
+    seed = hashlib.sha1(f"{operation}?{items}".encode()).hexdigest()
+    return random.Random(int(seed[:16], 16))
+
+def _location_seed(*values: Any) -> int:
+    return int(hashlib.sha1(":".join(str(v) for v in values).encode()).hexdigest()[:8], 16)
+
+def _temperature(moment: datetime, seed: int) -> float:
+    """위치별 기준 기온 + 일교차 (오후 3시 최고, 오전 3시 최저)"""
+    base = 5 + seed % 20
+    diurnal = 6 * math.sin((moment.hour - 9) / 24 * 2 * math.pi)
+    return round(base + diurnal, 1)
+
+def gov_json(items: List[Dict[str, Any]], params: Dict[str, Any], result_code: str = "00", result_msg: str = "NORMAL_SERVICE") -> Dict[str, Any]:
+    """기상청 형식 JSON 응답 (body.items.item)"""
+    page_no = int(params.get("pageNo", 1))
+    num_of_rows = int(params.get("numOfRows", 10))
+    page = items[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+    return {
+        "response": {
+            "header": {"resultCode": result_code, "resultMsg": result_msg},
+            "body": {
+                "dataType": "JSON",
+                "items": {"item": page},
+                "pageNo": page_no,
+                "numOfRows": num_of_rows,
+                "totalCount": len(items),
+            },
+        }
+    }
+
+def airkorea_json(items: List[Dict[str, Any]], params: Dict[str, Any], result_code: str = "00", result_msg: str = "NORMAL_CODE") -> Dict[str, Any]:
+    """에어코리아 형식 JSON 응답 (body.items 가 바로 리스트)"""
+    page_no = int(params.get("pageNo", 1))
+    num_of_rows = int(params.get("numOfRows", 10))
+    page = items[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+    return {
+        "response": {
+            "header": {"resultCode": result_code, "resultMsg": result_msg},
+            "body": {
+                "items": page,
+                "pageNo": page_no,
+                "numOfRows": num_of_rows,
+                "totalCount": len(items),
+            },
+        }
+    }
+
+def error_json(result_code: str, result_msg: str = "SERVICE ERROR") -> Dict[str, Any]:
+    return {"response": {"header": {"resultCode": result_code, "resultMsg": result_msg}}}
+
+def error_xml(reason_code: str) -> str:
+    """공공데이터포털 게이트웨이 XML 에러 응답"""
+    return (
+        "<OpenAPI_ServiceResponse>"
+        "<cmmMsgHeader>"
+        "<errMsg>SERVICE ERROR</errMsg>"
+        "<returnAuthMsg>FAKE_UPSTREAM_ERROR</returnAuthMsg>"
+        f"<returnReasonCode>{reason_code}</returnReasonCode>"
+        "</cmmMsgHeader>"
+        "</OpenAPI_ServiceResponse>"
+    )
+
+def _forecast_base(params: Dict[str, Any], now: datetime) -> datetime:
+    try:
+        return datetime.strptime(f"{params['base_date']}{params['base_time']}", "%Y%m%d%H%M")
+    except (KeyError, ValueError):
+        return now.replace(minute=0, second=0, microsecond=0)
+
+def ultra_short_forecast(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """초단기예보 (getUltraSrtFcst): 발표 시각 이후 6시간"""
+    base = _forecast_base(params, now)
+    seed = _location_seed(params.get("nx"), params.get("ny"))
+    first = base.replace(minute=0) + timedelta(hours=1)
+
+    items = []
+    for category in ["LGT", "PTY", "RN1", "SKY", "T1H", "REH", "UUU", "VVV", "VEC", "WSD"]:
+        for i in range(6):
+            moment = first + timedelta(hours=i)
+            value = {
+                "LGT": "0",
+                "PTY": str(rng.choice([0, 0, 0, 0, 1])),
+                "RN1": "강수없음",
+                "SKY": str(rng.choice([1, 3, 4])),
+                "T1H": str(_temperature(moment, seed)),
+                "REH": str(rng.randint(30, 90)),
+                "UUU": str(round(rng.uniform(-3, 3), 1)),
+                "VVV": str(round(rng.uniform(-3, 3), 1)),
+                "VEC": str(rng.randint(0, 359)),
+                "WSD": str(round(rng.uniform(0, 6), 1)),
+            }[category]
+            items.append({
+                "baseDate": base.strftime("%Y%m%d"),
+                "baseTime": base.strftime("%H%M"),
+                "category": category,
+                "fcstDate": moment.strftime("%Y%m%d"),
+                "fcstTime": moment.strftime("%H00"),
+                "fcstValue": value,
+                "nx": params.get("nx"),
+                "ny": params.get("ny"),
+            })
+    return gov_json(items, params)
+
+def short_forecast(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """단기예보 (getVilageFcst): 발표 시각 이후 약 3일, TMN(06시)/TMX(15시) 포함"""
+    base = _forecast_base(params, now)
+    seed = _location_seed(params.get("nx"), params.get("ny"))
+    first = base.replace(minute=0) + timedelta(hours=1)
+    last = datetime.combine((base + timedelta(days=3)).date(), datetime.max.time())
+
+    items = []
+    moment = first
+    while moment <= last:
+        pty = rng.choice([0, 0, 0, 0, 1, 3])
+        values = {
+            "TMP": str(round(_temperature(moment, seed))),
+            "UUU": str(round(rng.uniform(-3, 3), 1)),
+            "VVV": str(round(rng.uniform(-3, 3), 1)),
+            "VEC": str(rng.randint(0, 359)),
+            "WSD": str(round(rng.uniform(0, 6), 1)),
+            "SKY": str(rng.choice([1, 3, 4])),
+            "PTY": str(pty),
+            "POP": str(rng.choice([0, 10, 20, 30, 60, 80]) if pty == 0 else rng.choice([60, 70, 80, 90])),
+            "WAV": "0",
+            "PCP": "강수없음" if pty == 0 else f"{rng.choice([1, 2, 5])}.0mm",
+            "REH": str(rng.randint(30, 90)),
+            "SNO": "적설없음",
+        }
+        if moment.hour == 6:
+            values["TMN"] = str(float(round(_temperature(moment.replace(hour=3), seed))))
+        if moment.hour == 15:
+            values["TMX"] = str(float(round(_temperature(moment, seed))))
+
+        for category, value in values.items():
+            items.append({
+                "baseDate": base.strftime("%Y%m%d"),
+                "baseTime": base.strftime("%H%M"),
+                "category": category,
+                "fcstDate": moment.strftime("%Y%m%d"),
+                "fcstTime": moment.strftime("%H00"),
+                "fcstValue": value,
+                "nx": params.get("nx"),
+                "ny": params.get("ny"),
+            })
+        moment += timedelta(hours=1)
+    return gov_json(items, params)
+
+def mid_temperature(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """중기기온예보 (getMidTa): 3~10일 후 최저/최고 기온"""
+    seed = _location_seed(params.get("regId"))
+    item: Dict[str, Any] = {"regId": params.get("regId")}
+    for day in range(3, 11):
+        low = 5 + seed % 15 + rng.randint(-3, 3)
+        item[f"taMin{day}"] = low
+        item[f"taMin{day}Low"] = 0
+        item[f"taMin{day}High"] = 0
+        item[f"taMax{day}"] = low + rng.randint(5, 12)
+        item[f"taMax{day}Low"] = 0
+        item[f"taMax{day}High"] = 0
+    # 서비스 코드가 기온 응답에서 강수확률을 읽으므로 같이 내려줌
+    item.update(_mid_precipitation(rng))
+    return gov_json([item], params)
+
+def _mid_precipitation(rng: random.Random) -> Dict[str, int]:
+    values = {}
+    for day in range(3, 8):
+        values[f"rnSt{day}Am"] = rng.choice([0, 10, 20, 30, 60])
+        values[f"rnSt{day}Pm"] = rng.choice([0, 10, 20, 30, 60])
+    for day in range(8, 11):
+        values[f"rnSt{day}"] = rng.choice([0, 10, 20, 30, 60])
+    return values
+
+def mid_land_forecast(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """중기육상예보 (getMidLandFcst): 3~10일 후 하늘상태/강수확률"""
+    item: Dict[str, Any] = {"regId": params.get("regId")}
+    item.update(_mid_precipitation(rng))
+    for day in range(3, 8):
+        item[f"wf{day}Am"] = rng.choice(MID_WEATHER_CONDITIONS)
+        item[f"wf{day}Pm"] = rng.choice(MID_WEATHER_CONDITIONS)
+    for day in range(8, 11):
+        item[f"wf{day}"] = rng.choice(MID_WEATHER_CONDITIONS)
+    return gov_json([item], params)
+
+def asos_hourly(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """종관기상관측 시간자료 (getWthrDataList)"""
+    seed = _location_seed(params.get("stnIds"))
+    try:
+        start = datetime.strptime(f"{params['startDt']}{params.get('startHh', '00')}", "%Y%m%d%H")
+        end = datetime.strptime(f"{params['endDt']}{params.get('endHh', '23')}", "%Y%m%d%H")
+    except (KeyError, ValueError):
+        end = now.replace(minute=0, second=0, microsecond=0) - timedelta(days=1)
+        start = end - timedelta(hours=23)
+
+    items = []
+    moment = start
+    while moment <= end:
+        items.append({
+            "tm": moment.strftime("%Y-%m-%d %H:%M"),
+            "stnId": str(params.get("stnIds", "")),
+            "ta": str(round(_temperature(moment, seed) + rng.uniform(-1, 1), 1)),
+            "hm": str(rng.randint(30, 90)),
+            "ws": str(round(rng.uniform(0, 6), 1)),
+        })
+        moment += timedelta(hours=1)
+    return gov_json(items, params)
+
+def uv_index(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """자외선지수 (getUVIdxV4): 발표 시각 기준 h0~h75"""
+    issued = str(params.get("time") or now.strftime("%Y%m%d%H"))
+    try:
+        issued_at = datetime.strptime(issued, "%Y%m%d%H")
+    except ValueError:
+        issued_at = now
+    item: Dict[str, Any] = {"code": "A07_1", "areaNo": params.get("areaNo"), "date": issued}
+    for offset in range(0, 76, 3):
+        hour = (issued_at + timedelta(hours=offset)).hour
+        peak = max(0.0, math.sin((hour - 6) / 12 * math.pi))
+        item[f"h{offset}"] = str(round(peak * rng.uniform(6, 10)))
+    return gov_json([item], params)
+
+def sunrise_sunset(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """출몰시각 (getLCRiseSetInfo): XML 응답"""
+    locdate = str(params.get("locdate") or now.strftime("%Y%m%d"))
+    try:
+        day_of_year = datetime.strptime(locdate, "%Y%m%d").timetuple().tm_yday
+    except ValueError:
+        day_of_year = now.timetuple().tm_yday
+    # 하지 무렵 05:10 / 19:55, 동지 무렵 07:45 / 17:15 사이를 오가는 근사값
+    season = math.cos((day_of_year - 172) / 365 * 2 * math.pi)
+    sunrise = 6 * 60 + 27 - season * 77
+    sunset = 18 * 60 + 35 + season * 80
+
+    def hhmm(minutes: float) -> str:
+        minutes = int(minutes)
+        return f"{minutes // 60:02d}{minutes % 60:02d}"
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response>"
+        "<header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        "<body><items><item>"
+        f"<locdate>{locdate}</locdate>"
+        f"<longitude>{params.get('longitude', '')}</longitude>"
+        f"<latitude>{params.get('latitude', '')}</latitude>"
+        f"<sunrise>{hhmm(sunrise)}</sunrise>"
+        f"<sunset>{hhmm(sunset)}</sunset>"
+        "</item></items><numOfRows>10</numOfRows><pageNo>1</pageNo><totalCount>1</totalCount></body>"
+        "</response>"
+    )
+
+def nearby_stations(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """근접측정소 목록 (getNearbyMsrstnList): 가까운 순서로 3개"""
+    seed = _location_seed(params.get("tmX"), params.get("tmY"))
+    items = [
+        {
+            "stationName": f"측정소{(seed + i) % 600:03d}",
+            "addr": "가짜 업스트림",
+            "tm": round(1.5 * (i + 1) + rng.random(), 1),
+        }
+        for i in range(3)
+    ]
+    return airkorea_json(items, params)
+
+def station_list(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """측정소 목록 (getMsrstnList): 전국 600개, 좌표는 측정소 번호로 고정 (dmX 위도, dmY 경도)"""
+    items = []
+    for i in range(600):
+        location = random.Random(i)
+        items.append({
+            "stationName": f"측정소{i:03d}",
+            "addr": "가짜 업스트림",
+            "dmX": f"{location.uniform(33.2, 38.4):.6f}",
+            "dmY": f"{location.uniform(126.1, 129.4):.6f}",
+            "item": "SO2, CO, O3, NO2, PM10, PM2.5",
+            "mangName": "도시대기",
+            "year": "2000",
+        })
+    return airkorea_json(items, params)
+
+def _airkorea_data_time(moment: datetime) -> str:
+    # 에어코리아는 자정을 "YYYY-MM-DD 24:00" 으로 표기
+    if moment.hour == 0:
+        return f"{(moment - timedelta(days=1)).strftime('%Y-%m-%d')} 24:00"
+    return moment.strftime("%Y-%m-%d %H:00")
+
+def station_realtime(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """측정소별 실시간 측정정보 (getMsrstnAcctoRltmMesureDnsty): 최근 24시간, 최신 순"""
+    latest = now.replace(minute=0, second=0, microsecond=0)
+    items = []
+    for i in range(24):
+        moment = latest - timedelta(hours=i)
+        items.append({
+            "stationName": params.get("stationName"),
+            "dataTime": _airkorea_data_time(moment),
+            "pm10Value": str(rng.randint(10, 120)),
+            "pm25Value": str(rng.randint(5, 70)),
+            "pm10Grade": str(rng.randint(1, 4)),
+            "pm25Grade": str(rng.randint(1, 4)),
+        })
+    return airkorea_json(items, params)
+
+def sido_realtime(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """시도별 실시간 측정정보 (getCtprvnRltmMesureDnsty): 측정소 번호 % 17 로 시도 배정, 약 5%는 장애("-")"""
+    sido_name = params.get("sidoName")
+    if sido_name not in SIDO_NAMES:
+        return airkorea_json([], params)
+    data_time = _airkorea_data_time(now.replace(minute=0, second=0, microsecond=0))
+    items = []
+    for i in range(SIDO_NAMES.index(sido_name), 600, len(SIDO_NAMES)):
+        failed = rng.random() < 0.05
+        items.append({
+            "stationName": f"측정소{i:03d}",
+            "sidoName": sido_name,
+            "dataTime": data_time,
+            "pm10Value": "-" if failed else str(rng.randint(10, 120)),
+            "pm25Value": "-" if failed else str(rng.randint(5, 70)),
+            "pm10Grade": str(rng.randint(1, 4)),
+            "pm25Grade": str(rng.randint(1, 4)),
+        })
+    return airkorea_json(items, params)
+
+def _region_grades(rng: random.Random, grades: List[str]) -> str:
+    return ",".join(f"{region} : {rng.choice(grades)}" for region in AIR_QUALITY_REGIONS)
+
+def air_quality_forecast(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """대기질 예보통보 (getMinuDustFrcstDspth): 발표 시각별 오늘/내일 PM10, PM25"""
+    search_date = str(params.get("searchDate") or now.strftime("%Y-%m-%d"))
+    try:
+        day = datetime.strptime(search_date, "%Y-%m-%d")
+    except ValueError:
+        day = now
+
+    items = []
+    for hour in reversed(HOURLY_ISSUE_HOURS):
+        if day.date() == now.date() and hour > now.hour:
+            continue
+        for inform_code in ["PM10", "PM25"]:
+            for offset in [0, 1, 2]:
+                items.append({
+                    "dataTime": f"{day.strftime('%Y-%m-%d')} {hour}시 발표",
+                    "informCode": inform_code,
+                    "informData": (day + timedelta(days=offset)).strftime("%Y-%m-%d"),
+                    "informGrade": _region_grades(rng, HOURLY_GRADES),
+                    "informOverall": "○ [미세먼지] 가짜 업스트림 예보",
+                })
+    return airkorea_json(items, params)
+
+def air_quality_weekly(params: Dict[str, Any], rng: random.Random, now: datetime) -> Body:
+    """초미세먼지 주간예보 (getMinuDustWeekFrcstDspth): 조회일 3~6일 후"""
+    search_date = str(params.get("searchDate") or now.strftime("%Y-%m-%d"))
+    try:
+        day = datetime.strptime(search_date, "%Y-%m-%d")
+    except ValueError:
+        day = now
+
+    item: Dict[str, Any] = {"presnatnDt": day.strftime("%Y-%m-%d")}
+    for offset, name in zip(range(3, 7), ["One", "Two", "Three", "Four"]):
+        item[f"frcst{name}Dt"] = (day + timedelta(days=offset)).strftime("%Y-%m-%d")
+        item[f"frcst{name}Cn"] = _region_grades(rng, WEEKLY_GRADES)
+    return airkorea_json([item], params)
+
+# URL 마지막 경로(오퍼레이션 이름) -> 합성 응답 생성 함수
+OPERATIONS: Dict[str, Callable[[Dict[str, Any], random.Random, datetime], Body]] = {
+    "getUltraSrtFcst": ultra_short_forecast,
+    "getVilageFcst": short_forecast,
+    "getMidTa": mid_temperature,
+    "getMidLandFcst": mid_land_forecast,
+    "getWthrDataList": asos_hourly,
+    "getUVIdxV4": uv_index,
+    "getLCRiseSetInfo": sunrise_sunset,
+    "getNearbyMsrstnList": nearby_stations,
+    "getMsrstnList": station_list,
+    "getMsrstnAcctoRltmMesureDnsty": station_realtime,
+    "getCtprvnRltmMesureDnsty": sido_realtime,
+    "getMinuDustFrcstDspth": air_quality_forecast,
+    "getMinuDustWeekFrcstDspth": air_quality_weekly,
+}
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from scripts.fake_upstream.config import FakeUpstreamSettings
+from scripts.fake_upstream.responses import OPERATIONS, error_json, error_xml, seeded_random
+from app.config.logging_config import get_logger
+logger = get_logger()
+
+XML_MEDIA_TYPE = "application/xml;charset=UTF-8"
+
+class FakeUpstream:
+    """
+    공공데이터포털(data.go.kr) 대체 서버 상태
+    오퍼레이션별 호출 수를 세고, 설정에 따라 지연/에러를 주입함
+    """
+    def __init__(self, config: FakeUpstreamSettings):
+        self.config = config
+        self.calls: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def reset_stats(self):
+        self.calls.clear()
+        self.errors.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "total_calls": sum(self.calls.values()),
+            "calls": dict(self.calls),
+            "errors": dict(self.errors),
+            "config": self.config.model_dump(),
+        }
+
+    def _fixture_path(self, operation: str, suffix: str) -> Optional[Path]:
+        if not self.config.FIXTURES_DIR:
+            return None
+        return Path(self.config.FIXTURES_DIR) / f"{operation}{suffix}"
+
+    def load_fixture(self, operation: str) -> Optional[Response]:
+        """녹화된 응답 파일이 있으면 그대로 반환"""
+        for suffix, media_type in [(".json", "application/json"), (".xml", XML_MEDIA_TYPE)]:
+            path = self._fixture_path(operation, suffix)
+            if path is not None and path.exists():
+                return Response(content=path.read_bytes(), media_type=media_type)
+        return None
+
+    async def record(self, operation: str, path: str, params: Dict[str, Any]) -> Response:
+        """실제 업스트림으로 요청을 전달하고 정상 응답을 FIXTURES_DIR에 저장"""
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            upstream = await client.get(f"{self.config.RECORD_FROM.rstrip('/')}/{path}", params=params)
+
+        content = upstream.content
+        is_xml = content.lstrip().startswith(b"<")
+        fixture = self._fixture_path(operation, ".xml" if is_xml else ".json")
+        if fixture is not None and upstream.status_code == 200:
+            fixture.parent.mkdir(parents=True, exist_ok=True)
+            fixture.write_bytes(content)
+            logger.info(f"업스트림 응답 녹화: {fixture}")
+        return Response(
+            content=content,
+            status_code=upstream.status_code,
+            media_type=XML_MEDIA_TYPE if is_xml else "application/json",
+        )
+
+    async def inject_latency(self):
+        latency_ms = self.config.LATENCY_MS + random.uniform(-self.config.LATENCY_JITTER_MS, self.config.LATENCY_JITTER_MS)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+    async def inject_error(self, operation: str) -> Optional[Response]:
+        """ERROR_RATE 확률로 설정된 형태의 에러 응답 반환"""
+        if self.config.ERROR_RATE <= 0 or random.random() >= self.config.ERROR_RATE:
+            return None
+
+        self.errors[operation] = self.errors.get(operation, 0) + 1
+        mode = self.config.ERROR_MODE
+        if mode == "http":
+            return Response(content=b"Bad Gateway", status_code=502)
+        if mode == "timeout":
+            await asyncio.sleep(self.config.TIMEOUT_SECONDS)
+            return Response(content=b"Gateway Timeout", status_code=504)
+        if mode == "xml":
+            return Response(content=error_xml(self.config.ERROR_CODE), media_type=XML_MEDIA_TYPE)
+        return JSONResponse(error_json(self.config.ERROR_CODE))
+
+    async def handle(self, path: str, params: Dict[str, Any]) -> Response:
+        operation = path.rstrip("/").rsplit("/", 1)[-1]
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+        if self.config.RECORD_FROM:
+            return await self.record(operation, path, params)
+
+        await self.inject_latency()
+        error = await self.inject_error(operation)
+        if error is not None:
+            return error
+
+        fixture = self.load_fixture(operation)
+        if fixture is not None:
+            return fixture
+
+        builder = OPERATIONS.get(operation)
+        if builder is None:
+            # 공공데이터포털은 없는 오퍼레이션에 대해 XML 에러(04 HTTP_ERROR)를 반환함
+            logger.warning(f"지원하지 않는 오퍼레이션: {path}")
+            return Response(content=error_xml("04"), media_type=XML_MEDIA_TYPE)
+
+        body = builder(params, seeded_random(operation, params), datetime.now())
+        if isinstance(body, str):
+            return Response(content=body, media_type=XML_MEDIA_TYPE)
+        return Response(content=json.dumps(body, ensure_ascii=False), media_type="application/json")
+
+def create_app(config: Optional[FakeUpstreamSettings] = None) -> FastAPI:
+    """
+    가짜 업스트림 ASGI 앱 생성
+    경로 마지막 부분(getVilageFcst 등)으로 오퍼레이션을 판별하므로
+    앱의 GOV_DATA_*_URL 경로를 실제 값 그대로 두고 GOV_DATA_BASE_URL만 바꿔서 사용
+    """
+    upstream = FakeUpstream(config or FakeUpstreamSettings())
+    app = FastAPI(title="Fake data.go.kr upstream", docs_url=None, redoc_url=None)
+    app.state.upstream = upstream
+
+    @app.get("/_stats")
+    async def get_stats():
+        """오퍼레이션별 호출 수 (벤치마크에서 요청당 업스트림 호출 수 계산용)"""
+        return upstream.stats()
+
+    @app.delete("/_stats")
+    async def reset_stats():
+        upstream.reset_stats()
+        return upstream.stats()
+
+    @app.post("/_control")
+    async def update_config(changes: Dict[str, Any]):
+        """
+        실행 중 설정 변경
+        예: {"ERROR_RATE": 0.2, "ERROR_MODE": "xml", "ERROR_CODE": "22"}
+        """
+        values = upstream.config.model_dump()
+        values.update({key.upper(): value for key, value in changes.items()})
+        upstream.config = FakeUpstreamSettings(**values)
+        return upstream.stats()
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    async def serve(path: str, request: Request):
+        return await upstream.handle(path, dict(request.query_params))
+
+    return app
+
+app = create_app()